@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import Field, model_validator
 from typing import Optional
 import json
@@ -67,6 +67,80 @@ class Settings(BaseSettings):
     # GitHub Token (권장: .env 또는 환경변수로 설정)
     github_token: Optional[str] = Field(default=None, alias="GITHUB_TOKEN")
 
+    # Lambda 호출용 공유 HTTP 클라이언트 (keep-alive 커넥션 풀)
+    http_timeout: float = Field(default=900.0, alias="HTTP_TIMEOUT")  # 기본 요청 타임아웃(초)
+    http_connect_timeout: float = Field(default=10.0, alias="HTTP_CONNECT_TIMEOUT")
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=60.0, alias="HTTP_KEEPALIVE_EXPIRY")
+
+    # Lambda/Bedrock 호출 대상별 적응형 속도 제한 (토큰 버킷 + AIMD 동시성)
+    rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
+    rate_limit_rps: float = Field(default=10.0, alias="RATE_LIMIT_RPS")  # 대상별 최대 초당 요청 수
+    rate_limit_initial_concurrency: int = Field(default=8, alias="RATE_LIMIT_INITIAL_CONCURRENCY")
+    rate_limit_min_concurrency: int = Field(default=1, alias="RATE_LIMIT_MIN_CONCURRENCY")
+    rate_limit_max_concurrency: int = Field(default=64, alias="RATE_LIMIT_MAX_CONCURRENCY")
+
+    # Lambda/Bedrock 호출 재시도 및 차단기
+    retry_max_attempts: int = Field(default=3, alias="RETRY_MAX_ATTEMPTS")  # 첫 호출 포함 최대 시도 횟수
+    retry_backoff_base: float = Field(default=0.5, alias="RETRY_BACKOFF_BASE")  # 지수 백오프 기본 대기(초)
+    retry_backoff_max: float = Field(default=20.0, alias="RETRY_BACKOFF_MAX")
+    circuit_failure_threshold: int = Field(default=5, alias="CIRCUIT_FAILURE_THRESHOLD")  # 연속 실패 시 차단
+    circuit_reset_timeout: float = Field(default=30.0, alias="CIRCUIT_RESET_TIMEOUT")  # 차단 유지 시간(초)
+    interviewer_hedge_delay: float = Field(default=20.0, alias="INTERVIEWER_HEDGE_DELAY")  # 면접관AI 응답이 이보다 늦으면 중복 요청 (0이면 사용 안 함)
+
+    # AI 평가 동시성 설정 (동시에 면접을 진행할 최대 지원자 수)
+    eval_max_concurrency: int = Field(default=3, alias="EVAL_MAX_CONCURRENCY")
+    # 지원자 1명의 면접에서 동시에 진행할 질문 수 (1이면 순차 진행)
+    interview_question_concurrency: int = Field(default=1, alias="INTERVIEW_QUESTION_CONCURRENCY")
+    # 평가 시간 예산(초, 0이면 무제한) - 지원자 1명 / 공고 전체. 예산이 부족하면 남은 후속 질문을 생략하고 부분 결과로 표시
+    eval_applicant_budget_seconds: float = Field(default=1800.0, alias="EVAL_APPLICANT_BUDGET_SECONDS")
+    eval_posting_budget_seconds: float = Field(default=0.0, alias="EVAL_POSTING_BUDGET_SECONDS")
+    eval_facilitator_reserve_seconds: float = Field(default=180.0, alias="EVAL_FACILITATOR_RESERVE_SECONDS")  # Facilitator 호출용으로 남겨둘 시간
+    eval_min_turn_seconds: float = Field(default=60.0, alias="EVAL_MIN_TURN_SECONDS")  # 지원자AI↔면접관AI 왕복 1회에 필요한 최소 시간
+    # AI 평가 백그라운드 작업 설정
+    eval_max_parallel_jobs: int = Field(default=8, alias="EVAL_MAX_PARALLEL_JOBS")  # 동시에 실행할 평가 작업(공고) 수
+    # 공고 간 공정 분배 (local 모드: 프로세스 전체 동시 평가 지원자 수를 회사별 가중 공정 큐로 배분)
+    eval_global_concurrency: int = Field(default=6, alias="EVAL_GLOBAL_CONCURRENCY")
+    eval_company_weights: Dict[str, float] = Field(default_factory=dict, alias="EVAL_COMPANY_WEIGHTS")  # {"<company_id>": 2.0} (기본 1.0)
+    eval_small_posting_threshold: int = Field(default=20, alias="EVAL_SMALL_POSTING_THRESHOLD")  # 이 지원자 수 이하 공고는 우선순위 가중
+    eval_small_posting_boost: float = Field(default=2.0, alias="EVAL_SMALL_POSTING_BOOST")
+    # 평가 파이프라인 (local 모드): 면접 단계와 Facilitator 평가 단계를 분리해 다음 지원자 면접과 겹쳐 실행
+    eval_pipeline_enabled: bool = Field(default=False, alias="EVAL_PIPELINE_ENABLED")
+    eval_pipeline_facilitator_workers: int = Field(default=2, alias="EVAL_PIPELINE_FACILITATOR_WORKERS")  # 동시 Facilitator 평가 수 (공고별)
+    eval_pipeline_queue_size: int = Field(default=2, alias="EVAL_PIPELINE_QUEUE_SIZE")  # Facilitator 대기 한도, 넘으면 새 면접 시작 지연
+    eval_pipeline_global_facilitator_workers: int = Field(default=2, alias="EVAL_PIPELINE_GLOBAL_FACILITATOR_WORKERS")  # 프로세스 전체 동시 Facilitator 평가 수
+    # 기업 리포트 조회 응답 캐시 (프로세스 내 LRU + TTL, 쓰기 commit 시 무효화)
+    response_cache_enabled: bool = Field(default=True, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_ttl_seconds: float = Field(default=60.0, alias="RESPONSE_CACHE_TTL_SECONDS")
+    response_cache_max_entries: int = Field(default=1024, alias="RESPONSE_CACHE_MAX_ENTRIES")
+    # 공유 백엔드 ('' 없음, 'memory' 인메모리 대체 구현, 'package.module:factory' CacheBackend 생성 함수)
+    response_cache_backend: str = Field(default="", alias="RESPONSE_CACHE_BACKEND")
+    eval_worker_poll_interval: float = Field(default=5.0, alias="EVAL_WORKER_POLL_INTERVAL")  # 대기 작업 조회 주기(초)
+    # 실행 중 평가 작업의 점유 기간 - 하트비트가 끊긴 작업만 다른 프로세스가 회수 (여러 API 프로세스/노드 대비)
+    eval_job_lease_seconds: int = Field(default=300, alias="EVAL_JOB_LEASE_SECONDS")
+    eval_job_heartbeat_interval: float = Field(default=60.0, alias="EVAL_JOB_HEARTBEAT_INTERVAL")
+    eval_events_heartbeat_interval: float = Field(default=15.0, alias="EVAL_EVENTS_HEARTBEAT_INTERVAL")  # SSE keep-alive 주기(초)
+    # 평가 진행 이벤트를 Postgres LISTEN/NOTIFY로 프로세스 간 공유 (API 프로세스가 여러 개일 때, distributed 모드는 항상 공유)
+    eval_events_shared: bool = Field(default=False, alias="EVAL_EVENTS_SHARED")
+    eval_control_poll_interval: float = Field(default=2.0, alias="EVAL_CONTROL_POLL_INTERVAL")  # 실행 중 평가의 취소/일시정지 요청 확인 주기(초)
+    # 지원자 평가 실행 방식 (local: 작업을 받은 프로세스에서 실행, distributed: evaluation_work_items 대기열에 넣고
+    # 여러 프로세스/노드의 워커가 SELECT ... FOR UPDATE SKIP LOCKED로 나눠 실행)
+    eval_queue_mode: str = Field(default="local", alias="EVAL_QUEUE_MODE")
+    eval_queue_local_consumer: bool = Field(default=True, alias="EVAL_QUEUE_LOCAL_CONSUMER")  # API 서버도 대기열 워커로 참여
+    eval_queue_worker_concurrency: int = Field(default=3, alias="EVAL_QUEUE_WORKER_CONCURRENCY")  # 워커 1개가 동시에 평가할 지원자 수
+    eval_queue_poll_interval: float = Field(default=2.0, alias="EVAL_QUEUE_POLL_INTERVAL")  # 대기열 조회 주기(초)
+    eval_queue_lease_seconds: int = Field(default=300, alias="EVAL_QUEUE_LEASE_SECONDS")  # 하트비트 없이 점유를 유지하는 시간
+    eval_queue_heartbeat_interval: float = Field(default=60.0, alias="EVAL_QUEUE_HEARTBEAT_INTERVAL")
+    eval_queue_max_attempts: int = Field(default=3, alias="EVAL_QUEUE_MAX_ATTEMPTS")  # 지원자별 최대 시도 횟수
+    # 같은 (지원자, 공고)에 내용이 같은 KB를 다시 업로드하지 않음
+    kb_upload_dedup_enabled: bool = Field(default=True, alias="KB_UPLOAD_DEDUP_ENABLED")
+    # 지원자AI 답변 캐시 (같은 KB 내용 + 같은 질문이면 Lambda 호출 생략)
+    answer_cache_enabled: bool = Field(default=True, alias="ANSWER_CACHE_ENABLED")
+    answer_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, alias="ANSWER_CACHE_TTL_SECONDS")
+    answer_cache_max_entries: int = Field(default=50000, alias="ANSWER_CACHE_MAX_ENTRIES")
+    answer_cache_prune_every: int = Field(default=200, alias="ANSWER_CACHE_PRUNE_EVERY")  # 저장 N회마다 만료/초과분 정리
+
 
     @model_validator(mode="after")
     def _normalize_cors_origins(self):
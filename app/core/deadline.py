@@ -0,0 +1,54 @@
+from typing import Optional
+import time
+
+
+class Deadline:
+    """평가 시간 예산 (monotonic 기준 마감 시각)
+
+    seconds가 None 또는 0 이하이면 무제한. child()로 만든 하위 예산은 상위 마감을 넘지 않는다.
+    """
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional["Deadline"] = None):
+        expires_at = time.monotonic() + seconds if seconds and seconds > 0 else None
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at: Optional[float] = expires_at
+
+    @classmethod
+    def unlimited(cls) -> "Deadline":
+        return cls(None)
+
+    def child(self, seconds: Optional[float] = None) -> "Deadline":
+        return Deadline(seconds, parent=self)
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """마감보다 seconds 먼저 끝나는 예산 (뒤 단계에 쓸 시간을 남겨둘 때)"""
+        reserved = Deadline(None)
+        if self.expires_at is not None:
+            reserved.expires_at = self.expires_at - max(0.0, seconds)
+        return reserved
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초), 무제한이면 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def has(self, seconds: float) -> bool:
+        """seconds 이상 남았는지 (무제한이면 항상 True)"""
+        remaining = self.remaining()
+        return remaining is None or remaining >= seconds
+
+    def timeout(self, cap: float, floor: float = 1.0) -> float:
+        """호출 타임아웃 - 기본값 cap과 남은 시간 중 작은 값 (floor 미만으로는 줄이지 않음)"""
+        remaining = self.remaining()
+        if remaining is None:
+            return cap
+        return max(floor, min(cap, remaining))
@@ -0,0 +1,9 @@
+from typing import Any
+import hashlib
+import json
+
+
+def stable_hash(value: Any) -> str:
+    """dict/list/str 값을 키 순서와 무관한 sha256 hex 문자열로 변환 (입력 변경 감지용)"""
+    serialized = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
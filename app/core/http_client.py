@@ -0,0 +1,45 @@
+from typing import Optional
+import asyncio
+import httpx
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 전역 공유 클라이언트 (keep-alive 커넥션 풀을 지원자/질문/턴 사이에서 재사용)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Lambda Function URL 호출용 공유 비동기 HTTP 클라이언트 반환
+
+    커넥션 풀은 이벤트 루프에 묶이므로, 다른 루프에서 호출되면 새 클라이언트를 만든다.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+        _client_loop = loop
+        logger.info(
+            f"공유 HTTP 클라이언트 생성 (max_connections={settings.http_max_connections}, "
+            f"keepalive={settings.http_max_keepalive_connections})"
+        )
+    return _client
+
+
+async def close_http_client():
+    """서버 종료 시 공유 클라이언트의 커넥션 풀 정리"""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,113 @@
+from typing import Dict, Any, Optional, List
+from collections import deque, defaultdict
+from contextlib import contextmanager
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 구간별로 보관하는 최근 측정값 수 (백분위 계산용)
+RESERVOIR_SIZE = 2048
+
+
+class LatencyHistogram:
+    """구간 하나의 소요 시간 분포 (누적 count/sum/max + 최근 측정값으로 p50/p95/p99)"""
+
+    def __init__(self, size: int = RESERVOIR_SIZE):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: deque = deque(maxlen=size)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+        if not sorted_values:
+            return None
+        idx = max(0, math.ceil(q * len(sorted_values)) - 1)
+        return sorted_values[idx]
+
+    def snapshot(self) -> Dict[str, Any]:
+        values = sorted(self.recent)
+        return {
+            "count": self.count,
+            "sum_sec": round(self.total, 3),
+            "mean_sec": round(self.total / self.count, 3) if self.count else None,
+            "p50_sec": _round(self._percentile(values, 0.50)),
+            "p95_sec": _round(self._percentile(values, 0.95)),
+            "p99_sec": _round(self._percentile(values, 0.99)),
+            "max_sec": round(self.max, 3),
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class MetricsRegistry:
+    """프로세스 단위 구간 지연/카운터 집계 (스레드풀에서 호출될 수 있어 lock 사용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._started_at = time.time()
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            self._histograms[stage].observe(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        with self._lock:
+            self._counters[name] += value
+
+    @contextmanager
+    def span(self, stage: str, **labels):
+        """with 블록 소요 시간을 stage 히스토그램에 기록 (예외로 끝나면 '{stage}.error' 카운터도 증가)"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.observe(stage, elapsed)
+            if failed:
+                self.increment(f"{stage}.error")
+            logger.debug(f"span stage={stage} duration={elapsed:.3f}s failed={failed} {labels}")
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._started_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: hist.snapshot() for name, hist in sorted(self._histograms.items())}
+            counters = dict(sorted(self._counters.items()))
+        questions = counters.get("interview.questions", 0)
+        follow_ups = counters.get("interview.follow_ups", 0)
+        return {
+            "since": self._started_at,
+            "stages": stages,
+            "counters": counters,
+            "rates": {
+                # 원 질문 1개당 후속 질문 수
+                "follow_ups_per_question": round(follow_ups / questions, 3) if questions else None,
+                # 후속 질문이 1번 이상 나온 원 질문 비율
+                "follow_up_question_ratio": round(counters.get("interview.questions_with_follow_up", 0) / questions, 3) if questions else None,
+            },
+        }
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,233 @@
+from typing import Dict, Any, Optional, Callable, Awaitable, TypeVar
+import asyncio
+import logging
+import time
+
+import httpx
+from botocore.exceptions import ClientError, ConnectTimeoutError, ReadTimeoutError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 과부하(throttle) 신호로 보는 HTTP 상태
+OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# throttle로 보는 AWS SDK 오류 코드 (Lambda/Bedrock 등)
+SDK_THROTTLE_ERROR_CODES = frozenset({
+    "TooManyRequestsException",
+    "ThrottlingException",
+    "Throttling",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "EC2ThrottledException",
+})
+
+
+def sdk_error_status(error: BaseException) -> Optional[int]:
+    """boto3 오류를 대응하는 HTTP 상태로 변환 (throttle 코드는 429, HTTP 응답이 없는 오류는 None)"""
+    if not isinstance(error, ClientError):
+        return None
+    if error.response.get("Error", {}).get("Code") in SDK_THROTTLE_ERROR_CODES:
+        return 429
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+
+
+class AdaptiveRateLimiter:
+    """호출 대상(Lambda URL 등) 하나에 대한 클라이언트 측 속도/동시성 제한
+
+    - 토큰 버킷: 초당 요청 수(rate) 제한, 버스트는 rate만큼 허용
+    - AIMD 동시성: 정상 응답이면 동시 호출 한도를 천천히 늘리고(+1/limit),
+      429/5xx/타임아웃 또는 지연 급증이면 절반으로 줄인다 (연쇄 감소 방지를 위해 감소 사이 최소 간격 유지)
+    - 429를 받으면 rate도 절반으로 줄였다가 정상 응답마다 조금씩 회복
+    """
+
+    # 지연 급증 판단: 최근 평균(EWMA) 대비 이 배수 이상이면 혼잡으로 간주
+    LATENCY_SPIKE_FACTOR = 3.0
+    LATENCY_EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        name: str,
+        rate: Optional[float] = None,
+        initial_concurrency: Optional[int] = None,
+        min_concurrency: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.name = name
+        self.max_rate = float(rate or settings.rate_limit_rps)
+        self.rate = self.max_rate
+        self.min_limit = max(1, int(min_concurrency or settings.rate_limit_min_concurrency))
+        self.max_limit = max(self.min_limit, int(max_concurrency or settings.rate_limit_max_concurrency))
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial_concurrency or settings.rate_limit_initial_concurrency)))
+        self.in_flight = 0
+        self.waiting = 0
+        self.tokens = self.max_rate
+        self.ewma_latency: Optional[float] = None
+        self.stats = {"requests": 0, "succeeded": 0, "throttled": 0, "errors": 0, "decreases": 0}
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _condition(self) -> asyncio.Condition:
+        # Condition은 이벤트 루프에 묶이므로 다른 루프에서 쓰이면 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+        return self._cond
+
+    async def call(self, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """한도 안에서 request()를 실행하고 응답 상태/지연으로 한도를 조정"""
+        if not settings.rate_limit_enabled:
+            return await request()
+
+        await self._acquire()
+        started = time.monotonic()
+        status_code = None
+        overloaded = False
+        try:
+            response = await request()
+            status_code = response.status_code
+            overloaded = status_code in OVERLOAD_STATUS_CODES
+            return response
+        except httpx.TimeoutException:
+            overloaded = True
+            raise
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            overloaded = status_code in OVERLOAD_STATUS_CODES
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            self._on_result(time.monotonic() - started, status_code, overloaded)
+            await self._release()
+
+    async def call_sdk(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """HTTP가 아닌 호출(boto3 SDK 등)용 call: 오류 코드(throttle/5xx)와 타임아웃으로 한도를 조정"""
+        if not settings.rate_limit_enabled:
+            return await fn()
+
+        await self._acquire()
+        started = time.monotonic()
+        status_code = None
+        overloaded = False
+        try:
+            result = await fn()
+            status_code = 200
+            return result
+        except (ReadTimeoutError, ConnectTimeoutError):
+            overloaded = True
+            raise
+        except Exception as e:
+            status_code = sdk_error_status(e)
+            overloaded = status_code in OVERLOAD_STATUS_CODES
+            if not overloaded:
+                # 권한/검증 오류 등은 성공으로 세지 않고 한도 조정에도 반영하지 않음
+                status_code = None
+                self.stats["errors"] += 1
+            raise
+        finally:
+            self._on_result(time.monotonic() - started, status_code, overloaded)
+            await self._release()
+
+    async def _acquire(self):
+        cond = self._condition()
+        self.waiting += 1
+        try:
+            async with cond:
+                await cond.wait_for(lambda: self.in_flight < max(self.min_limit, int(self.limit)))
+                self.in_flight += 1
+        finally:
+            self.waiting -= 1
+        try:
+            await self._take_token()
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _take_token(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def _release(self):
+        self.in_flight = max(0, self.in_flight - 1)
+        cond = self._condition()
+        async with cond:
+            cond.notify_all()
+
+    def _on_result(self, latency: float, status_code: Optional[int], overloaded: bool):
+        self.stats["requests"] += 1
+        if overloaded:
+            self.stats["throttled"] += 1
+            self._decrease(throttled=status_code == 429, reason=f"status={status_code or 'timeout'}")
+            return
+        if status_code is None:
+            # 네트워크 외 오류 등은 한도 조정에 반영하지 않음
+            return
+
+        self.stats["succeeded"] += 1
+        spike = self.ewma_latency is not None and latency > self.ewma_latency * self.LATENCY_SPIKE_FACTOR
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.LATENCY_EWMA_ALPHA * (latency - self.ewma_latency)
+        if spike:
+            self._decrease(throttled=False, reason=f"latency={latency:.2f}s")
+            return
+        # additive increase
+        self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 100.0)
+
+    def _decrease(self, throttled: bool, reason: str):
+        now = time.monotonic()
+        cooldown = max(self.ewma_latency or 0.0, 1.0)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self.stats["decreases"] += 1
+        self.limit = max(float(self.min_limit), self.limit * 0.5)
+        if throttled:
+            self.rate = max(self.max_rate / 20.0, self.rate * 0.5)
+        logger.warning(f"호출 한도 축소 ({self.name}) - {reason}, concurrency={self.limit:.1f}, rate={self.rate:.2f}/s")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "rate_per_sec": round(self.rate, 2),
+            "max_rate_per_sec": self.max_rate,
+            "ewma_latency_sec": round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            **self.stats,
+        }
+
+
+# 호출 대상별 공유 limiter (프로세스 전역)
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> AdaptiveRateLimiter:
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(name)
+        _limiters[name] = limiter
+    return limiter
+
+
+def rate_limiter_status() -> Dict[str, Any]:
+    return {
+        "enabled": settings.rate_limit_enabled,
+        "limiters": [limiter.status() for limiter in _limiters.values()],
+    }
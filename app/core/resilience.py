@@ -0,0 +1,256 @@
+from typing import Dict, Any, Optional, Callable, Awaitable, TypeVar
+import asyncio
+import logging
+import random
+import time
+
+import httpx
+from botocore.exceptions import ConnectionClosedError, ConnectionError as BotoConnectionError, ReadTimeoutError
+
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.rate_limiter import get_rate_limiter, sdk_error_status
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도할 HTTP 상태 (일시적 오류/throttle)
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# 재시도할 전송 오류 (연결 실패, 타임아웃 등)
+RETRYABLE_EXCEPTIONS = (httpx.TransportError,)
+# 재시도할 SDK 전송 오류 (EndpointConnectionError/ConnectTimeoutError는 BotoConnectionError 하위)
+RETRYABLE_SDK_EXCEPTIONS = (BotoConnectionError, ConnectionClosedError, ReadTimeoutError, ConnectionError)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """SDK 호출 오류가 일시적(throttle/5xx/연결·타임아웃)인지. 권한/검증/직렬화 오류는 재시도해도 같은 결과"""
+    if isinstance(error, RETRYABLE_SDK_EXCEPTIONS):
+        return True
+    status = sdk_error_status(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """호출 대상별 차단기
+
+    연속 실패가 임계치를 넘으면 open -> reset_timeout 동안 즉시 실패,
+    이후 half_open에서 시험 호출 1건이 성공하면 closed로 복귀, 실패하면 다시 open.
+    """
+
+    def __init__(self, name: str, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold or settings.circuit_failure_threshold)
+        self.reset_timeout = reset_timeout or settings.circuit_reset_timeout
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.stats = {"failures": 0, "successes": 0, "rejected": 0, "opened": 0}
+
+    def before_call(self) -> bool:
+        """호출 허용 여부 확인 (차단 중이면 CircuitOpenError). half_open 시험 호출이면 True"""
+        if self.state == 'open':
+            if time.monotonic() - (self.opened_at or 0) < self.reset_timeout:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError(f"{self.name} 호출 차단 중 (연속 실패 {self.consecutive_failures}회)")
+            self.state = 'half_open'
+            self._probe_in_flight = False
+        if self.state == 'half_open':
+            if self._probe_in_flight:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError(f"{self.name} 복구 확인 중")
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release_probe(self):
+        """시험 호출이 결과 없이 끝남(취소 등) - 다음 호출이 다시 시험하도록 표시만 해제"""
+        self._probe_in_flight = False
+
+    def record_success(self):
+        self.stats["successes"] += 1
+        if self.state != 'closed':
+            logger.info(f"차단기 복구 ({self.name})")
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == 'half_open' or (self.state == 'closed' and self.consecutive_failures >= self.failure_threshold):
+            self.state = 'open'
+            self.opened_at = time.monotonic()
+            self.stats["opened"] += 1
+            logger.warning(f"차단기 열림 ({self.name}) - 연속 실패 {self.consecutive_failures}회, {self.reset_timeout}s 동안 호출 차단")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            **self.stats,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name)
+        _breakers[name] = breaker
+    return breaker
+
+
+def circuit_breaker_status() -> Dict[str, Any]:
+    return {"breakers": [breaker.status() for breaker in _breakers.values()]}
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """지수 백오프 + full jitter (Retry-After가 있으면 그 이상 대기)"""
+    cap = min(settings.retry_backoff_max, settings.retry_backoff_base * (2 ** attempt))
+    delay = random.uniform(0, cap)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, settings.retry_backoff_max))
+    return delay
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def _hedged(attempt: Callable[[], Awaitable[httpx.Response]], hedge_delay: float) -> httpx.Response:
+    """첫 요청이 hedge_delay 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 성공한 응답 사용"""
+    first = asyncio.ensure_future(attempt())
+    pending = {first}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+        if done:
+            return first.result()
+        logger.info(f"hedge 요청 전송 ({hedge_delay}s 내 응답 없음)")
+        pending.add(asyncio.ensure_future(attempt()))
+        last_response: Optional[httpx.Response] = None
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    continue
+                response = task.result()
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                last_response = response
+        if last_response is not None:
+            return last_response
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def resilient_request(
+    name: str,
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    max_retries: Optional[int] = None,
+    hedge_delay: Optional[float] = None,
+    deadline: Optional[Deadline] = None,
+) -> httpx.Response:
+    """HTTP 호출을 속도 제한 + 재시도(지수 백오프/jitter) + 차단기 + (선택) hedge로 감싸 실행
+
+    재시도 후에도 일시적 오류 응답이면 마지막 응답을 반환하므로 호출자가 raise_for_status로 처리한다.
+    deadline이 있으면 백오프 대기 후 남는 시간이 없을 때 재시도하지 않는다.
+    """
+    retries = settings.retry_max_attempts - 1 if max_retries is None else max_retries
+    breaker = get_circuit_breaker(name)
+    limiter = get_rate_limiter(name)
+
+    async def _attempt() -> httpx.Response:
+        return await limiter.call(send)
+
+    last_response: Optional[httpx.Response] = None
+    last_error: Optional[BaseException] = None
+    for attempt in range(max(0, retries) + 1):
+        probe = breaker.before_call()
+        try:
+            if hedge_delay:
+                response = await _hedged(_attempt, hedge_delay)
+            else:
+                response = await _attempt()
+        except RETRYABLE_EXCEPTIONS as e:
+            breaker.record_failure()
+            last_error, last_response = e, None
+        except Exception:
+            # 재시도 대상이 아닌 오류(응답 디코딩 등)도 시험 호출이었다면 실패로 보고 다시 open
+            if probe:
+                breaker.record_failure()
+            raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            last_error, last_response = None, response
+        finally:
+            # 취소(CancelledError)로 끝난 시험 호출이 half_open을 계속 점유하지 않도록
+            if probe:
+                breaker.release_probe()
+
+        if attempt >= retries:
+            break
+        delay = backoff_delay(attempt, _retry_after(last_response))
+        if deadline is not None and not deadline.has(delay + 1.0):
+            logger.warning(f"호출 재시도 생략 ({name}) - 시간 예산 부족")
+            break
+        reason = f"status={last_response.status_code}" if last_response is not None else repr(last_error)
+        logger.warning(f"호출 재시도 ({name}) {attempt + 1}/{retries} - {reason}, {delay:.2f}s 후")
+        await asyncio.sleep(delay)
+
+    if last_response is not None:
+        return last_response
+    raise last_error
+
+
+async def resilient_call(name: str, fn: Callable[[], Awaitable[T]], *, max_retries: Optional[int] = None) -> T:
+    """HTTP가 아닌 호출(boto3 SDK 등)을 속도 제한 + 재시도 + 차단기로 감싸 실행
+
+    일시적 오류(is_transient_error)만 재시도하고 차단기 실패로 센다. 그 외 오류는 즉시 다시 던진다.
+    """
+    retries = settings.retry_max_attempts - 1 if max_retries is None else max_retries
+    breaker = get_circuit_breaker(name)
+    limiter = get_rate_limiter(name)
+    for attempt in range(max(0, retries) + 1):
+        probe = breaker.before_call()
+        try:
+            result = await limiter.call_sdk(fn)
+        except Exception as e:
+            if not is_transient_error(e):
+                # 잘못된 함수명/권한 등 한 호출자의 설정 오류로 다른 호출자까지 차단되지 않도록
+                raise
+            breaker.record_failure()
+            if attempt >= retries:
+                raise
+            error = e
+        else:
+            breaker.record_success()
+            return result
+        finally:
+            if probe:
+                breaker.release_probe()
+        delay = backoff_delay(attempt)
+        logger.warning(f"호출 재시도 ({name}) {attempt + 1}/{retries} - {error!r}, {delay:.2f}s 후")
+        await asyncio.sleep(delay)
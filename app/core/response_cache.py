@@ -0,0 +1,318 @@
+from typing import Dict, Any, Optional, Callable, Iterable, List, Tuple
+from collections import OrderedDict, defaultdict
+import importlib
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# session.info에 모아두는 commit 후 무효화할 태그
+_PENDING_TAGS_KEY = "response_cache_tags"
+# 공유 백엔드 키 접두사
+_KEY_PREFIX = "verifit:response-cache:"
+_EPOCH_KEY = _KEY_PREFIX + "epoch"
+
+
+class CacheBackend:
+    """프로세스 간 공유 캐시 백엔드 인터페이스 (Redis 등). 값은 문자열, 키는 TTL 후 만료."""
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float):
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """정수 카운터 1 증가 후 새 값 반환 (만료 없음)"""
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """공유 백엔드 대체용 인메모리 구현 (단일 프로세스 테스트/개발용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Tuple[Optional[float], str]] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl if ttl and ttl > 0 else None, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, value = self._values.get(key, (None, "0"))
+            value = str(int(value) + 1)
+            self._values[key] = (None, value)
+            return int(value)
+
+
+def load_backend(spec: Optional[str]) -> Optional[CacheBackend]:
+    """RESPONSE_CACHE_BACKEND 해석 - ''(없음), 'memory', 'package.module:factory'"""
+    if not spec:
+        return None
+    if spec == "memory":
+        return InMemoryCacheBackend()
+    module_name, _, attr = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr or "create_backend")
+    return factory()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: float, tags: Dict[str, int]):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class ResponseCache:
+    """조회 응답 read-through 캐시 (프로세스 내 LRU + TTL, 선택적으로 공유 백엔드)
+
+    - 항목마다 태그(posting:<id>, application:<id> 등)와 저장 시점의 태그 버전을 기록하고,
+      조회 시 현재 태그 버전과 다르면 무효로 본다. 쓰기 트랜잭션이 commit되면 관련 태그 버전을 올린다.
+    - 공유 백엔드가 있으면 값과 태그 버전을 백엔드에 두어 여러 프로세스가 같은 무효화를 본다.
+      없으면 무효화는 프로세스 안에서만 반영되고, 다른 프로세스의 쓰기는 TTL 후 반영된다.
+    - 로딩 중에 무효화가 일어나면 결과를 저장하지 않는다 (오래된 값이 새 버전으로 저장되는 것 방지).
+    반환값은 캐시에 보관된 객체이므로 호출한 쪽에서 수정하지 않는다.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._epoch = 0
+        self._backend = backend
+        self._backend_loaded = backend is not None
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "stores": 0})
+        self._invalidations = 0
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        if not self._backend_loaded:
+            self._backend_loaded = True
+            try:
+                self._backend = load_backend(settings.response_cache_backend)
+            except Exception as e:
+                logger.error(f"응답 캐시 공유 백엔드 로드 실패 - 프로세스 내 캐시만 사용: {e}")
+                self._backend = None
+        return self._backend
+
+    def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+        tags: Callable[[Any], Iterable[str]],
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """캐시된 값 반환, 없으면 loader() 결과를 tags(결과)로 태그해 저장"""
+        if not settings.response_cache_enabled:
+            return loader()
+
+        cache_key = f"{namespace}:{key}"
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            self._count(namespace, "hits")
+            return entry.value
+
+        self._count(namespace, "misses")
+        epoch = self._current_epoch()
+        value = loader()
+        if not cacheable(value):
+            return value
+        if self._current_epoch() != epoch:
+            # 로딩 중에 쓰기가 commit됨 -> 이번 결과는 저장하지 않음
+            return value
+        tag_list = sorted(set(tags(value)))
+        self._store(cache_key, value, dict(zip(tag_list, self._tag_versions(tag_list))))
+        self._count(namespace, "stores")
+        return value
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = set(tags)
+        if not tags:
+            return
+        backend = self.backend
+        with self._lock:
+            self._epoch += 1
+            self._invalidations += 1
+            for tag in tags:
+                self._versions[tag] += 1
+        if backend is not None:
+            try:
+                backend.incr(_EPOCH_KEY)
+                for tag in tags:
+                    backend.incr(_KEY_PREFIX + "tag:" + tag)
+            except Exception as e:
+                logger.warning(f"응답 캐시 공유 백엔드 무효화 실패: {e}")
+        metrics.increment("response_cache.invalidations")
+
+    def invalidate_on_commit(self, db: Session, *tags: str):
+        """db 트랜잭션이 commit되면 tags 무효화 (rollback되면 버림)"""
+        db.info.setdefault(_PENDING_TAGS_KEY, set()).update(tags)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # --- 내부 ---
+    def _lookup(self, cache_key: str) -> Optional[_Entry]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                if entry.expires_at <= now:
+                    del self._entries[cache_key]
+                    entry = None
+                else:
+                    self._entries.move_to_end(cache_key)
+        if entry is None:
+            entry = self._backend_lookup(cache_key)
+            if entry is None:
+                return None
+            self._put_local(cache_key, entry)
+        if self._tag_versions(list(entry.tags)) != list(entry.tags.values()):
+            with self._lock:
+                if self._entries.get(cache_key) is entry:
+                    del self._entries[cache_key]
+            return None
+        return entry
+
+    def _backend_lookup(self, cache_key: str) -> Optional[_Entry]:
+        backend = self.backend
+        if backend is None:
+            return None
+        try:
+            raw = backend.get(_KEY_PREFIX + cache_key)
+        except Exception as e:
+            logger.warning(f"응답 캐시 공유 백엔드 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        return _Entry(payload["value"], time.monotonic() + settings.response_cache_ttl_seconds, payload["tags"])
+
+    def _store(self, cache_key: str, value: Any, tag_versions: Dict[str, int]):
+        ttl = settings.response_cache_ttl_seconds
+        self._put_local(cache_key, _Entry(value, time.monotonic() + ttl, tag_versions))
+        backend = self.backend
+        if backend is not None:
+            try:
+                backend.set(_KEY_PREFIX + cache_key, json.dumps({"value": value, "tags": tag_versions}, default=str), ttl)
+            except Exception as e:
+                logger.warning(f"응답 캐시 공유 백엔드 저장 실패: {e}")
+
+    def _put_local(self, cache_key: str, entry: _Entry):
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > max(1, settings.response_cache_max_entries):
+                self._entries.popitem(last=False)
+
+    def _tag_versions(self, tags: List[str]) -> List[int]:
+        backend = self.backend
+        if backend is not None:
+            try:
+                return [int(backend.get(_KEY_PREFIX + "tag:" + tag) or 0) for tag in tags]
+            except Exception as e:
+                logger.warning(f"응답 캐시 공유 백엔드 태그 조회 실패: {e}")
+                # 버전을 확인할 수 없으면 캐시를 쓰지 않음
+                return [-1] * len(tags)
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def _current_epoch(self) -> int:
+        backend = self.backend
+        if backend is not None:
+            try:
+                return int(backend.get(_EPOCH_KEY) or 0)
+            except Exception:
+                return -1
+        with self._lock:
+            return self._epoch
+
+    def _count(self, namespace: str, name: str):
+        with self._lock:
+            self._stats[namespace][name] += 1
+        metrics.increment(f"response_cache.{namespace}.{name}")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {}
+            for namespace, stats in sorted(self._stats.items()):
+                lookups = stats["hits"] + stats["misses"]
+                namespaces[namespace] = {
+                    **stats,
+                    "hit_ratio": round(stats["hits"] / lookups, 3) if lookups else None,
+                }
+            hits = sum(s["hits"] for s in self._stats.values())
+            lookups = hits + sum(s["misses"] for s in self._stats.values())
+            return {
+                "enabled": settings.response_cache_enabled,
+                "backend": type(self._backend).__name__ if self._backend is not None else None,
+                "entries": len(self._entries),
+                "max_entries": settings.response_cache_max_entries,
+                "ttl_seconds": settings.response_cache_ttl_seconds,
+                "invalidations": self._invalidations,
+                "hit_ratio": round(hits / lookups, 3) if lookups else None,
+                "namespaces": namespaces,
+            }
+
+
+response_cache = ResponseCache()
+
+# 모델별 무효화 태그 추출 함수 (track_model로 등록)
+_TAGGERS: Dict[type, Callable[[Any], Iterable[str]]] = {}
+
+
+def track_model(model: type, tagger: Callable[[Any], Iterable[str]]):
+    """ORM으로 추가/수정/삭제된 model 인스턴스의 태그를 commit 후 무효화하도록 등록"""
+    _TAGGERS[model] = tagger
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tags(session, flush_context):
+    if not _TAGGERS:
+        return
+    tags = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tagger = _TAGGERS.get(type(instance))
+        if tagger is not None:
+            try:
+                tags.update(tag for tag in tagger(instance) if tag)
+            except Exception as e:
+                logger.warning(f"응답 캐시 태그 추출 실패 ({type(instance).__name__}): {e}")
+    if tags:
+        session.info.setdefault(_PENDING_TAGS_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    tags = session.info.pop(_PENDING_TAGS_KEY, None)
+    if tags:
+        response_cache.invalidate(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_TAGS_KEY, None)
@@ -10,6 +10,8 @@ POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))          # 기존 3 -> 5
 MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))    # 기존 2 -> 5
 POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))   # 그대로 기본 유지
 POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))  # 5분
+# 공고 하나에서 동시에 평가할 수 있는 최대 지원자 수 - 지원자마다 세션을 쓰므로 풀의 절반은 API 요청/진행률 기록용으로 남김
+MAX_APPLICANT_CONCURRENCY = max(1, (POOL_SIZE + MAX_OVERFLOW) // 2)
 
 engine = create_engine(
     settings.database_url,
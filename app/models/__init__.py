@@ -14,3 +14,9 @@ from .job_seeker_ai_agent import JobSeekerAIAgent
 from .ai_learning_answer import AILearningAnswer
 from .job_seeker_document import JobSeekerDocument
 from .interview_highlight import InterviewHighlight
+from .evaluation_job import EvaluationJob
+from .interview_checkpoint import InterviewCheckpoint
+from .applicant_answer_cache import ApplicantAnswerCache
+from .knowledge_base_upload import KnowledgeBaseUpload
+from .evaluation_work_item import EvaluationWorkItem
+from .applicant_ranking import ApplicantRanking
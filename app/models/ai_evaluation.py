@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, DECIMAL
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, DECIMAL, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -7,6 +7,10 @@ from app.database.database import Base
 
 class AIEvaluation(Base):
     __tablename__ = "ai_evaluations"
+    __table_args__ = (
+        # 지원서별 최신 평가 조회 (채용현황 LATERAL 조인)
+        Index('ix_ai_evaluations_application_created', 'application_id', 'created_at'),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"), nullable=False)
@@ -31,6 +35,10 @@ class AIEvaluation(Base):
     # 면접 하이라이트 텍스트 및 선정 이유
     highlight = Column(Text)  # 면접 하이라이트 (요약된 발화)
     highlight_reason = Column(Text)  # 하이라이트 선정 이유 또는 근거
+    # 평가 입력 지문 (지원자 텍스트/질문/스킬 해시) - 변경 없으면 재평가 생략
+    input_fingerprint = Column(String(64))
+    # 시간 예산 부족으로 일부 질문/후속 질문을 생략한 부분 결과 여부
+    is_partial = Column(Boolean, nullable=False, default=False, server_default='false')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계 설정
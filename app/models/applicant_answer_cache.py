@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from app.database.database import Base
+
+class ApplicantAnswerCache(Base):
+    __tablename__ = "applicant_answer_cache"
+    __table_args__ = (
+        Index('ix_applicant_answer_cache_expires_at', 'expires_at'),
+        Index('ix_applicant_answer_cache_last_hit_at', 'last_hit_at'),
+    )
+
+    # (질문, knowledge_base_id, job_posting_id, user_id, KB 내용 버전) 해시
+    cache_key = Column(String(64), primary_key=True)
+    job_seeker_id = Column(UUID(as_uuid=True), index=True)
+    job_posting_id = Column(UUID(as_uuid=True))
+    kb_version = Column(String(64), nullable=False)  # 업로드한 지원자 KB 내용 해시 (내용이 바뀌면 새 키)
+    response = Column(JSONB, nullable=False)  # 지원자AI 응답 원문
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_hit_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False)
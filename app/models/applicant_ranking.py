@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, DECIMAL, Boolean, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database.database import Base
+
+class ApplicantRanking(Base):
+    """공고별 지원자 순위표 (지원자별 최신 지원서 + 최신 AI 평가 비정규화, LeaderboardService가 갱신)"""
+    __tablename__ = "applicant_rankings"
+    __table_args__ = (
+        Index('ix_applicant_rankings_posting_rank', 'job_posting_id', 'rank', 'application_id'),
+        Index('ix_applicant_rankings_posting_seeker', 'job_posting_id', 'job_seeker_id'),
+    )
+
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
+    job_seeker_id = Column(UUID(as_uuid=True), ForeignKey("job_seekers.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True))
+    candidate_name = Column(String(100))
+    stage = Column(String(20))  # applications.application_status
+    applied_at = Column(DateTime(timezone=True))
+    evaluated_at = Column(DateTime(timezone=True))
+    # 최신 AI 평가 (미평가면 NULL)
+    total_score = Column(DECIMAL(5,2))
+    hard_score = Column(DECIMAL(5,2))
+    soft_score = Column(DECIMAL(5,2))
+    ai_summary = Column(Text)
+    is_partial = Column(Boolean, nullable=False, default=False, server_default='false')
+    # total_score 내림차순 순위 (동점은 같은 순위, 미평가는 평가된 지원자 다음 순위)
+    rank = Column(Integer, nullable=False, default=0, server_default='0')
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,10 @@ from app.database.database import Base
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # 공고별 지원자별 최신 지원서 조회 (채용현황 DISTINCT ON)
+        Index('ix_applications_posting_seeker_applied', 'job_posting_id', 'job_seeker_id', 'applied_at'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
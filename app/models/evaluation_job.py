@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Boolean
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+import uuid
+from app.database.database import Base
+
+class EvaluationJob(Base):
+    __tablename__ = "evaluation_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False, index=True)
+    # 작업 상태 (queued, running, succeeded, failed, pausing, paused, cancelling, cancelled)
+    status = Column(String(20), nullable=False, default='queued', index=True)
+    force = Column(Boolean, default=False)  # 강제 재평가 여부
+    max_concurrency = Column(Integer)  # 동시 평가 지원자 수 (NULL이면 기본 설정)
+    # 진행 현황 (지원자 단위)
+    total_count = Column(Integer, default=0)  # 평가 대상 지원자 수
+    processed_count = Column(Integer, default=0)  # 처리된 지원자 수 (성공+실패)
+    succeeded_count = Column(Integer, default=0)  # 평가 성공 수
+    failed_count = Column(Integer, default=0)  # 평가 실패 수
+    message = Column(Text)  # 결과/오류 메시지
+    previous_eval_status = Column(String(20))  # 작업 등록 전 공고 eval_status (취소/실패 시 복원)
+    lease_owner = Column(String(100))  # 실행 중인 워커의 점유 식별자
+    lease_expires_at = Column(DateTime(timezone=True))  # 이 시각까지 하트비트가 없으면 다른 프로세스가 회수
+    heartbeat_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 설정
+    job_posting = relationship("JobPosting")
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+from app.database.database import Base
+
+class EvaluationWorkItem(Base):
+    __tablename__ = "evaluation_work_items"
+    __table_args__ = (
+        UniqueConstraint('job_posting_id', 'application_id', name='uq_evaluation_work_item'),
+        Index('ix_evaluation_work_items_claim', 'status', 'created_at'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False, index=True)
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"), nullable=False)
+    questions = Column(JSONB, nullable=False)  # 평가 시작 시점의 면접 질문 목록
+    # 상태 (queued, running, succeeded, failed, held)
+    status = Column(String(20), nullable=False, default='queued')
+    attempts = Column(Integer, nullable=False, default=0)  # 점유(claim) 횟수
+    lease_owner = Column(String(100))  # 점유 식별자 (워커 id host:pid:uuid + 점유별 토큰)
+    lease_expires_at = Column(DateTime(timezone=True))  # 이 시각까지 하트비트가 없으면 다른 워커가 회수
+    heartbeat_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True))
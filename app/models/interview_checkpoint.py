@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+from app.database.database import Base
+
+class InterviewCheckpoint(Base):
+    __tablename__ = "interview_checkpoints"
+    __table_args__ = (
+        UniqueConstraint('application_id', 'questions_hash', 'kind', 'question_number', name='uq_interview_checkpoint'),
+        Index('ix_interview_checkpoints_posting', 'job_posting_id', 'questions_hash', 'kind'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"), nullable=False)
+    job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
+    questions_hash = Column(String(64), nullable=False)  # 면접 질문 목록 해시 (질문이 바뀌면 재사용하지 않음)
+    # 체크포인트 종류 (upload: KB 업로드 결과, question: 질문별 대화, completed: 지원자 평가 완료)
+    kind = Column(String(20), nullable=False)
+    question_number = Column(Integer, nullable=False, default=0)  # question일 때 1부터, 그 외 0
+    payload = Column(JSONB)  # 업로드 응답 또는 질문별 message_history
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+from app.database.database import Base
+
+class KnowledgeBaseUpload(Base):
+    __tablename__ = "knowledge_base_uploads"
+    __table_args__ = (
+        UniqueConstraint('job_seeker_id', 'job_posting_id', name='uq_knowledge_base_upload'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    job_seeker_id = Column(UUID(as_uuid=True), ForeignKey("job_seekers.id"), nullable=False)
+    job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id"), nullable=False)
+    content_hash = Column(String(64), nullable=False)  # 마지막으로 업로드한 payload 해시
+    response = Column(JSONB)  # 업로드 람다 응답 (재사용 시 그대로 반환)
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
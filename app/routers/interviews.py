@@ -1,7 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
-from app.database.database import get_db
+from typing import Optional
+import asyncio
+from app.core.config import settings
+from app.database.database import get_db, MAX_APPLICANT_CONCURRENCY
 from app.services.interview_service import InterviewService
+from app.services.evaluation_job_service import EvaluationJobService
+from app.services.evaluation_worker import evaluation_worker
+from app.services.evaluation_events import evaluation_events, TERMINAL_EVENTS
+from app.services.applicant_answer_cache_service import ApplicantAnswerCacheService
+from app.services.report_etag_service import ReportETagService
+from app.core.metrics import metrics
 from app.schemas.interview import RecruitmentStatusResponse
 
 router = APIRouter()
@@ -15,37 +25,161 @@ async def create_interview_and_report(
     service = InterviewService(db)
     return service.create_interview_and_report(job_posting_id)
 
-@router.post("/interviews/{job_posting_id}/start-evaluation")
+@router.post("/interviews/{job_posting_id}/start-evaluation", status_code=status.HTTP_202_ACCEPTED)
 async def start_evaluation(
     job_posting_id: str,
+    force: bool = Query(False, description="강제 재평가 여부"),
+    max_concurrency: Optional[int] = Query(None, ge=1, le=MAX_APPLICANT_CONCURRENCY, description="동시에 평가할 최대 지원자 수 (DB 연결 풀 크기의 절반까지)"),
     db: Session = Depends(get_db)
 ):
     """
-    AI 평가 시작 - 새로운 프로세스 적용
+    AI 평가 시작 - 평가 작업을 등록하고 job_id를 즉시 반환
     
-    프로세스:
+    프로세스 (백그라운드 워커에서 실행):
     1. 채용공고 정보로 면접 질문 생성
     2. 지원자별로 면접 진행 (질문-답변)
     3. LangChain 기반 재시도로 완전한 답변 보장
     4. 최종 평가 결과 생성 및 저장
+
+    진행 현황은 GET /interviews/evaluation-jobs/{job_id} 로 조회
     """
-    service = InterviewService(db)
-    result = await service.start_evaluation(job_posting_id)
+    service = EvaluationJobService(db)
+    result = service.submit_job(job_posting_id, force=force, max_concurrency=max_concurrency)
     
     if not result.get("success"):
         status_code = result.get("status", 500)
         raise HTTPException(status_code=status_code, detail=result.get("message", "AI 평가 시작에 실패했습니다"))
     
+    evaluation_worker.notify()
+    return result
+
+@router.get("/interviews/evaluation-jobs/{job_id}")
+async def get_evaluation_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """AI 평가 작업 진행 현황 조회 (상태, 지원자별 진행 카운트, 시작/종료 시각)"""
+    service = EvaluationJobService(db)
+    result = service.get_job(job_id)
+    if not result.get("success"):
+        raise HTTPException(status_code=result.get("status", 404), detail=result.get("message", "평가 작업을 찾을 수 없습니다"))
+    return result
+
+def _job_control_response(result):
+    if not result.get("success"):
+        raise HTTPException(status_code=result.get("status", 404), detail=result.get("message", "평가 작업을 찾을 수 없습니다"))
     return result
 
+@router.post("/interviews/evaluation-jobs/{job_id}/cancel")
+async def cancel_evaluation_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """AI 평가 작업 취소 - 진행 중인 지원자 평가는 롤백, 대기 중인 지원자는 평가하지 않음"""
+    return _job_control_response(EvaluationJobService(db).cancel_job(job_id))
+
+@router.post("/interviews/evaluation-jobs/{job_id}/pause")
+async def pause_evaluation_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """AI 평가 작업 일시정지 - 진행 중인 지원자까지만 평가하고 멈춤 (resume으로 이어서 진행)"""
+    return _job_control_response(EvaluationJobService(db).pause_job(job_id))
+
+@router.post("/interviews/evaluation-jobs/{job_id}/resume")
+async def resume_evaluation_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """일시정지된 AI 평가 작업 재개 (이미 평가된 지원자는 건너뜀)"""
+    result = _job_control_response(EvaluationJobService(db).resume_job(job_id))
+    evaluation_worker.notify()
+    return result
+
+@router.get("/interviews/{job_posting_id}/evaluation-job")
+async def get_latest_evaluation_job(
+    job_posting_id: str,
+    db: Session = Depends(get_db)
+):
+    """공고의 최근 AI 평가 작업 진행 현황 조회"""
+    service = EvaluationJobService(db)
+    result = service.get_latest_job(job_posting_id)
+    if not result.get("success"):
+        raise HTTPException(status_code=result.get("status", 404), detail=result.get("message", "평가 작업을 찾을 수 없습니다"))
+    return result
+
+@router.get("/interviews/answer-cache/status")
+async def get_answer_cache_status(db: Session = Depends(get_db)):
+    """지원자AI 답변 캐시 현황 (저장 건수, 적중/미스/정리 카운터)"""
+    return {"status": 200, "success": True, "data": ApplicantAnswerCacheService(db).status()}
+
+@router.get("/interviews/{job_posting_id}/events")
+async def stream_evaluation_events(
+    job_posting_id: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """AI 평가 진행 이벤트 스트림 (Server-Sent Events)
+
+    연결 직후 현재 상태(snapshot)를 보내고, 이후 지원자별 이벤트
+    (applicant_started, question_done, applicant_evaluated, applicant_failed)를 전달한다.
+    평가가 끝나거나 중지되면(evaluation_finished/failed/cancelled/paused) 스트림을 닫는다.
+    진행 중인 작업이 없으면(완료/취소/일시정지) snapshot만 보내고 닫는다.
+    """
+    # snapshot 조회 전에 구독해 그 사이 발생한 이벤트를 놓치지 않음
+    queue = evaluation_events.subscribe(job_posting_id)
+    try:
+        result = EvaluationJobService(db).get_progress_snapshot(job_posting_id)
+    finally:
+        # 스트림이 열려 있는 동안 DB 커넥션을 붙잡지 않음
+        db.close()
+    if not result.get("success"):
+        evaluation_events.unsubscribe(job_posting_id, queue)
+        raise HTTPException(status_code=result.get("status", 404), detail=result.get("message", "채용공고를 찾을 수 없습니다"))
+
+    snapshot = result["data"]
+
+    async def _stream():
+        try:
+            yield evaluation_events.format_sse({"event": "snapshot", "job_posting_id": snapshot["job_posting_id"], "data": snapshot})
+            # 일시정지된 공고는 eval_status가 'ing'로 남으므로 작업 상태로 판단
+            if not snapshot.get("in_progress"):
+                return
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=settings.eval_events_heartbeat_interval)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                yield evaluation_events.format_sse(message)
+                if message.get("event") in TERMINAL_EVENTS:
+                    return
+        finally:
+            evaluation_events.unsubscribe(job_posting_id, queue)
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.get("/interviews/{job_posting_id}", response_model=RecruitmentStatusResponse)
 async def get_recruitment_status(
     job_posting_id: str,
+    sort: str = Query("applied_at", pattern="^(applied_at|rank|total_score|hard_score|soft_score)$", description="정렬 기준 (rank는 order=asc가 1위부터)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 방향"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 page.next_cursor"),
     db: Session = Depends(get_db)
 ):
     """기업 채용현황 페이지 - overall_report, 지원자 순위 가져오기"""
     service = InterviewService(db)
-    return service.get_recruitment_status(job_posting_id)
+    result = service.get_recruitment_status(job_posting_id, sort=sort, order=order, limit=limit, cursor=cursor)
+    if not result.get("success"):
+        raise HTTPException(status_code=result.get("status", 404), detail=result.get("message", "채용현황을 조회할 수 없습니다"))
+    return result
 
 @router.get("/interviews/detail/{application_id}")
 async def get_individual_report(
@@ -59,14 +193,23 @@ async def get_individual_report(
 @router.get("/company/interviews/report/{application_id}")
 async def get_company_individual_report_by_application(
     application_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    """기업 리포트 조회 (company prefix) - applications_id로 지원자 이름 반환 (임시)"""
+    """기업 리포트 조회 (company prefix) - applications_id로 지원자 이름 반환 (임시)
+
+    ETag/If-None-Match 지원: 변경이 없으면 리포트를 만들지 않고 304 반환
+    """
+    etag = ReportETagService(db).individual_report(application_id)
+    if etag and ReportETagService.matches(request.headers.get("if-none-match"), etag):
+        return _not_modified(etag)
     service = InterviewService(db)
     result = service.get_individual_report_by_application(application_id)
     if not result.get("success"):
         status_code = result.get("status", 404)
         raise HTTPException(status_code=status_code, detail=result.get("message", "리포트를 찾을 수 없습니다"))
+    _set_etag(response, etag)
     return result
 
 @router.get("/interviews/conversations/{application_id}")
@@ -90,12 +233,31 @@ async def get_applicant_profile_for_company(
 @router.get("/company/interviews/profiles/{application_id}")
 async def get_company_applicant_profile(
     application_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    """기업용 지원자 프로필 조회 (company prefix) - applications_id로 지원자 정보 반환"""
+    """기업용 지원자 프로필 조회 (company prefix) - applications_id로 지원자 정보 반환
+
+    ETag/If-None-Match 지원: 변경이 없으면 프로필을 만들지 않고 304 반환
+    """
+    etag = ReportETagService(db).applicant_profile(application_id)
+    if etag and ReportETagService.matches(request.headers.get("if-none-match"), etag):
+        return _not_modified(etag)
     service = InterviewService(db)
     result = service.get_applicant_profile_by_application(application_id)
     if not result.get("success"):
         status_code = result.get("status", 404)
         raise HTTPException(status_code=status_code, detail=result.get("message", "지원자 프로필을 찾을 수 없습니다"))
+    _set_etag(response, etag)
     return result
+
+def _set_etag(response: Response, etag: Optional[str]):
+    if etag:
+        response.headers["ETag"] = etag
+        # 브라우저/프록시가 매번 ETag로 재검증하도록
+        response.headers["Cache-Control"] = "private, no-cache"
+
+def _not_modified(etag: str) -> Response:
+    metrics.increment("http.not_modified")
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
@@ -40,6 +40,7 @@ class AIEvaluationBase(BaseModel):
     followup_opinion: Optional[str] = None
     followup_evidence: Optional[str] = None
     final_opinion: Optional[str] = None
+    is_partial: bool = False
 
 class AIEvaluationCreate(AIEvaluationBase):
     application_id: str
@@ -12,6 +12,8 @@ class ApplicationInfo(BaseModel):
     hard_score: Optional[float] = None
     soft_score: Optional[float] = None
     ai_summary: Optional[str] = None
+    is_partial: bool = False
+    rank: Optional[int] = None
     evaluated_at: Optional[str] = None
 
 class JobPostingInfo(BaseModel):
@@ -36,6 +38,13 @@ class CountsInfo(BaseModel):
     offered: int
     rejected: int
 
+class PageInfo(BaseModel):
+    sort: str = "applied_at"
+    order: str = "desc"
+    limit: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
 class RecruitmentStatusResponse(BaseModel):
     status: int
     success: bool
@@ -46,3 +55,4 @@ class RecruitmentStatusData(BaseModel):
     applications: List[ApplicationInfo]
     ai_overall_report: AIOverallReportInfo
     counts: CountsInfo
+    page: PageInfo
@@ -1,11 +1,18 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from sqlalchemy.orm import Session
 from app.models.job_seeker import JobSeeker
-import aiohttp
+from app.core.http_client import get_http_client
+from app.core.resilience import resilient_request
+from app.core.metrics import metrics
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.hashing import stable_hash
+from app.services.applicant_answer_cache_service import ApplicantAnswerCacheService
+from app.services.knowledge_base_upload_service import KnowledgeBaseUploadService
+import asyncio
 import json
 import logging
 import os
-import requests
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,10 +27,26 @@ class AIConversationService:
 
     # --- 헬퍼 함수 ---
     @staticmethod
-    def invoke_lambda_url(url: str, payload: Dict[str, Any], timeout: int = 600) -> Dict[str, Any]:
-        """지정된 URL의 Lambda 함수를 호출하고 응답을 반환"""
-        headers = {"Content-Type": "application/json"}
-        resp = requests.post(url, data=json.dumps(payload), headers=headers, timeout=timeout)
+    async def invoke_lambda_url(
+        url: str,
+        payload: Dict[str, Any],
+        timeout: int = 600,
+        hedge_delay: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """지정된 URL의 Lambda 함수를 호출하고 응답을 반환
+
+        공유 커넥션 풀 사용, URL별 속도 제한, 일시적 오류 재시도(백오프), 차단기 적용.
+        hedge_delay가 있으면 그 시간 안에 응답이 없을 때 같은 요청을 하나 더 보낸다.
+        deadline이 있으면 시도마다 타임아웃을 남은 시간으로 줄인다.
+        """
+        client = get_http_client()
+        resp = await resilient_request(
+            url,
+            lambda: client.post(url, json=payload, timeout=deadline.timeout(timeout) if deadline else timeout),
+            hedge_delay=hedge_delay,
+            deadline=deadline,
+        )
         resp.raise_for_status()
         return resp.json()
 
@@ -33,8 +56,35 @@ class AIConversationService:
         job_seeker: JobSeeker,
         job_posting_skills: Dict[str, Any] = None,
         job_posting_id: Optional[str] = None,
+        question_concurrency: Optional[int] = None,
+        checkpoint: Optional[Any] = None,
+        on_question_done: Optional[Callable[[int], None]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """면접(interview_stage) 후 Facilitator 평가(facilitator_stage)까지 순서대로 진행"""
+        state = await self.interview_stage(
+            questions, job_seeker, job_posting_skills,
+            job_posting_id=job_posting_id,
+            question_concurrency=question_concurrency,
+            checkpoint=checkpoint,
+            on_question_done=on_question_done,
+            deadline=deadline,
+        )
+        return await self.facilitator_stage(state)
+
+    async def interview_stage(
+        self,
+        questions: List[str],
+        job_seeker: JobSeeker,
+        job_posting_skills: Dict[str, Any] = None,
+        job_posting_id: Optional[str] = None,
+        question_concurrency: Optional[int] = None,
+        checkpoint: Optional[Any] = None,
+        on_question_done: Optional[Callable[[int], None]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """지원자AI와 면접관AI를 직접 왕복 호출하여 면접을 진행한다.
+        결과는 facilitator_stage에 넘길 상태(dict)로 반환한다 (파이프라인 모드에서는 두 단계가 따로 실행됨).
 
         구현 단계 (리턴 구조는 추후 정의):
         0) message_history 초기화
@@ -44,7 +94,16 @@ class AIConversationService:
         4) 지원자AI 응답 파싱 (answer)
         5) 면접관AI 호출 (initial question + 전체 message_history)
         6) 만족 여부 따라 후속 처리 (불만족 2회 이상이면 다음 질문으로)
+
+        question_concurrency: 동시에 진행할 질문 수 (미지정 시 INTERVIEW_QUESTION_CONCURRENCY, 기본 1 = 순차)
+        checkpoint: InterviewCheckpointService - 업로드 결과/완료된 질문 대화를 저장하고 재시작 시 복원
+        on_question_done: 질문 하나가 끝날 때마다 질문 번호(1부터)로 호출 (진행 이벤트 발행용)
+        deadline: 지원자 1명의 시간 예산 - 모든 호출 타임아웃에 반영되고, Facilitator 몫을 남겨두지 못하면
+            남은 후속 질문/질문을 생략한다. 생략이 있었으면 결과의 partial이 True
         """
+        deadline = deadline or Deadline.unlimited()
+        # 질문 단계는 Facilitator 호출 시간을 남겨두고 끝나야 함
+        question_deadline = deadline.reserve(settings.eval_facilitator_reserve_seconds)
 
         upload_url = os.getenv("UPLOAD_URL")
         applicant_ai_url = os.getenv("APPLICANT_AI_URL")
@@ -97,30 +156,49 @@ class AIConversationService:
             }
         }
 
-        upload_outputs: Dict[str, Any] = {}
-        timeout = aiohttp.ClientTimeout(total=900) # 총 대기 시간을 900초(15분)로 설정
-        try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+        # 지원자 KB 내용 버전 (지원자AI 답변 캐시 키에 포함, 질문 목록은 KB 내용이 아니므로 제외)
+        kb_version = stable_hash({k: v for k, v in upload_payload.items() if k != "questions"})
+
+        # 재시작(resume) 시 이전에 완료된 업로드 결과가 있으면 업로드 생략
+        upload_outputs: Optional[Dict[str, Any]] = checkpoint.load_upload() if checkpoint else None
+        # 같은 (지원자, 공고)에 같은 내용을 이미 업로드했으면 업로드 람다 생략
+        kb_uploads = KnowledgeBaseUploadService(self.db, job_seeker.id, job_posting_id)
+        upload_hash = stable_hash(upload_payload)
+        if upload_outputs is not None:
+            logger.info(f"♻️ UPLOAD 체크포인트 사용 - 업로드 생략 (user_id={job_seeker.id}, job_posting_id={job_posting_id})")
+        else:
+            upload_outputs = kb_uploads.find_unchanged(upload_hash)
+            if upload_outputs is not None:
+                logger.info(f"♻️ KB 내용 변경 없음 - 업로드 생략 (user_id={job_seeker.id}, job_posting_id={job_posting_id})")
+                if checkpoint:
+                    checkpoint.save_upload(upload_outputs)
+        if upload_outputs is None:
+            try:
+                client = get_http_client()
                 logger.info(f"➡️ UPLOAD 호출 (user_id={job_seeker.id}, job_posting_id={job_posting_id})")
-                async with session.post(upload_url, json=upload_payload, headers={"Content-Type": "application/json"}) as up_resp:
-                    up_status = up_resp.status
-                    up_text = await up_resp.text()
-                    logger.info(f"UPLOAD response status={up_status} body={up_text}")
-                    if up_status < 200 or up_status >= 300:
-                        logger.error(f"UPLOAD non-2xx response for {name}: status={up_status}")
-                        raise Exception(f"UPLOAD 호출 실패(status={up_status})")
-                    try:
-                        upload_outputs = json.loads(up_text) if up_text else {}
-                    except Exception:
-                        upload_outputs = await up_resp.json()
-
-                conversations = upload_outputs.get('conversations') if isinstance(upload_outputs, dict) else None
-                if not conversations:
-                    conversations = []
-                conversation_summary = self._summarize_conversations(conversations) if conversations else ""
-        except Exception as e:
-            logger.error(f"UPLOAD 호출 실패: {e}")
-            raise Exception(f"UPLOAD 호출 실패: {e}")
+                with metrics.span("interview.kb_upload"):
+                    up_resp = await resilient_request(
+                        upload_url,
+                        lambda: client.post(upload_url, json=upload_payload, timeout=question_deadline.timeout(900)),  # 총 대기 시간 900초(15분)
+                        deadline=question_deadline,
+                    )
+                up_status = up_resp.status_code
+                up_text = up_resp.text
+                logger.info(f"UPLOAD response status={up_status} body={up_text}")
+                if up_status < 200 or up_status >= 300:
+                    logger.error(f"UPLOAD non-2xx response for {name}: status={up_status}")
+                    raise Exception(f"UPLOAD 호출 실패(status={up_status})")
+                upload_outputs = json.loads(up_text) if up_text else {}
+            except Exception as e:
+                logger.error(f"UPLOAD 호출 실패: {e}")
+                raise Exception(f"UPLOAD 호출 실패: {e}")
+            kb_uploads.record(upload_hash, upload_outputs)
+            if checkpoint:
+                checkpoint.save_upload(upload_outputs)
+
+        conversations = upload_outputs.get('conversations') if isinstance(upload_outputs, dict) else None
+        if not conversations:
+            conversations = []
 
         user_id = str(job_seeker.id)
         job_postings = {
@@ -128,135 +206,255 @@ class AIConversationService:
             "soft_skills": (job_posting_skills or {}).get("soft_skills", [])
         }
 
-        all_message_histories = {}
-        
-
-        # 원 질문들 순회
-        for idx, q in enumerate(questions or []):
-            message_history: List[Dict[str, Any]] = []  # 질문별 누적 대화
-            initial_question = q
-            # 2) 질문 추가
-            message_history.append({
-                "role": "interviewer",  # 질문 역할
-                "type": "question",
-                "question_number": idx + 1,
-                "content": initial_question
-            })
-
-            unsatisfied_count = 0
-            while True:
-                # 3) 지원자 AI 호출 (마지막 메시지가 현재 질문 혹은 follow-up)
-                candidate_payload = {
-                    "question": message_history[-1]["content"],
-                    "knowledge_base_id": knowledge_base_id,
-                    "job_posting_id": job_posting_id,
-                    "user_id": user_id
-                }
+        # 원 질문들 순회 (질문별 message_history가 독립적이므로 옵션에 따라 동시 진행)
+        question_list = list(questions or [])
+        limit = max(1, int(question_concurrency or settings.interview_question_concurrency or 1))
+        semaphore = asyncio.Semaphore(limit)
+
+        # 재시작(resume) 시 이미 끝난 질문은 저장된 대화를 그대로 사용
+        completed_histories = checkpoint.load_questions() if checkpoint else {}
+
+        async def _run_question(idx: int, q: str) -> List[Dict[str, Any]]:
+            if completed_histories.get(idx + 1) is not None:
+                logger.info(f"♻️ 질문 {idx+1} 체크포인트 사용 - 면접 생략")
+                return completed_histories[idx + 1]
+            async with semaphore:
+                with metrics.span("interview.question"):
+                    message_history = await self._interview_question(
+                        idx, q,
+                        applicant_ai_url=applicant_ai_url,
+                        interviewer_ai_url=interviewer_ai_url,
+                        knowledge_base_id=knowledge_base_id,
+                        job_posting_id=job_posting_id,
+                        user_id=user_id,
+                        job_postings=job_postings,
+                        kb_version=kb_version,
+                        deadline=question_deadline,
+                    )
+            # 호출 오류/시간 예산 부족으로 끝난 질문은 재시작 시 다시 진행하도록 저장하지 않음
+            if checkpoint and not any(m.get("type") == "error" or m.get("partial") for m in message_history):
+                checkpoint.save_question(idx + 1, message_history)
+            if on_question_done:
                 try:
-                    logger.info(f"➡️ 지원자AI 호출 (question_number={idx+1}, unsatisfied_count={unsatisfied_count})")
-                    candidate_resp = self.invoke_lambda_url(applicant_ai_url, candidate_payload, timeout=900)
+                    on_question_done(idx + 1)
                 except Exception as e:
-                    logger.error(f"지원자AI 호출 실패: {e}")
-                    # 실패 시 중단하고 다음 질문으로 넘어갈지 여부는 요구사항 미정. 일단 기록 후 break.
-                    message_history.append({
-                        "role": "system",
-                        "type": "error",
-                        "content": f"지원자AI 호출 실패: {e}" 
-                    })
-                    break
-
-                # 4) 지원자 AI 답변 추출
-                applicant_answer = candidate_resp.get("answer")
-                if not applicant_answer:
-                    # 명세상 answer에 담긴다고 했으나 없어도 방어 로직
-                    applicant_answer = json.dumps(candidate_resp, ensure_ascii=False)
+                    logger.warning(f"질문 완료 알림 실패: {e}")
+            return message_history
 
-                message_history.append({
-                    "role": "applicant",
-                    "type": "answer",
-                    "content": applicant_answer.strip()
-                })
+        histories = await asyncio.gather(*[_run_question(idx, q) for idx, q in enumerate(question_list)])
+        partial = any(m.get("partial") for history in histories for m in history)
+        if partial:
+            metrics.increment("interview.partial")
+            logger.warning(f"⏱️ 시간 예산 부족으로 일부 질문/후속 질문 생략 (user_id={job_seeker.id}, job_posting_id={job_posting_id})")
 
-                # 5) 면접관AI 호출
-                interviewer_payload = {
-                    "question": initial_question,
-                    "message_history": message_history,  # 누적
-                    "job_postings": job_postings
-                }
-
-                try:
-                    logger.info(f"➡️ 면접관AI 호출 (question_number={idx+1}, attempts={unsatisfied_count+1})")
-                    interviewer_resp = self.invoke_lambda_url(interviewer_ai_url, interviewer_payload, timeout=90)
-                except Exception as e:
-                    logger.error(f"면접관AI 호출 실패: {e}")
-                    message_history.append({
-                        "role": "system",
-                        "type": "error",
-                        "content": f"면접관AI 호출 실패: {e}" 
-                    })
-                    break
+        # 원래 질문 순서대로 재조립
+        all_message_histories = {}
+        for initial_question, message_history in zip(question_list, histories):
+            all_message_histories[initial_question] = message_history
 
-                satisfied = interviewer_resp.get("satisfied")
+        return {
+            "message_histories": all_message_histories,
+            "job_postings": job_postings,
+            "conversations": conversations,
+            "partial": partial,
+            "deadline": deadline,
+        }
 
-                # 6) 만족 / 불만족 분기
-                if satisfied is True:
-                    reason = interviewer_resp.get("reason", "")
-                    message_history.append({
-                        "role": "interviewer",
-                        "type": "evaluation",
-                        "satisfied": True,
-                        "content": reason
-                    })
-                    logger.info(f"✅ 질문 {idx+1} 만족 (reason length={len(reason)})")
-                    break  # 다음 원 질문으로
-                else:
-                    follow_up = interviewer_resp.get("follow_up_question", "")
-                    unsatisfied_count += 1
-                    message_history.append({
-                        "role": "interviewer",
-                        "type": "follow_up",
-                        "satisfied": False,
-                        "content": follow_up
-                    })
-                    logger.info(f"➕ 질문 {idx+1} 불만족 -> follow-up 생성 (count={unsatisfied_count})")
-                    if unsatisfied_count >= 2:
-                        message_history.append({
-                            "role": "interviewer",
-                            "type": "notice",
-                            "content": "반복된 질문에도 지원자AI가 만족스러운 대답을 하지 못했습니다. 다음 질문으로 넘어갑니다"
-                        })
-                        break  # 다음 질문으로 이동
-                    # unsatisfied_count < 2 -> while 루프 지속 (follow_up이 마지막 메시지이므로 재질문)
-            all_message_histories[initial_question] = message_history
+    async def facilitator_stage(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """interview_stage 결과로 Facilitator AI 평가를 받아 면접 결과(evaluation, conversations, partial)를 반환"""
+        facilitator_ai_url = os.getenv("FACILITATOR_AI_URL")
+        if not facilitator_ai_url:
+            raise Exception("환경변수 FACILITATOR_AI_URL이 설정되지 않았습니다.")
+        deadline = state.get("deadline") or Deadline.unlimited()
+        conversations = state.get("conversations") or []
 
         # Facilitator AI 호출
         facilitator_input = {
-                    "message_history": all_message_histories,
-                    "job_postings": job_postings,
+                    "message_history": state["message_histories"],
+                    "job_postings": state["job_postings"],
                 }
         
 
-        timeout = aiohttp.ClientTimeout(total=900) # 총 대기 시간을 900초(15분)로 설정
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            logger.info("➡️ FacilitatorAI 호출")
-            async with session.post(facilitator_ai_url, json=facilitator_input, headers={"Content-Type": "application/json"}) as fac_resp:
-                fac_data = await fac_resp.json()
+        logger.info("➡️ FacilitatorAI 호출")
+        with metrics.span("interview.facilitator"):
+            # 예산을 넘겼더라도 Facilitator 몫(EVAL_FACILITATOR_RESERVE_SECONDS)은 보장
+            fac_data = await self.invoke_lambda_url(
+                facilitator_ai_url, facilitator_input,
+                timeout=deadline.timeout(900, floor=settings.eval_facilitator_reserve_seconds),  # 총 대기 시간 900초(15분)
+            )
+
+        if fac_data.get('success', False):
+            evaluation = fac_data.get('evaluation', {}) or {}
+            message_history = fac_data.get('message_history', conversations) or conversations
+
+            if not evaluation.get('highlight'):
+                logger.warning("하이라이트 생성 실패: FacilitatorAI 응답에 highlight가 없습니다")
+
+            logger.info("✅ FacilitatorAI 평가 수신 (정규화 완료)")
+            return {
+                'success': True,
+                'evaluation': evaluation,
+                'conversations': message_history,
+                'partial': bool(state.get("partial")),
+            }
+        else:
+            raise Exception(f"FacilitatorAI 호출 실패: {fac_data}")
+    
+    async def _interview_question(
+        self,
+        idx: int,
+        initial_question: str,
+        *,
+        applicant_ai_url: str,
+        interviewer_ai_url: str,
+        knowledge_base_id: str,
+        job_posting_id: Optional[str],
+        user_id: str,
+        job_postings: Dict[str, Any],
+        kb_version: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> List[Dict[str, Any]]:
+        """원 질문 1개에 대해 지원자AI ↔ 면접관AI 왕복(후속 질문 포함)을 진행하고 message_history 반환
+
+        kb_version이 있으면 같은 KB 내용·같은 질문의 지원자AI 답변을 캐시에서 재사용한다.
+        deadline 안에 왕복 1회(EVAL_MIN_TURN_SECONDS)를 더 할 수 없으면 남은 후속 질문을 생략하고
+        partial=True인 notice 메시지를 남긴다.
+        """
+        deadline = deadline or Deadline.unlimited()
+        answer_cache = ApplicantAnswerCacheService(self.db) if kb_version and ApplicantAnswerCacheService.enabled() else None
+        message_history: List[Dict[str, Any]] = []  # 질문별 누적 대화
+        # 2) 질문 추가
+        message_history.append({
+            "role": "interviewer",  # 질문 역할
+            "type": "question",
+            "question_number": idx + 1,
+            "content": initial_question
+        })
+
+        metrics.increment("interview.questions")
+        unsatisfied_count = 0
+        while True:
+            if not deadline.has(settings.eval_min_turn_seconds):
+                metrics.increment("interview.budget_trimmed_turns")
+                message_history.append({
+                    "role": "interviewer",
+                    "type": "notice",
+                    "partial": True,
+                    "content": "시간 예산이 부족해 " + ("후속 질문을 생략하고 다음 질문으로 넘어갑니다" if unsatisfied_count else "이 질문을 생략합니다"),
+                })
+                logger.warning(f"⏱️ 질문 {idx+1} 시간 예산 부족 - 중단 (unsatisfied_count={unsatisfied_count})")
+                break
+            # 3) 지원자 AI 호출 (마지막 메시지가 현재 질문 혹은 follow-up)
+            candidate_payload = {
+                "question": message_history[-1]["content"],
+                "knowledge_base_id": knowledge_base_id,
+                "job_posting_id": job_posting_id,
+                "user_id": user_id
+            }
+            cache_key = None
+            candidate_resp = None
+            if answer_cache:
+                cache_key = ApplicantAnswerCacheService.make_key(
+                    candidate_payload["question"], knowledge_base_id, job_posting_id, user_id, kb_version
+                )
+                candidate_resp = answer_cache.get(cache_key)
+            try:
+                if candidate_resp is not None:
+                    logger.info(f"♻️ 지원자AI 답변 캐시 사용 (question_number={idx+1}, unsatisfied_count={unsatisfied_count})")
+                    metrics.increment("interview.applicant_cache_hits")
+                else:
+                    logger.info(f"➡️ 지원자AI 호출 (question_number={idx+1}, unsatisfied_count={unsatisfied_count})")
+                    with metrics.span("interview.applicant_turn"):
+                        candidate_resp = await self.invoke_lambda_url(applicant_ai_url, candidate_payload, timeout=900, deadline=deadline)
+                    # 정상 답변만 캐시
+                    if answer_cache and isinstance(candidate_resp, dict) and candidate_resp.get("answer"):
+                        answer_cache.put(
+                            cache_key, candidate_resp,
+                            job_seeker_id=user_id, job_posting_id=job_posting_id, kb_version=kb_version,
+                        )
+            except Exception as e:
+                logger.error(f"지원자AI 호출 실패: {e}")
+                # 실패 시 중단하고 다음 질문으로 넘어갈지 여부는 요구사항 미정. 일단 기록 후 break.
+                message_history.append({
+                    "role": "system",
+                    "type": "error",
+                    "content": f"지원자AI 호출 실패: {e}",
+                    **({"partial": True} if deadline.expired() else {}),
+                })
+                break
 
-            if fac_data.get('success', False):
-                evaluation = fac_data.get('evaluation', {}) or {}
-                message_history = fac_data.get('message_history', conversations) or conversations
+            # 4) 지원자 AI 답변 추출
+            applicant_answer = candidate_resp.get("answer")
+            if not applicant_answer:
+                # 명세상 answer에 담긴다고 했으나 없어도 방어 로직
+                applicant_answer = json.dumps(candidate_resp, ensure_ascii=False)
 
-                if not evaluation.get('highlight'):
-                    logger.warning(f"하이라이트 생성 실패: {e}")
+            message_history.append({
+                "role": "applicant",
+                "type": "answer",
+                "content": applicant_answer.strip()
+            })
 
-                logger.info("✅ FacilitatorAI 평가 수신 (정규화 완료)")
-                return {
-                    'success': True,
-                    'evaluation': evaluation,
-                    'conversations': message_history
-                }
+            # 5) 면접관AI 호출
+            interviewer_payload = {
+                "question": initial_question,
+                "message_history": message_history,  # 누적
+                "job_postings": job_postings
+            }
+
+            try:
+                logger.info(f"➡️ 면접관AI 호출 (question_number={idx+1}, attempts={unsatisfied_count+1})")
+                with metrics.span("interview.interviewer_turn"):
+                    interviewer_resp = await self.invoke_lambda_url(
+                        interviewer_ai_url, interviewer_payload, timeout=90,
+                        hedge_delay=settings.interviewer_hedge_delay or None,
+                        deadline=deadline,
+                    )
+            except Exception as e:
+                logger.error(f"면접관AI 호출 실패: {e}")
+                message_history.append({
+                    "role": "system",
+                    "type": "error",
+                    "content": f"면접관AI 호출 실패: {e}",
+                    **({"partial": True} if deadline.expired() else {}),
+                })
+                break
+
+            satisfied = interviewer_resp.get("satisfied")
+
+            # 6) 만족 / 불만족 분기
+            if satisfied is True:
+                reason = interviewer_resp.get("reason", "")
+                message_history.append({
+                    "role": "interviewer",
+                    "type": "evaluation",
+                    "satisfied": True,
+                    "content": reason
+                })
+                logger.info(f"✅ 질문 {idx+1} 만족 (reason length={len(reason)})")
+                break  # 다음 원 질문으로
             else:
-                raise Exception(f"FacilitatorAI 호출 실패: {fac_data}")
+                follow_up = interviewer_resp.get("follow_up_question", "")
+                unsatisfied_count += 1
+                metrics.increment("interview.follow_ups")
+                if unsatisfied_count == 1:
+                    metrics.increment("interview.questions_with_follow_up")
+                message_history.append({
+                    "role": "interviewer",
+                    "type": "follow_up",
+                    "satisfied": False,
+                    "content": follow_up
+                })
+                logger.info(f"➕ 질문 {idx+1} 불만족 -> follow-up 생성 (count={unsatisfied_count})")
+                if unsatisfied_count >= 2:
+                    message_history.append({
+                        "role": "interviewer",
+                        "type": "notice",
+                        "content": "반복된 질문에도 지원자AI가 만족스러운 대답을 하지 못했습니다. 다음 질문으로 넘어갑니다"
+                    })
+                    break  # 다음 질문으로 이동
+                # unsatisfied_count < 2 -> while 루프 지속 (follow_up이 마지막 메시지이므로 재질문)
+        return message_history
     
     def _convert_job_seeker_to_dict(self, job_seeker: JobSeeker) -> Dict[str, Any]:
         """JobSeeker 모델을 딕셔너리로 변환"""
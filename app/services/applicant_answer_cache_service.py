@@ -0,0 +1,164 @@
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+import uuid
+
+from app.core.config import settings
+from app.core.hashing import stable_hash
+from app.database.database import SessionLocal
+from app.models.applicant_answer_cache import ApplicantAnswerCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _to_uuid(value) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class ApplicantAnswerCacheService:
+    """지원자AI 답변 영속 캐시 (applicant_answer_cache 테이블)
+
+    키 = (질문, knowledge_base_id, job_posting_id, user_id, KB 내용 버전) 해시.
+    지원자 KB 내용이 바뀌면 버전이 달라져 자연히 새 키가 되므로 별도 무효화가 필요 없다.
+    만료(TTL)된 항목과 최대 개수 초과분(가장 오래 안 쓰인 순)은 저장 시 주기적으로 정리한다.
+    조회/저장/정리는 호출마다 별도 세션을 쓴다 (동시에 진행되는 질문들이 공유하는 평가 세션을 commit/rollback하지 않도록).
+    """
+
+    # 프로세스 단위 누적 카운터
+    _stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+    _stores_since_prune = 0
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def enabled() -> bool:
+        return bool(settings.answer_cache_enabled)
+
+    @staticmethod
+    def make_key(question: str, knowledge_base_id: str, job_posting_id, user_id, kb_version: str) -> str:
+        return stable_hash({
+            "question": question,
+            "knowledge_base_id": knowledge_base_id,
+            "job_posting_id": str(job_posting_id),
+            "user_id": str(user_id),
+            "kb_version": kb_version,
+        })
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """유효한 캐시 응답 반환 (없거나 만료되면 None)"""
+        db = SessionLocal()
+        try:
+            entry = (
+                db.query(ApplicantAnswerCache)
+                .filter(ApplicantAnswerCache.cache_key == cache_key)
+                .filter(ApplicantAnswerCache.expires_at > func.now())
+                .first()
+            )
+            if not entry:
+                self._stats["misses"] += 1
+                return None
+            response = entry.response
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = func.now()
+            db.commit()
+            self._stats["hits"] += 1
+            return response
+        except Exception as e:
+            # 캐시 오류는 면접 진행을 막지 않음 (미스로 처리)
+            db.rollback()
+            self._stats["errors"] += 1
+            self._stats["misses"] += 1
+            logger.warning(f"지원자AI 답변 캐시 조회 실패: {e}")
+            return None
+        finally:
+            db.close()
+
+    def put(self, cache_key: str, response: Dict[str, Any], *, job_seeker_id, job_posting_id, kb_version: str):
+        """응답 저장 (같은 키가 있으면 덮어쓰고 만료 시각 갱신)"""
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.answer_cache_ttl_seconds)
+        stmt = pg_insert(ApplicantAnswerCache).values(
+            cache_key=cache_key,
+            job_seeker_id=_to_uuid(job_seeker_id),
+            job_posting_id=_to_uuid(job_posting_id),
+            kb_version=kb_version,
+            response=response,
+            hit_count=0,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ApplicantAnswerCache.cache_key],
+            set_={"response": stmt.excluded.response, "expires_at": stmt.excluded.expires_at, "last_hit_at": func.now()},
+        )
+        db = SessionLocal()
+        try:
+            db.execute(stmt)
+            db.commit()
+            self._stats["stores"] += 1
+        except Exception as e:
+            db.rollback()
+            self._stats["errors"] += 1
+            logger.warning(f"지원자AI 답변 캐시 저장 실패: {e}")
+            return
+        finally:
+            db.close()
+
+        ApplicantAnswerCacheService._stores_since_prune += 1
+        if ApplicantAnswerCacheService._stores_since_prune >= max(1, settings.answer_cache_prune_every):
+            ApplicantAnswerCacheService._stores_since_prune = 0
+            self.prune()
+
+    def prune(self) -> int:
+        """만료 항목 삭제 후, 최대 개수를 넘으면 가장 오래 안 쓰인 항목부터 삭제"""
+        db = SessionLocal()
+        try:
+            removed = (
+                db.query(ApplicantAnswerCache)
+                .filter(ApplicantAnswerCache.expires_at <= func.now())
+                .delete(synchronize_session=False)
+            )
+            overflow = db.query(func.count(ApplicantAnswerCache.cache_key)).scalar() - settings.answer_cache_max_entries
+            if overflow > 0:
+                oldest = (
+                    db.query(ApplicantAnswerCache.cache_key)
+                    .order_by(ApplicantAnswerCache.last_hit_at.asc())
+                    .limit(overflow)
+                    .subquery()
+                )
+                removed += (
+                    db.query(ApplicantAnswerCache)
+                    .filter(ApplicantAnswerCache.cache_key.in_(oldest.select()))
+                    .delete(synchronize_session=False)
+                )
+            db.commit()
+            self._stats["evictions"] += removed
+            if removed:
+                logger.info(f"지원자AI 답변 캐시 정리 - {removed}건 삭제")
+            return removed
+        except Exception as e:
+            db.rollback()
+            self._stats["errors"] += 1
+            logger.warning(f"지원자AI 답변 캐시 정리 실패: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def status(self) -> Dict[str, Any]:
+        """캐시 설정/적중률/저장 건수"""
+        stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        entries = self.db.query(func.count(ApplicantAnswerCache.cache_key)).scalar()
+        return {
+            "enabled": self.enabled(),
+            "ttl_seconds": settings.answer_cache_ttl_seconds,
+            "max_entries": settings.answer_cache_max_entries,
+            "entries": entries,
+            **stats,
+            "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
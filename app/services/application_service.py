@@ -7,6 +7,7 @@ from app.models.application import Application
 from app.models.job_posting import JobPosting
 from app.models.job_seeker import JobSeeker
 from app.models.ai_overall_report import AIOverallReport
+from app.services.leaderboard_service import LeaderboardService
 
 class ApplicationService:
     def __init__(self, db: Session):
@@ -46,6 +47,8 @@ class ApplicationService:
             application_status='submitted'
         )
         self.db.add(application)
+        # 같은 트랜잭션에서 공고 순위표에 추가
+        LeaderboardService(self.db).refresh_application(application)
         self.db.commit()
         self.db.refresh(application)
         
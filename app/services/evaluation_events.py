@@ -0,0 +1,182 @@
+from typing import Dict, Any, Set, Optional
+from collections import defaultdict
+from datetime import datetime, timezone
+import asyncio
+import json
+import logging
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 구독자별 대기열 최대 길이 (느린 클라이언트는 오래된 이벤트부터 버림)
+SUBSCRIBER_QUEUE_SIZE = 1000
+# 프로세스 간 이벤트 전달 채널 (Postgres LISTEN/NOTIFY)
+NOTIFY_CHANNEL = "verifit_evaluation_events"
+# NOTIFY payload 한도(8000 bytes)보다 작게 - 넘으면 같은 프로세스 구독자에게만 전달
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+# LISTEN 연결이 끊겼을 때 재연결 대기(초)
+RELAY_RECONNECT_SECONDS = 2.0
+
+# 평가 종료 이벤트 (스트림을 닫는 기준)
+TERMINAL_EVENTS = ('evaluation_finished', 'evaluation_failed', 'evaluation_cancelled', 'evaluation_paused')
+
+
+class EvaluationEventBus:
+    """공고 단위 AI 평가 진행 이벤트를 SSE 구독자에게 전달하는 pub/sub
+
+    기본은 같은 프로세스 안에서만 전달한다. 공유 모드(EVAL_EVENTS_SHARED 또는 EVAL_QUEUE_MODE=distributed)에서는
+    이벤트를 Postgres NOTIFY로 발행하고, 각 API 프로세스의 relay(LISTEN)가 받아 자기 구독자에게 전달한다.
+    다른 프로세스/노드의 대기열 워커가 낸 applicant_started, question_done도 이렇게 SSE 스트림에 도달한다.
+
+    이벤트 종류:
+    - evaluation_started: 평가 대상 확정 (total, pending)
+    - applicant_started / question_done / applicant_evaluated / applicant_failed: 지원자별 진행
+    - evaluation_finished / evaluation_failed: 공고 평가 종료
+    - evaluation_cancelled / evaluation_paused: 운영자 요청으로 중지 (대기 중인 지원자는 처리하지 않음)
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._relay_task: Optional[asyncio.Task] = None
+
+    @property
+    def shared(self) -> bool:
+        return settings.eval_events_shared or settings.eval_queue_mode == 'distributed'
+
+    def subscribe(self, job_posting_id) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[str(job_posting_id)].add(queue)
+        return queue
+
+    def unsubscribe(self, job_posting_id, queue: asyncio.Queue):
+        key = str(job_posting_id)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            self._subscribers.pop(key, None)
+
+    def subscriber_count(self, job_posting_id) -> int:
+        return len(self._subscribers.get(str(job_posting_id), ()))
+
+    def publish(self, job_posting_id, event: str, data: Dict[str, Any] = None):
+        """이벤트 발행 (구독자가 없으면 아무것도 하지 않음, 평가 흐름을 막지 않음)
+
+        공유 모드에서는 NOTIFY로 발행하고 전달은 relay가 한다 (자기 프로세스 구독자 포함). NOTIFY에 실패하면 로컬로만 전달.
+        """
+        if not self.shared and not self._subscribers.get(str(job_posting_id)):
+            return
+        message = {
+            "event": event,
+            "job_posting_id": str(job_posting_id),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "data": data or {},
+        }
+        if self.shared and self._notify(message):
+            return
+        self._deliver(message)
+
+    def _deliver(self, message: Dict[str, Any]):
+        """같은 프로세스의 구독자 대기열에 전달"""
+        job_posting_id = message.get("job_posting_id")
+        subscribers = self._subscribers.get(str(job_posting_id))
+        if not subscribers:
+            return
+        for queue in list(subscribers):
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning(f"평가 이벤트 전달 실패 (대기열 가득 참) - job_posting_id={job_posting_id}, event={message.get('event')}")
+
+    def _notify(self, message: Dict[str, Any]) -> bool:
+        payload = json.dumps(message, ensure_ascii=False, default=str)
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            logger.warning(f"평가 이벤트가 NOTIFY 한도를 넘어 같은 프로세스에만 전달 - event={message.get('event')}")
+            return False
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": NOTIFY_CHANNEL, "payload": payload})
+                conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"평가 이벤트 NOTIFY 실패 - 같은 프로세스에만 전달: {e}")
+            return False
+
+    # --- 프로세스 간 relay (LISTEN) ---
+    async def start_relay(self):
+        """공유 모드면 NOTIFY 채널 구독 시작 (SSE를 제공하는 API 프로세스에서 호출)"""
+        if not self.shared or (self._relay_task and not self._relay_task.done()):
+            return
+        self._relay_task = asyncio.create_task(self._relay_loop())
+        logger.info(f"평가 이벤트 relay 시작 - channel={NOTIFY_CHANNEL}")
+
+    async def stop_relay(self):
+        if self._relay_task:
+            self._relay_task.cancel()
+            await asyncio.gather(self._relay_task, return_exceptions=True)
+            self._relay_task = None
+
+    async def _relay_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            connection = None
+            try:
+                # 풀과 분리한 전용 연결 (LISTEN은 연결 단위)
+                raw = engine.raw_connection()
+                raw.detach()
+                connection = raw.dbapi_connection
+                connection.rollback()
+                connection.autocommit = True
+                cursor = connection.cursor()
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                cursor.close()
+
+                readable = asyncio.Event()
+                loop.add_reader(connection.fileno(), readable.set)
+                try:
+                    while True:
+                        await readable.wait()
+                        readable.clear()
+                        connection.poll()
+                        while connection.notifies:
+                            self._on_notify(connection.notifies.pop(0).payload)
+                finally:
+                    loop.remove_reader(connection.fileno())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"평가 이벤트 relay 연결 끊김 - {RELAY_RECONNECT_SECONDS}s 후 재연결: {e}")
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            await asyncio.sleep(RELAY_RECONNECT_SECONDS)
+
+    def _on_notify(self, payload: str):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("잘못된 평가 이벤트 payload 무시")
+            return
+        self._deliver(message)
+
+    @staticmethod
+    def format_sse(message: Dict[str, Any]) -> str:
+        """text/event-stream 형식 문자열로 변환"""
+        payload = json.dumps(message, ensure_ascii=False, default=str)
+        return f"event: {message.get('event', 'message')}\ndata: {payload}\n\n"
+
+
+evaluation_events = EvaluationEventBus()
@@ -0,0 +1,228 @@
+from typing import Dict, Any, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+import uuid
+
+from app.models.evaluation_job import EvaluationJob
+from app.models.job_posting import JobPosting
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 아직 끝나지 않은 작업 상태 (일시정지된 작업도 재개 대기 중이므로 포함)
+ACTIVE_JOB_STATUSES = ('queued', 'running', 'pausing', 'paused', 'cancelling')
+# 진행 이벤트가 아직 나올 작업 상태 (일시정지/종료된 작업은 다음 종료 이벤트가 없음)
+IN_PROGRESS_JOB_STATUSES = ('queued', 'running', 'pausing', 'cancelling')
+# 실행 중인 작업에 대한 중지 요청 상태 -> start_evaluation stop_requested 신호
+STOP_SIGNALS = {'cancelling': 'cancel', 'pausing': 'pause'}
+
+class EvaluationJobService:
+    """AI 평가 작업 등록/조회 서비스 (실행은 EvaluationJobWorker가 담당)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def submit_job(self, job_posting_id: str, force: bool = False, max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """평가 작업을 등록하고 즉시 반환 (같은 공고에 진행 중인 작업이 있으면 그 작업을 반환)"""
+        try:
+            posting_uuid = uuid.UUID(str(job_posting_id))
+        except ValueError:
+            return {"status": 404, "success": False, "message": "채용공고를 찾을 수 없습니다"}
+
+        posting = self.db.query(JobPosting).filter(JobPosting.id == posting_uuid).first()
+        if not posting:
+            return {"status": 404, "success": False, "message": "채용공고를 찾을 수 없습니다"}
+
+        active_job = (
+            self.db.query(EvaluationJob)
+            .filter(EvaluationJob.job_posting_id == posting_uuid)
+            .filter(EvaluationJob.status.in_(ACTIVE_JOB_STATUSES))
+            .order_by(EvaluationJob.created_at.desc())
+            .first()
+        )
+        if active_job:
+            logger.info(f"이미 진행 중인 평가 작업 반환 - job_id={active_job.id}, status={active_job.status}")
+            return {
+                "status": 202,
+                "success": True,
+                "message": "이미 진행 중인 AI 평가 작업이 있습니다",
+                "data": self._serialize(active_job),
+            }
+
+        job = EvaluationJob(
+            job_posting_id=posting_uuid,
+            status='queued',
+            force=bool(force),
+            max_concurrency=max_concurrency,
+            # 이전 평가 결과가 있는 공고('finish')의 재평가가 취소/실패해도 결과가 다시 보이도록 기억
+            previous_eval_status=posting.eval_status if posting.eval_status != 'ing' else 'ready',
+        )
+        self.db.add(job)
+        # 작업 대기 중에도 프론트에서 평가 진행 상태로 보이도록 즉시 반영
+        posting.eval_status = 'ing'
+        self.db.commit()
+        self.db.refresh(job)
+        logger.info(f"AI 평가 작업 등록 - job_id={job.id}, job_posting_id={job_posting_id}")
+
+        return {
+            "status": 202,
+            "success": True,
+            "message": "AI 평가 작업이 등록되었습니다",
+            "data": self._serialize(job),
+        }
+
+    def cancel_job(self, job_id: str) -> Dict[str, Any]:
+        """평가 작업 취소
+
+        대기/일시정지 작업은 즉시 cancelled, 실행 중이면 cancelling으로 표시해 워커가 중지하도록 한다
+        (진행 중인 지원자 평가는 롤백, 대기 중인 지원자는 처리하지 않음).
+        """
+        return self._transition(job_id, {
+            'queued': 'cancelled',
+            'paused': 'cancelled',
+            'running': 'cancelling',
+            'pausing': 'cancelling',
+            'cancelling': 'cancelling',
+        }, "취소")
+
+    def pause_job(self, job_id: str) -> Dict[str, Any]:
+        """평가 작업 일시정지 (실행 중이면 진행 중인 지원자까지만 평가하고 멈춤)"""
+        return self._transition(job_id, {
+            'queued': 'paused',
+            'running': 'pausing',
+            'pausing': 'pausing',
+            'paused': 'paused',
+        }, "일시정지")
+
+    def resume_job(self, job_id: str) -> Dict[str, Any]:
+        """일시정지된 작업을 다시 대기열에 등록 (이미 평가된 지원자는 체크포인트로 건너뜀)"""
+        return self._transition(job_id, {'paused': 'queued'}, "재개")
+
+    def _transition(self, job_id: str, transitions: Dict[str, str], label: str) -> Dict[str, Any]:
+        try:
+            job_uuid = uuid.UUID(str(job_id))
+        except ValueError:
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+
+        # 워커의 상태 변경과 겹치지 않도록 행 잠금
+        job = self.db.query(EvaluationJob).filter(EvaluationJob.id == job_uuid).with_for_update().first()
+        if not job:
+            self.db.rollback()
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+        next_status = transitions.get(job.status)
+        if next_status is None:
+            self.db.rollback()
+            return {"status": 409, "success": False, "message": f"'{job.status}' 상태의 평가 작업은 {label}할 수 없습니다"}
+
+        previous = job.status
+        job.status = next_status
+        if next_status == 'cancelled':
+            job.finished_at = func.now()
+            job.message = "운영자 요청으로 취소되었습니다"
+            # 실행 전/일시정지 상태에서 바로 취소되면 공고를 작업 등록 전 상태로 되돌림
+            self.restore_posting_status(self.db, job)
+        self.db.commit()
+        self.db.refresh(job)
+        logger.info(f"AI 평가 작업 {label} 요청 - job_id={job.id}, {previous} -> {next_status}")
+        return {
+            "status": 200,
+            "success": True,
+            "message": f"AI 평가 작업 {label} 요청이 반영되었습니다",
+            "data": self._serialize(job),
+        }
+
+    @staticmethod
+    def restore_posting_status(db: Session, job: EvaluationJob):
+        """취소/실패로 끝난 작업의 공고 eval_status를 작업 등록 전 상태로 되돌림 (그 사이 평가가 끝났으면 유지)"""
+        posting = db.query(JobPosting).filter(JobPosting.id == job.job_posting_id).first()
+        if posting and posting.eval_status != 'finish':
+            posting.eval_status = job.previous_eval_status or 'ready'
+
+    @staticmethod
+    def stop_signal(db: Session, job_id: str) -> Optional[str]:
+        """실행 중인 작업의 중지 요청 ('cancel' / 'pause' / None)"""
+        status = db.query(EvaluationJob.status).filter(EvaluationJob.id == job_id).scalar()
+        db.commit()
+        return STOP_SIGNALS.get(status)
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """평가 작업 진행 현황 조회"""
+        try:
+            job_uuid = uuid.UUID(str(job_id))
+        except ValueError:
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+
+        job = self.db.query(EvaluationJob).filter(EvaluationJob.id == job_uuid).first()
+        if not job:
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+        return {"status": 200, "success": True, "data": self._serialize(job)}
+
+    def get_latest_job(self, job_posting_id: str) -> Dict[str, Any]:
+        """공고의 가장 최근 평가 작업 조회"""
+        try:
+            posting_uuid = uuid.UUID(str(job_posting_id))
+        except ValueError:
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+
+        job = (
+            self.db.query(EvaluationJob)
+            .filter(EvaluationJob.job_posting_id == posting_uuid)
+            .order_by(EvaluationJob.created_at.desc())
+            .first()
+        )
+        if not job:
+            return {"status": 404, "success": False, "message": "평가 작업을 찾을 수 없습니다"}
+        return {"status": 200, "success": True, "data": self._serialize(job)}
+
+    def get_progress_snapshot(self, job_posting_id: str) -> Dict[str, Any]:
+        """SSE 연결 직후 보낼 현재 상태 (공고 평가 상태 + 최근 작업 진행률)
+
+        in_progress는 최근 작업 상태 기준 - 일시정지된 공고는 eval_status가 'ing'로 남아 있어도 False.
+        """
+        try:
+            posting_uuid = uuid.UUID(str(job_posting_id))
+        except ValueError:
+            return {"status": 404, "success": False, "message": "채용공고를 찾을 수 없습니다"}
+
+        posting = self.db.query(JobPosting).filter(JobPosting.id == posting_uuid).first()
+        if not posting:
+            return {"status": 404, "success": False, "message": "채용공고를 찾을 수 없습니다"}
+
+        job = (
+            self.db.query(EvaluationJob)
+            .filter(EvaluationJob.job_posting_id == posting_uuid)
+            .order_by(EvaluationJob.created_at.desc())
+            .first()
+        )
+        return {
+            "status": 200,
+            "success": True,
+            "data": {
+                "job_posting_id": str(posting.id),
+                "eval_status": posting.eval_status,
+                "in_progress": bool(job and job.status in IN_PROGRESS_JOB_STATUSES),
+                "job": self._serialize(job) if job else None,
+            },
+        }
+
+    @staticmethod
+    def _serialize(job: EvaluationJob) -> Dict[str, Any]:
+        total = job.total_count or 0
+        processed = job.processed_count or 0
+        return {
+            "job_id": str(job.id),
+            "job_posting_id": str(job.job_posting_id),
+            "status": job.status,
+            "force": bool(job.force),
+            "max_concurrency": job.max_concurrency,
+            "total_count": total,
+            "processed_count": processed,
+            "succeeded_count": job.succeeded_count or 0,
+            "failed_count": job.failed_count or 0,
+            "progress": round(processed * 100.0 / total, 1) if total else (100.0 if job.status == 'succeeded' else 0.0),
+            "remaining_count": max(0, total - processed),
+            "message": job.message,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        }
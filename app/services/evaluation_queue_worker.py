@@ -0,0 +1,154 @@
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from app.core.config import settings
+from app.database.database import SessionLocal
+from app.services.evaluation_work_queue import EvaluationWorkQueue
+from app.services.interview_service import InterviewService
+
+logger = logging.getLogger(__name__)
+
+class EvaluationQueueWorker:
+    """evaluation_work_items 대기열의 지원자 평가를 실행하는 워커
+
+    API 서버 프로세스 안에서(EVAL_QUEUE_LOCAL_CONSUMER) 또는 별도 프로세스/노드에서
+    (scripts/run_evaluation_worker.py) 몇 개든 띄울 수 있다. 점유 중에는 주기적으로 하트비트를 보내고,
+    프로세스가 죽으면 lease 만료 후 다른 워커가 항목을 회수한다.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.concurrency = max(1, concurrency or settings.eval_queue_worker_concurrency)
+        self.poll_interval = poll_interval or settings.eval_queue_poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._loop_task: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    async def start(self):
+        if self._loop_task and not self._loop_task.done():
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._loop_task = asyncio.create_task(self._run_loop())
+        logger.info(f"평가 대기열 워커 시작 - worker_id={self.worker_id}, 동시 평가 {self.concurrency}명")
+
+    async def stop(self):
+        """워커 종료. 실행 중인 항목은 점유를 남겨두며 lease 만료 후 다른 워커가 이어서 처리한다."""
+        self._stopping = True
+        self.notify()
+        tasks = list(self._running.values())
+        if self._loop_task:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+        self._running.clear()
+        logger.info(f"평가 대기열 워커 종료 - worker_id={self.worker_id}")
+
+    async def run_forever(self):
+        """별도 프로세스용: start 후 취소될 때까지 대기"""
+        await self.start()
+        try:
+            await self._loop_task
+        finally:
+            await self.stop()
+
+    def notify(self):
+        if self._wake:
+            self._wake.set()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": bool(self._loop_task and not self._loop_task.done()),
+            "concurrency": self.concurrency,
+            "active_item_ids": list(self._running.keys()),
+        }
+
+    async def _run_loop(self):
+        while not self._stopping:
+            try:
+                while len(self._running) < self.concurrency:
+                    item = self._claim()
+                    if not item:
+                        break
+                    item_id = str(item["id"])
+                    task = asyncio.create_task(self._process(item))
+                    self._running[item_id] = task
+                    task.add_done_callback(lambda t, iid=item_id: self._on_item_done(iid, t))
+            except Exception:
+                logger.exception("평가 대기열 조회 중 오류")
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_item_done(self, item_id: str, task: asyncio.Task):
+        # 점유를 잃은 이전 작업이 같은 항목을 다시 점유한 새 작업을 지우지 않도록
+        if self._running.get(item_id) is task:
+            self._running.pop(item_id, None)
+        self.notify()
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            return EvaluationWorkQueue(db).claim(self.worker_id)
+        finally:
+            db.close()
+
+    async def _process(self, item: Dict[str, Any]):
+        item_id = item["id"]
+        application_id = item["application_id"]
+        lease_owner = item["lease_owner"]
+        db = SessionLocal()
+        evaluation = asyncio.create_task(
+            InterviewService(db)._evaluate_application_isolated(application_id, item["questions"], item["job_posting_id"])
+        )
+        heartbeat = asyncio.create_task(self._heartbeat_loop(item_id, lease_owner, evaluation))
+        try:
+            logger.info(f"대기열 지원자 평가 시작 - application_id={application_id}, attempt={item['attempts']}")
+            await evaluation
+            EvaluationWorkQueue(db).complete(item_id, lease_owner)
+            logger.info(f"대기열 지원자 평가 완료 - application_id={application_id}")
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled() and heartbeat.result() is False:
+                # 점유를 잃어 하트비트가 평가를 중단시킴 - 새 점유자가 처리하므로 결과를 기록하지 않음
+                logger.warning(f"대기열 지원자 평가 중단 (점유를 잃음) - application_id={application_id}")
+                return
+            # 프로세스 종료: 점유 유지 -> lease 만료 후 회수
+            logger.warning(f"대기열 지원자 평가 중단 (워커 종료) - application_id={application_id}")
+            raise
+        except Exception as e:
+            logger.error(f"대기열 지원자 평가 실패 - application_id={application_id}: {e}")
+            db.rollback()
+            EvaluationWorkQueue(db).fail(item_id, lease_owner, str(e), item["attempts"])
+        finally:
+            heartbeat.cancel()
+            evaluation.cancel()
+            db.close()
+
+    async def _heartbeat_loop(self, item_id, lease_owner: str, evaluation: asyncio.Task) -> bool:
+        """lease 연장. 점유를 잃으면(lease 만료 후 회수, 재평가로 점유 회수) 평가 작업을 취소하고 False 반환"""
+        while True:
+            await asyncio.sleep(settings.eval_queue_heartbeat_interval)
+            db = SessionLocal()
+            try:
+                if not EvaluationWorkQueue(db).heartbeat(item_id, lease_owner):
+                    logger.warning(f"평가 항목 점유를 잃음 (다른 워커가 회수) - item_id={item_id}")
+                    # 이전 점유자의 평가 결과가 새 점유자의 결과와 중복 저장되지 않도록 중단
+                    evaluation.cancel()
+                    return False
+            finally:
+                db.close()
+
+
+evaluation_queue_worker = EvaluationQueueWorker()
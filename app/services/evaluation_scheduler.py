@@ -0,0 +1,186 @@
+from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+import asyncio
+import heapq
+import itertools
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def company_weight(company_id) -> float:
+    """회사별 가중치 (EVAL_COMPANY_WEIGHTS, 기본 1.0)"""
+    weight = (settings.eval_company_weights or {}).get(str(company_id), 1.0)
+    try:
+        return max(0.01, float(weight))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def posting_boost(posting_size: int) -> float:
+    """지원자 수가 적은 공고의 우선순위 가중 (EVAL_SMALL_POSTING_THRESHOLD 이하면 EVAL_SMALL_POSTING_BOOST배)"""
+    if posting_size <= settings.eval_small_posting_threshold:
+        return max(1.0, settings.eval_small_posting_boost)
+    return 1.0
+
+
+class _Flow:
+    """공고 1개의 스케줄링 상태"""
+
+    def __init__(self, posting_id: str, company_id: str, size: int):
+        self.posting_id = posting_id
+        self.company_id = company_id
+        self.size = size
+        self.running = 0
+        self.waiting = 0
+        self.granted = 0
+
+    @property
+    def weight(self) -> float:
+        return company_weight(self.company_id) * posting_boost(self.size)
+
+
+class FairShareScheduler:
+    """여러 공고가 동시에 평가될 때 지원자 평가 슬롯을 회사 단위로 공정하게 배분 (프로세스 전역)
+
+    self-clocked weighted fair queuing:
+    - 대기 요청마다 finish tag = max(현재 가상 시각, 회사의 마지막 tag) + 1/가중치
+    - 슬롯이 비면 tag가 가장 작은 요청에 배정하고 가상 시각을 그 tag로 이동
+    늦게 시작한 회사도 현재 가상 시각부터 경쟁하므로 큰 공고 뒤에 줄 서지 않고, 작은 공고는 비용이 작아 더 자주 배정된다.
+    슬롯 수(EVAL_GLOBAL_CONCURRENCY)는 전체 동시 평가 지원자 수이며, 개별 Lambda 호출은 별도로 호출 대상별 속도 제한을 따른다.
+    파이프라인 모드의 Facilitator 평가(2단계)는 슬롯을 반납한 뒤 실행되므로 별도의 프로세스 전역 한도
+    (EVAL_PIPELINE_GLOBAL_FACILITATOR_WORKERS)를 따른다. 전체 동시 LLM 작업 수 = 두 한도의 합.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self._concurrency = concurrency
+        self.in_use = 0
+        self.virtual_time = 0.0
+        self._heap: List[list] = []  # [tag, seq, future, flow]
+        self._seq = itertools.count()
+        self._company_tags: Dict[str, float] = {}
+        self._flows: Dict[str, _Flow] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._facilitator: Optional[asyncio.Semaphore] = None
+        self.facilitator_in_use = 0
+
+    @property
+    def concurrency(self) -> int:
+        return max(1, int(self._concurrency or settings.eval_global_concurrency or 1))
+
+    @property
+    def facilitator_concurrency(self) -> int:
+        return max(1, int(settings.eval_pipeline_global_facilitator_workers or 1))
+
+    def _check_loop(self):
+        # 이벤트 루프가 바뀌면(스크립트에서 asyncio.run 반복 등) 이전 루프의 대기 상태는 버린다
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._heap.clear()
+            self._flows.clear()
+            self._company_tags.clear()
+            self.in_use = 0
+            self.virtual_time = 0.0
+            self._facilitator = None
+            self.facilitator_in_use = 0
+
+    @asynccontextmanager
+    async def slot(self, posting_id, company_id, posting_size: int):
+        """지원자 1명 평가 동안 슬롯 점유"""
+        flow = await self._acquire(str(posting_id), str(company_id), posting_size)
+        try:
+            yield
+        finally:
+            self._release(flow)
+
+    @asynccontextmanager
+    async def facilitator_slot(self):
+        """Facilitator 평가 1건 동안 프로세스 전역 슬롯 점유 (공고별 워커 수와 별개로 전체 합을 제한)"""
+        self._check_loop()
+        if self._facilitator is None:
+            self._facilitator = asyncio.Semaphore(self.facilitator_concurrency)
+        async with self._facilitator:
+            self.facilitator_in_use += 1
+            try:
+                yield
+            finally:
+                self.facilitator_in_use -= 1
+
+    async def _acquire(self, posting_id: str, company_id: str, posting_size: int) -> _Flow:
+        self._check_loop()
+        flow = self._flows.get(posting_id)
+        if flow is None:
+            flow = _Flow(posting_id, company_id, posting_size)
+            self._flows[posting_id] = flow
+
+        tag = max(self.virtual_time, self._company_tags.get(company_id, 0.0)) + 1.0 / flow.weight
+        self._company_tags[company_id] = tag
+        future = asyncio.get_running_loop().create_future()
+        entry = [tag, next(self._seq), future, flow]
+        heapq.heappush(self._heap, entry)
+        flow.waiting += 1
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 배정 직후 취소됨 -> 슬롯 반환
+                self._release(flow)
+            else:
+                entry[2] = None  # heap에서 지연 삭제
+                flow.waiting -= 1
+                self._forget(flow)
+            raise
+        return flow
+
+    def _dispatch(self):
+        while self.in_use < self.concurrency and self._heap:
+            tag, _, future, flow = heapq.heappop(self._heap)
+            if future is None or future.done():
+                continue
+            self.in_use += 1
+            self.virtual_time = max(self.virtual_time, tag)
+            flow.waiting -= 1
+            flow.running += 1
+            flow.granted += 1
+            future.set_result(None)
+
+    def _release(self, flow: _Flow):
+        self.in_use = max(0, self.in_use - 1)
+        flow.running = max(0, flow.running - 1)
+        self._forget(flow)
+        self._dispatch()
+
+    def _forget(self, flow: _Flow):
+        if flow.running <= 0 and flow.waiting <= 0 and self._flows.get(flow.posting_id) is flow:
+            del self._flows[flow.posting_id]
+            if not any(f.company_id == flow.company_id for f in self._flows.values()):
+                self._company_tags.pop(flow.company_id, None)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "in_use": self.in_use,
+            "waiting": sum(f.waiting for f in self._flows.values()),
+            "virtual_time": round(self.virtual_time, 3),
+            "facilitator_concurrency": self.facilitator_concurrency,
+            "facilitator_in_use": self.facilitator_in_use,
+            "flows": [
+                {
+                    "job_posting_id": f.posting_id,
+                    "company_id": f.company_id,
+                    "posting_size": f.size,
+                    "weight": round(f.weight, 3),
+                    "running": f.running,
+                    "waiting": f.waiting,
+                    "granted": f.granted,
+                }
+                for f in self._flows.values()
+            ],
+        }
+
+
+evaluation_scheduler = FairShareScheduler()
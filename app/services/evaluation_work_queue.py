@@ -0,0 +1,280 @@
+from typing import List, Dict, Any, Optional, Iterable
+import uuid
+from datetime import timedelta
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.models.evaluation_work_item import EvaluationWorkItem
+from app.models.job_posting import JobPosting
+from app.services.evaluation_scheduler import company_weight, posting_boost
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 더 이상 처리하지 않는 작업 항목 상태
+TERMINAL_ITEM_STATUSES = ('succeeded', 'failed')
+# 평가 중지(취소/일시정지)로 보류된 항목 - 워커가 점유하지 않고, 재시작(enqueue reset=False) 시 다시 대기열로
+HELD_ITEM_STATUS = 'held'
+
+
+class EvaluationWorkQueue:
+    """지원자 단위 평가 대기열 (evaluation_work_items 테이블)
+
+    - 평가를 맡은 프로세스(오케스트레이터)가 enqueue 후 statuses로 완료를 기다림
+    - 워커는 claim(SELECT ... FOR UPDATE SKIP LOCKED)으로 항목을 점유하고 heartbeat로 점유 기간(lease)을 연장
+    - lease가 만료된 running 항목은 워커가 죽은 것으로 보고 다른 워커가 다시 점유
+    commit은 각 메서드가 직접 한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # --- 오케스트레이터 ---
+    def enqueue(self, job_posting_id, application_ids: Iterable[Any], questions: List[str], reset: bool = True) -> int:
+        """평가 대상 지원서를 대기열에 등록
+
+        reset=True면 공고의 이전 항목을 지우고 새로 등록(실행 중인 항목은 점유 회수 후 다시 대기),
+        False(재시작)면 이미 있는 항목은 그대로 두고 없는 것만 추가 (보류된 항목은 다시 대기 상태로)
+        """
+        application_ids = list(application_ids)
+        if reset:
+            items = self.db.query(EvaluationWorkItem).filter(EvaluationWorkItem.job_posting_id == job_posting_id)
+            items.filter(EvaluationWorkItem.status != 'running').delete(synchronize_session=False)
+            # 다른 워커가 실행 중인 항목은 지우지 않고 점유를 회수(fence)해 새 질문으로 다시 대기시킨다.
+            # 이전 워커는 하트비트에서 점유를 잃은 것을 알고 평가를 중단하며, complete/fail도 점유 조건에 걸려 무시된다.
+            items.filter(EvaluationWorkItem.status == 'running').update({
+                EvaluationWorkItem.status: 'queued',
+                EvaluationWorkItem.questions: list(questions or []),
+                EvaluationWorkItem.attempts: 0,
+                EvaluationWorkItem.lease_owner: None,
+                EvaluationWorkItem.lease_expires_at: None,
+                EvaluationWorkItem.heartbeat_at: None,
+                EvaluationWorkItem.last_error: None,
+                EvaluationWorkItem.finished_at: None,
+            }, synchronize_session=False)
+            # 새 평가 대상이 아닌 항목은 (점유 회수 후) 삭제
+            items.filter(EvaluationWorkItem.application_id.notin_(application_ids)).delete(synchronize_session=False)
+        else:
+            (
+                self.db.query(EvaluationWorkItem)
+                .filter(EvaluationWorkItem.job_posting_id == job_posting_id)
+                .filter(EvaluationWorkItem.status == HELD_ITEM_STATUS)
+                .update({EvaluationWorkItem.status: 'queued'}, synchronize_session=False)
+            )
+        if application_ids:
+            rows = [
+                {
+                    "job_posting_id": job_posting_id,
+                    "application_id": application_id,
+                    "questions": list(questions or []),
+                    "status": 'queued',
+                    "attempts": 0,
+                }
+                for application_id in application_ids
+            ]
+            stmt = pg_insert(EvaluationWorkItem).values(rows).on_conflict_do_nothing(constraint='uq_evaluation_work_item')
+            self.db.execute(stmt)
+        self.db.commit()
+        logger.info(f"평가 대기열 등록 - job_posting_id={job_posting_id}, {len(application_ids)}건 (reset={reset})")
+        return len(application_ids)
+
+    def hold(self, job_posting_id) -> int:
+        """아직 점유되지 않은 항목을 보류 (평가 취소/일시정지). 실행 중인 항목은 워커가 끝까지 처리한다."""
+        try:
+            held = (
+                self.db.query(EvaluationWorkItem)
+                .filter(EvaluationWorkItem.job_posting_id == job_posting_id)
+                .filter(EvaluationWorkItem.status == 'queued')
+                .update({EvaluationWorkItem.status: HELD_ITEM_STATUS}, synchronize_session=False)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        logger.info(f"평가 대기열 보류 - job_posting_id={job_posting_id}, {held}건")
+        return held
+
+    def statuses(self, job_posting_id, application_ids: Iterable[Any]) -> Dict[Any, Dict[str, Any]]:
+        """지원서별 현재 상태 (application_id -> {status, attempts, last_error})"""
+        application_ids = list(application_ids)
+        if not application_ids:
+            return {}
+        rows = (
+            self.db.query(
+                EvaluationWorkItem.application_id,
+                EvaluationWorkItem.status,
+                EvaluationWorkItem.attempts,
+                EvaluationWorkItem.last_error,
+            )
+            .filter(EvaluationWorkItem.job_posting_id == job_posting_id)
+            .filter(EvaluationWorkItem.application_id.in_(application_ids))
+            .all()
+        )
+        # 폴링 사이에 스냅샷이 고정되지 않도록 트랜잭션 종료
+        self.db.commit()
+        return {
+            row.application_id: {"status": row.status, "attempts": row.attempts, "last_error": row.last_error}
+            for row in rows
+        }
+
+    # --- 워커 ---
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """처리할 항목 하나를 점유해 반환 (없으면 None)
+
+        lease가 만료된 실행 중 항목을 먼저 회수하고, 없으면 fair_posting_order 순서로 공고를 골라
+        그 공고의 가장 오래된 대기 항목을 가져온다. 다른 워커가 잠근 행은 건너뛴다(SKIP LOCKED).
+        최대 시도 횟수를 넘긴 만료 항목은 failed로 정리한다.
+        반환값의 lease_owner는 이번 점유의 식별자(워커 id + 점유별 토큰)로 heartbeat/complete/fail에 넘긴다.
+        같은 워커가 회수된 항목을 다시 점유해도 이전 점유의 하트비트/결과 기록은 무시된다.
+        """
+        lease = timedelta(seconds=settings.eval_queue_lease_seconds)
+        max_attempts = max(1, settings.eval_queue_max_attempts)
+        while True:
+            try:
+                item = self._lock_next(
+                    self.db.query(EvaluationWorkItem)
+                    .filter(EvaluationWorkItem.status == 'running')
+                    .filter(EvaluationWorkItem.lease_expires_at < func.now())
+                )
+                if not item:
+                    for job_posting_id in self.fair_posting_order():
+                        item = self._lock_next(
+                            self.db.query(EvaluationWorkItem)
+                            .filter(EvaluationWorkItem.job_posting_id == job_posting_id)
+                            .filter(EvaluationWorkItem.status == 'queued')
+                        )
+                        if item:
+                            break
+                if not item:
+                    self.db.rollback()
+                    return None
+
+                if item.status == 'running' and (item.attempts or 0) >= max_attempts:
+                    logger.warning(
+                        f"평가 항목 lease 만료 - 최대 시도 횟수 초과로 실패 처리 (application_id={item.application_id}, owner={item.lease_owner})"
+                    )
+                    item.status = 'failed'
+                    item.last_error = item.last_error or "워커 응답 없음 (lease 만료)"
+                    item.lease_owner = None
+                    item.lease_expires_at = None
+                    item.finished_at = func.now()
+                    self.db.commit()
+                    continue
+
+                if item.status == 'running':
+                    logger.warning(f"lease 만료 항목 회수 - application_id={item.application_id}, 이전 owner={item.lease_owner}")
+                item.status = 'running'
+                item.attempts = (item.attempts or 0) + 1
+                item.lease_owner = f"{worker_id[:90]}/{uuid.uuid4().hex[:8]}"
+                item.heartbeat_at = func.now()
+                item.lease_expires_at = func.now() + lease
+                claimed = {
+                    "id": item.id,
+                    "job_posting_id": item.job_posting_id,
+                    "application_id": item.application_id,
+                    "questions": list(item.questions or []),
+                    "attempts": item.attempts,
+                    "lease_owner": item.lease_owner,
+                }
+                self.db.commit()
+                return claimed
+            except Exception:
+                self.db.rollback()
+                raise
+
+    @staticmethod
+    def _lock_next(query) -> Optional[EvaluationWorkItem]:
+        return query.order_by(EvaluationWorkItem.created_at.asc()).with_for_update(skip_locked=True).first()
+
+    def fair_posting_order(self) -> List[Any]:
+        """대기 항목이 있는 공고를 공정 분배 순서로 정렬 (EvaluationScheduler와 같은 가중치 사용)
+
+        회사별 (실행 중 항목 수 / 회사 가중치)가 작은 회사부터, 회사 안에서는 (실행 중 / 작은 공고 가중)이 작은 공고,
+        같으면 오래된 공고 순. 먼저 시작한 큰 공고가 워커를 독점하지 않도록 한다.
+        """
+        queued = func.count(case((EvaluationWorkItem.status == 'queued', 1)))
+        running = func.count(case((EvaluationWorkItem.status == 'running', 1)))
+        rows = (
+            self.db.query(
+                EvaluationWorkItem.job_posting_id,
+                JobPosting.company_id,
+                queued.label("queued"),
+                running.label("running"),
+                func.min(EvaluationWorkItem.created_at).label("oldest"),
+            )
+            .join(JobPosting, JobPosting.id == EvaluationWorkItem.job_posting_id)
+            .filter(EvaluationWorkItem.status.in_(('queued', 'running')))
+            .group_by(EvaluationWorkItem.job_posting_id, JobPosting.company_id)
+            .all()
+        )
+        company_running: Dict[Any, int] = {}
+        for row in rows:
+            company_running[row.company_id] = company_running.get(row.company_id, 0) + row.running
+
+        def _key(row):
+            size = row.queued + row.running
+            return (
+                company_running[row.company_id] / company_weight(row.company_id),
+                row.running / posting_boost(size),
+                row.oldest,
+            )
+
+        return [row.job_posting_id for row in sorted((r for r in rows if r.queued), key=_key)]
+
+    def heartbeat(self, item_id, lease_owner: str) -> bool:
+        """lease 연장. 점유를 잃었으면(다른 워커가 회수) False"""
+        lease = timedelta(seconds=settings.eval_queue_lease_seconds)
+        try:
+            updated = (
+                self.db.query(EvaluationWorkItem)
+                .filter(EvaluationWorkItem.id == item_id)
+                .filter(EvaluationWorkItem.lease_owner == lease_owner)
+                .filter(EvaluationWorkItem.status == 'running')
+                .update({
+                    EvaluationWorkItem.heartbeat_at: func.now(),
+                    EvaluationWorkItem.lease_expires_at: func.now() + lease,
+                }, synchronize_session=False)
+            )
+            self.db.commit()
+            return updated > 0
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"평가 항목 하트비트 실패 - item_id={item_id}: {e}")
+            return True
+
+    def complete(self, item_id, lease_owner: str) -> bool:
+        return self._finish(item_id, lease_owner, {EvaluationWorkItem.status: 'succeeded', EvaluationWorkItem.last_error: None})
+
+    def fail(self, item_id, lease_owner: str, error: str, attempts: int) -> bool:
+        """실패 기록. 시도 횟수가 남았으면 다시 대기열로, 아니면 failed"""
+        retry = attempts < max(1, settings.eval_queue_max_attempts)
+        return self._finish(item_id, lease_owner, {
+            EvaluationWorkItem.status: 'queued' if retry else 'failed',
+            EvaluationWorkItem.last_error: (error or "")[:2000],
+        }, finished=not retry)
+
+    def _finish(self, item_id, lease_owner: str, values: Dict[Any, Any], finished: bool = True) -> bool:
+        values = {
+            **values,
+            EvaluationWorkItem.lease_owner: None,
+            EvaluationWorkItem.lease_expires_at: None,
+            EvaluationWorkItem.finished_at: func.now() if finished else None,
+        }
+        try:
+            updated = (
+                self.db.query(EvaluationWorkItem)
+                .filter(EvaluationWorkItem.id == item_id)
+                .filter(EvaluationWorkItem.lease_owner == lease_owner)
+                .update(values, synchronize_session=False)
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"평가 항목 상태 저장 실패 - item_id={item_id}: {e}")
+            return False
+        if not updated:
+            logger.warning(f"평가 항목 점유를 잃어 결과를 기록하지 않음 - item_id={item_id}, owner={lease_owner}")
+        return updated > 0
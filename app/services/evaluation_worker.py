@@ -0,0 +1,354 @@
+from typing import Dict, Any, Optional, Tuple
+from datetime import timedelta
+from sqlalchemy import or_
+from sqlalchemy.sql import func
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from app.core.config import settings
+from app.database.database import SessionLocal
+from app.models.evaluation_job import EvaluationJob
+from app.services.interview_service import InterviewService
+from app.services.evaluation_job_service import EvaluationJobService
+
+logger = logging.getLogger(__name__)
+
+class EvaluationJobWorker:
+    """evaluation_jobs 테이블의 대기 작업을 실행하는 백그라운드 워커 (서버 프로세스 내 asyncio 태스크)
+
+    - 서버 시작 시 start(), 종료 시 stop() 호출
+    - 작업 진행률은 지원자 단위로 evaluation_jobs 행에 기록
+    - 실행 중에는 하트비트로 작업 점유(lease)를 연장하고, 점유가 만료된(프로세스가 죽은) running 작업만
+      다시 대기열에 넣어 이어서 실행 (여러 API 프로세스/노드가 같은 테이블을 처리해도 중복 실행하지 않음)
+    - 작업 상태가 cancelling/pausing으로 바뀌면 실행 중인 평가에 중지를 알리고 cancelled/paused로 마무리
+    """
+
+    def __init__(self, poll_interval: Optional[float] = None, max_parallel_jobs: Optional[int] = None):
+        self.poll_interval = poll_interval or settings.eval_worker_poll_interval
+        self.max_parallel_jobs = max(1, max_parallel_jobs or settings.eval_max_parallel_jobs)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._loop_task: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    async def start(self):
+        """워커 루프 시작 (중단된 작업 복구 포함)"""
+        if self._loop_task and not self._loop_task.done():
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._loop_task = asyncio.create_task(self._run_loop())
+        logger.info(f"AI 평가 워커 시작 (동시 작업 {self.max_parallel_jobs}개, 조회 주기 {self.poll_interval}s)")
+
+    async def stop(self):
+        """워커 루프 종료. 실행 중인 작업은 running 상태로 남기고 점유를 즉시 만료시켜 다른 프로세스(또는 재시작 후)가 이어서 실행한다."""
+        self._stopping = True
+        self.notify()
+        tasks = list(self._running.values())
+        if self._loop_task:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+        self._running.clear()
+        logger.info("AI 평가 워커 종료")
+
+    def notify(self):
+        """새 작업 등록 시 대기 중인 루프를 즉시 깨운다"""
+        if self._wake:
+            self._wake.set()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": bool(self._loop_task and not self._loop_task.done()),
+            "max_parallel_jobs": self.max_parallel_jobs,
+            "active_job_ids": list(self._running.keys()),
+        }
+
+    def recover_interrupted_jobs(self) -> int:
+        """점유가 만료된 실행 중 작업(프로세스 종료로 중단됨)을 queued로 되돌린다
+
+        다른 프로세스가 하트비트를 보내고 있는 작업은 건드리지 않는다. 점유 정보가 없는 행(이전 버전에서 남은 작업)은 만료로 본다.
+        중지 요청 도중 중단된 작업은 요청대로 마무리한다 (pausing -> paused, cancelling -> cancelled).
+        """
+        db = SessionLocal()
+        try:
+            expired = or_(EvaluationJob.lease_expires_at.is_(None), EvaluationJob.lease_expires_at < func.now())
+            released = {
+                EvaluationJob.lease_owner: None,
+                EvaluationJob.lease_expires_at: None,
+            }
+            count = (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.status == 'running', expired)
+                .update({EvaluationJob.status: 'queued', **released}, synchronize_session=False)
+            )
+            db.query(EvaluationJob).filter(EvaluationJob.status == 'pausing', expired).update(
+                {EvaluationJob.status: 'paused', **released}, synchronize_session=False
+            )
+            cancelled = db.query(EvaluationJob).filter(EvaluationJob.status == 'cancelling', expired).all()
+            for job in cancelled:
+                self._mark_cancelled(db, job, "운영자 요청으로 취소되었습니다")
+            db.commit()
+            if count:
+                logger.info(f"중단된 AI 평가 작업 {count}건을 다시 대기열에 등록했습니다")
+            return count
+        except Exception as e:
+            db.rollback()
+            logger.error(f"중단된 평가 작업 복구 실패: {e}")
+            return 0
+        finally:
+            db.close()
+
+    async def _run_loop(self):
+        while not self._stopping:
+            try:
+                # 다른 프로세스가 죽어 점유가 만료된 작업도 주기적으로 회수
+                self.recover_interrupted_jobs()
+                while len(self._running) < self.max_parallel_jobs:
+                    claimed = self._claim_next_job()
+                    if not claimed:
+                        break
+                    job_id, resume, lease_owner = claimed
+                    task = asyncio.create_task(self._run_job(job_id, lease_owner, resume=resume))
+                    self._running[job_id] = task
+                    task.add_done_callback(lambda _t, jid=job_id: self._on_job_done(jid))
+            except Exception:
+                logger.exception("AI 평가 작업 조회 중 오류")
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_job_done(self, job_id: str):
+        self._running.pop(job_id, None)
+        self.notify()
+
+    def _claim_next_job(self) -> Optional[Tuple[str, bool, str]]:
+        """가장 오래된 queued 작업을 점유해 running으로 전환하고 (job_id, resume 여부, 점유 식별자) 반환
+
+        started_at이 이미 있는 작업은 실행 도중 중단되었다가 복구된 작업이므로 체크포인트로 이어서 진행한다.
+        """
+        db = SessionLocal()
+        try:
+            job = (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.status == 'queued')
+                .order_by(EvaluationJob.created_at.asc())
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not job:
+                db.rollback()
+                return None
+            resume = job.started_at is not None
+            lease_owner = f"{self.worker_id[:90]}/{uuid.uuid4().hex[:8]}"
+            job.status = 'running'
+            if not resume:
+                job.started_at = func.now()
+            job.finished_at = None
+            job.lease_owner = lease_owner
+            job.heartbeat_at = func.now()
+            job.lease_expires_at = func.now() + timedelta(seconds=settings.eval_job_lease_seconds)
+            db.commit()
+            return str(job.id), resume, lease_owner
+        finally:
+            db.close()
+
+    async def _run_job(self, job_id: str, lease_owner: str, resume: bool = False):
+        db = SessionLocal()
+        heartbeat: Optional[asyncio.Task] = None
+        try:
+            job = db.query(EvaluationJob).filter(EvaluationJob.id == job_id).first()
+            if not job:
+                return
+            job_posting_id = str(job.job_posting_id)
+            force = bool(job.force)
+            max_concurrency = job.max_concurrency
+            db.commit()
+
+            logger.info(f"AI 평가 작업 실행 - job_id={job_id}, job_posting_id={job_posting_id}, resume={resume}")
+            heartbeat = asyncio.create_task(self._heartbeat_loop(job_id, lease_owner, asyncio.current_task()))
+            try:
+                result = await InterviewService(db).start_evaluation(
+                    job_posting_id,
+                    force=force,
+                    max_concurrency=max_concurrency,
+                    progress_callback=lambda progress: self._update_progress(job_id, progress),
+                    resume=resume,
+                    stop_requested=lambda: self._stop_signal(job_id),
+                )
+            finally:
+                heartbeat.cancel()
+            if result.get("stopped"):
+                self._finish_stopped_job(job_id, lease_owner, result.get("stopped"), result.get("message"))
+            elif result.get("success"):
+                self._finish_job(job_id, lease_owner, 'succeeded', result.get("message"))
+            else:
+                self._finish_job(job_id, lease_owner, 'failed', result.get("message"), reset_posting=True)
+        except asyncio.CancelledError:
+            if heartbeat is not None and heartbeat.done() and not heartbeat.cancelled() and heartbeat.result() is False:
+                # 점유를 잃음 (하트비트 지연으로 다른 프로세스가 회수) - 새 점유자가 이어서 실행하므로 결과를 기록하지 않음
+                logger.warning(f"AI 평가 작업 중단 (점유를 잃음) - job_id={job_id}")
+                return
+            # 서버 종료: running 상태 유지, 점유를 즉시 만료시켜 다른 프로세스/재시작 후 이어서 실행
+            logger.warning(f"AI 평가 작업 중단 (서버 종료) - job_id={job_id}")
+            self._release_lease(job_id, lease_owner)
+            raise
+        except Exception as e:
+            logger.exception(f"AI 평가 작업 실패 - job_id={job_id}")
+            self._finish_job(job_id, lease_owner, 'failed', str(e), reset_posting=True)
+        finally:
+            db.close()
+
+    async def _heartbeat_loop(self, job_id: str, lease_owner: str, job_task: asyncio.Task) -> bool:
+        """작업 점유 연장. 점유를 잃으면 실행 중인 작업을 취소하고 False 반환 (같은 작업의 중복 실행 방지)"""
+        while True:
+            await asyncio.sleep(settings.eval_job_heartbeat_interval)
+            if not self._extend_lease(job_id, lease_owner):
+                logger.warning(f"평가 작업 점유를 잃음 (다른 프로세스가 회수) - job_id={job_id}")
+                job_task.cancel()
+                return False
+
+    def _extend_lease(self, job_id: str, lease_owner: str) -> bool:
+        db = SessionLocal()
+        try:
+            updated = (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.id == job_id)
+                .filter(EvaluationJob.lease_owner == lease_owner)
+                .filter(EvaluationJob.status.in_(('running', 'pausing', 'cancelling')))
+                .update({
+                    EvaluationJob.heartbeat_at: func.now(),
+                    EvaluationJob.lease_expires_at: func.now() + timedelta(seconds=settings.eval_job_lease_seconds),
+                }, synchronize_session=False)
+            )
+            db.commit()
+            return updated > 0
+        except Exception as e:
+            db.rollback()
+            # DB 오류는 점유 상실로 보지 않음 (다음 하트비트에서 재시도)
+            logger.warning(f"평가 작업 하트비트 실패 - job_id={job_id}: {e}")
+            return True
+        finally:
+            db.close()
+
+    def _release_lease(self, job_id: str, lease_owner: str):
+        db = SessionLocal()
+        try:
+            (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.id == job_id)
+                .filter(EvaluationJob.lease_owner == lease_owner)
+                .update({EvaluationJob.lease_expires_at: func.now()}, synchronize_session=False)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"평가 작업 점유 해제 실패 - job_id={job_id}: {e}")
+        finally:
+            db.close()
+
+    def _stop_signal(self, job_id: str) -> Optional[str]:
+        db = SessionLocal()
+        try:
+            return EvaluationJobService.stop_signal(db, job_id)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _mark_cancelled(db, job: EvaluationJob, message: Optional[str]):
+        job.status = 'cancelled'
+        job.message = message
+        job.finished_at = func.now()
+        job.lease_owner = None
+        job.lease_expires_at = None
+        # 실행 중 취소는 start_evaluation이 'ready'로 바꿔두므로 작업 등록 전 상태로 다시 맞춤
+        EvaluationJobService.restore_posting_status(db, job)
+
+    @staticmethod
+    def _leased_job(db, job_id: str, lease_owner: str) -> Optional[EvaluationJob]:
+        """이 점유자가 아직 점유 중인 작업 (lease 만료 후 다른 워커가 회수했으면 None)"""
+        job = (
+            db.query(EvaluationJob)
+            .filter(EvaluationJob.id == job_id)
+            .filter(EvaluationJob.lease_owner == lease_owner)
+            .with_for_update()
+            .first()
+        )
+        if not job:
+            logger.warning(f"평가 작업 점유를 잃어 결과를 기록하지 않음 - job_id={job_id}")
+        return job
+
+    def _finish_stopped_job(self, job_id: str, lease_owner: str, stopped: str, message: Optional[str] = None):
+        """중지된 작업 마무리 - 일시정지 처리 중 취소 요청이 들어왔으면 취소가 우선"""
+        db = SessionLocal()
+        try:
+            job = self._leased_job(db, job_id, lease_owner)
+            if not job:
+                return
+            if stopped == 'cancel' or job.status == 'cancelling':
+                self._mark_cancelled(db, job, message)
+            else:
+                # started_at을 유지해 재개 시 체크포인트로 이어서 진행
+                job.status = 'paused'
+                job.message = message
+                job.lease_owner = None
+                job.lease_expires_at = None
+            db.commit()
+            logger.info(f"AI 평가 작업 중지 - job_id={job_id}, status={job.status}")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"평가 작업 중지 처리 실패 - job_id={job_id}: {e}")
+        finally:
+            db.close()
+
+    def _update_progress(self, job_id: str, progress: Dict[str, int]):
+        db = SessionLocal()
+        try:
+            db.query(EvaluationJob).filter(EvaluationJob.id == job_id).update({
+                EvaluationJob.total_count: progress.get("total", 0),
+                EvaluationJob.processed_count: progress.get("processed", 0),
+                EvaluationJob.succeeded_count: progress.get("succeeded", 0),
+                EvaluationJob.failed_count: progress.get("failed", 0),
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"평가 작업 진행률 저장 실패 - job_id={job_id}: {e}")
+        finally:
+            db.close()
+
+    def _finish_job(self, job_id: str, lease_owner: str, status: str, message: Optional[str] = None, reset_posting: bool = False):
+        db = SessionLocal()
+        try:
+            job = self._leased_job(db, job_id, lease_owner)
+            if not job:
+                return
+            job.status = status
+            job.message = message
+            job.finished_at = func.now()
+            job.lease_owner = None
+            job.lease_expires_at = None
+            if reset_posting:
+                # 실패한 작업이 공고를 'ing' 상태로 묶어두지 않도록 작업 등록 전 상태로 되돌림
+                EvaluationJobService.restore_posting_status(db, job)
+            db.commit()
+            logger.info(f"AI 평가 작업 종료 - job_id={job_id}, status={status}")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"평가 작업 종료 처리 실패 - job_id={job_id}: {e}")
+        finally:
+            db.close()
+
+
+evaluation_worker = EvaluationJobWorker()
@@ -0,0 +1,114 @@
+from typing import List, Dict, Any, Optional, Set
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.hashing import stable_hash
+from app.database.database import SessionLocal
+from app.models.interview_checkpoint import InterviewCheckpoint
+import logging
+
+logger = logging.getLogger(__name__)
+
+class InterviewCheckpointService:
+    """지원자 1명의 면접 진행 상황(업로드 결과, 질문별 대화)을 DB에 저장/복원
+
+    프로세스가 평가 도중 종료되어도 같은 공고·같은 질문 목록으로 재시작하면
+    완료된 질문과 완료된 지원자를 건너뛸 수 있도록 한다.
+    업로드/질문 단계 저장은 별도 세션으로 즉시 commit한다 (동시에 진행되는 질문들이 평가 세션을 공유하므로
+    한 질문의 commit/rollback이 다른 질문의 쓰기를 함께 확정하거나 되돌리지 않도록).
+    """
+
+    def __init__(self, db: Session, application_id, job_posting_id, questions: List[str]):
+        self.db = db
+        self.application_id = application_id
+        self.job_posting_id = job_posting_id
+        self.questions_hash = self.hash_questions(questions)
+
+    @staticmethod
+    def hash_questions(questions: List[str]) -> str:
+        return stable_hash(list(questions or []))
+
+    # --- 업로드(KB) 단계 ---
+    def load_upload(self) -> Optional[Dict[str, Any]]:
+        row = self._query('upload').first()
+        return row.payload if row else None
+
+    def save_upload(self, upload_outputs: Dict[str, Any]):
+        self._upsert('upload', 0, upload_outputs if isinstance(upload_outputs, dict) else {})
+
+    # --- 질문 단계 ---
+    def load_questions(self) -> Dict[int, List[Dict[str, Any]]]:
+        """완료된 질문의 message_history (question_number -> history)"""
+        rows = self._query('question').all()
+        return {row.question_number: row.payload for row in rows if row.payload is not None}
+
+    def save_question(self, question_number: int, message_history: List[Dict[str, Any]]):
+        self._upsert('question', question_number, message_history)
+
+    # --- 지원자 완료 ---
+    def mark_completed(self):
+        """지원자 평가 완료 표시. 평가 결과와 같은 트랜잭션에서 호출하며 commit은 호출자가 한다."""
+        (
+            self.db.query(InterviewCheckpoint)
+            .filter(InterviewCheckpoint.application_id == self.application_id)
+            .filter(InterviewCheckpoint.questions_hash == self.questions_hash)
+            .filter(InterviewCheckpoint.kind.in_(('upload', 'question')))
+            .delete(synchronize_session=False)
+        )
+        self.db.execute(self._upsert_stmt('completed', 0, None))
+
+    @staticmethod
+    def completed_application_ids(db: Session, job_posting_id, questions: List[str]) -> Set[Any]:
+        """같은 질문 목록으로 이미 평가가 끝난 지원서 id 목록"""
+        questions_hash = InterviewCheckpointService.hash_questions(questions)
+        rows = (
+            db.query(InterviewCheckpoint.application_id)
+            .filter(InterviewCheckpoint.job_posting_id == job_posting_id)
+            .filter(InterviewCheckpoint.questions_hash == questions_hash)
+            .filter(InterviewCheckpoint.kind == 'completed')
+            .all()
+        )
+        return {row.application_id for row in rows}
+
+    @staticmethod
+    def clear_posting(db: Session, job_posting_id) -> int:
+        """새 평가 시작 시 공고의 이전 체크포인트 삭제 (commit은 호출자가 한다)"""
+        return (
+            db.query(InterviewCheckpoint)
+            .filter(InterviewCheckpoint.job_posting_id == job_posting_id)
+            .delete(synchronize_session=False)
+        )
+
+    def _query(self, kind: str):
+        return (
+            self.db.query(InterviewCheckpoint)
+            .filter(InterviewCheckpoint.application_id == self.application_id)
+            .filter(InterviewCheckpoint.questions_hash == self.questions_hash)
+            .filter(InterviewCheckpoint.kind == kind)
+        )
+
+    def _upsert_stmt(self, kind: str, question_number: int, payload: Any):
+        stmt = pg_insert(InterviewCheckpoint).values(
+            application_id=self.application_id,
+            job_posting_id=self.job_posting_id,
+            questions_hash=self.questions_hash,
+            kind=kind,
+            question_number=question_number,
+            payload=payload,
+        )
+        return stmt.on_conflict_do_update(
+            constraint='uq_interview_checkpoint',
+            set_={"payload": stmt.excluded.payload},
+        )
+
+    def _upsert(self, kind: str, question_number: int, payload: Any):
+        db = SessionLocal()
+        try:
+            db.execute(self._upsert_stmt(kind, question_number, payload))
+            db.commit()
+        except Exception as e:
+            # 체크포인트 실패는 면접 진행을 막지 않음
+            db.rollback()
+            logger.warning(f"면접 체크포인트 저장 실패 (application_id={self.application_id}, kind={kind}): {e}")
+        finally:
+            db.close()
@@ -1,12 +1,16 @@
-from typing import List, Dict, Optional, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import List, Dict, Optional, Any, Callable
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, update, select, text, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from decimal import Decimal
+import asyncio
+import time
 import uuid
 
 from app.models.job_posting import JobPosting
 from app.models.application import Application
 from app.models.job_seeker import JobSeeker
+from app.models.user import User
 from app.models.ai_evaluation import AIEvaluation
 from app.models.ai_interview_message import AIInterviewMessage
 from app.models.ai_overall_report import AIOverallReport
@@ -14,7 +18,21 @@ from app.models.big5_test_result import Big5TestResult
 from app.models.ai_learning_question import AILearningQuestion
 from app.models.ai_learning_answer import AILearningAnswer
 from app.models.job_seeker_document import JobSeekerDocument
+from app.database.database import SessionLocal, MAX_APPLICANT_CONCURRENCY
+from app.core.config import settings
+from app.core.deadline import Deadline
 from app.services.interview_question_service import InterviewQuestionService
+from app.services.interview_checkpoint_service import InterviewCheckpointService
+from app.services.transcript_writer import InterviewTranscriptWriter
+from app.services.recruitment_status_query import RecruitmentStatusQuery
+from app.services.leaderboard_service import LeaderboardService
+from app.services import report_cache
+from app.core.response_cache import response_cache
+from app.services.evaluation_events import evaluation_events
+from app.services.evaluation_scheduler import evaluation_scheduler
+from app.services.evaluation_work_queue import EvaluationWorkQueue, TERMINAL_ITEM_STATUSES, HELD_ITEM_STATUS
+from app.core.hashing import stable_hash
+from app.core.metrics import metrics
 from app.services.lambda_bedrock_service import LambdaBedrockService
 import logging
 
@@ -29,8 +47,32 @@ class InterviewService:
     def __init__(self, db: Session):
         self.db = db
     
-    async def start_evaluation(self, job_posting_id: str, force: bool = False):
-        """AI 평가 프로세스 시작 (새로운 프로세스)"""
+    async def start_evaluation(
+        self,
+        job_posting_id: str,
+        force: bool = False,
+        max_concurrency: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, int]], Any]] = None,
+        resume: bool = False,
+        stop_requested: Optional[Callable[[], Optional[str]]] = None,
+    ):
+        """AI 평가 프로세스 시작 (새로운 프로세스)
+
+        force: True면 입력 지문이 같은 지원자도 모두 재평가 (False면 변경된 지원자만 평가)
+        max_concurrency: 이 공고에서 동시에 면접을 진행할 최대 지원자 수 (미지정 시 EVAL_MAX_CONCURRENCY, 최대 MAX_APPLICANT_CONCURRENCY).
+            실제 실행은 프로세스 전역 공정 분배 스케줄러(EVAL_GLOBAL_CONCURRENCY) 슬롯을 받은 뒤 시작한다
+        progress_callback: 지원자 처리 시마다 {total, processed, succeeded, failed}로 호출 (평가 작업 진행률 기록용)
+        resume: 중단된 평가 재시작 여부 - 같은 질문 목록으로 이미 끝난 지원자/질문은 체크포인트로 건너뜀
+
+        시간 예산: 공고 전체(EVAL_POSTING_BUDGET_SECONDS)와 지원자별(EVAL_APPLICANT_BUDGET_SECONDS) 중 먼저 끝나는 쪽까지.
+        공고 예산이 끝난 뒤 차례가 온 지원자는 실패로 기록한다.
+
+        stop_requested: 운영자 중지 요청 확인 ('cancel' / 'pause' / None 반환, EVAL_CONTROL_POLL_INTERVAL마다 호출)
+            - 중지 요청 후에는 대기 중인 지원자를 시작하지 않는다 (재시작 시 체크포인트로 이어서 진행)
+            - pause: 진행 중인 지원자는 끝까지 평가 / cancel: 진행 중인 지원자도 중단하고 DB 변경은 롤백
+            중지되면 결과에 stopped('cancel' 또는 'pause')가 포함된다.
+        """
+        posting_deadline = Deadline(settings.eval_posting_budget_seconds)
         try:
             # 1. 채용공고 조회
             posting = (
@@ -59,8 +101,9 @@ class InterviewService:
             self.db.refresh(posting)
             
             # 3. 지원자 목록 조회
+            # id만 조회 (commit 후에도 만료되지 않아 지원자별 재조회가 없음)
             applications = (
-                self.db.query(Application)
+                self.db.query(Application.id, Application.job_seeker_id)
                 .filter(Application.job_posting_id == job_posting_id)
                 .all()
             )
@@ -73,6 +116,9 @@ class InterviewService:
                 # 지원자가 없는 경우
                 posting.eval_status = 'finish'
                 self.db.commit()
+                if progress_callback:
+                    progress_callback({"total": 0, "processed": 0, "succeeded": 0, "failed": 0})
+                evaluation_events.publish(posting.id, 'evaluation_finished', {"total": 0, "evaluated_count": 0})
                 return {
                     "status": 200,
                     "success": True,
@@ -101,112 +147,203 @@ class InterviewService:
                 posting.interview_questions = questions
                 self.db.commit()
             
-            # 5. 각 지원자별로 aiqa_text 생성/DB 저장 처리
-            for application in applications:
+            # 5. 지원자 전원의 aiqa_text를 한 번에 생성/DB 저장 (변경된 행만 일괄 업데이트)
+            try:
+                with metrics.span("evaluation.aiqa_materialize"):
+                    self._materialize_aiqa_texts(applications)
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"aiqa_text 일괄 처리 실패 (기존 값으로 진행): {str(e)}")
+
+            # 6. 각 지원자별로 면접 진행 (지원자마다 독립 DB 세션, 동시 실행 수 제한)
+            limit = max(1, int(max_concurrency or settings.eval_max_concurrency or 1))
+            if limit > MAX_APPLICANT_CONCURRENCY:
+                # 지원자마다 DB 세션을 쓰므로 풀을 고갈시키지 않도록 제한 (이전에 등록된 작업/설정값 포함)
+                logger.warning(f"동시 평가 수 {limit} -> {MAX_APPLICANT_CONCURRENCY}로 제한 (DB 연결 풀 크기 기준)")
+                limit = MAX_APPLICANT_CONCURRENCY
+            semaphore = asyncio.Semaphore(limit)
+            application_ids = [app.id for app in applications]
+            posting_id = posting.id
+            total_apps = len(application_ids)
+
+            # 재시작이면 같은 질문 목록으로 평가가 끝난 지원자는 건너뛰고, 새 평가면 이전 체크포인트 삭제
+            if resume:
+                completed_ids = InterviewCheckpointService.completed_application_ids(self.db, posting_id, questions)
+            else:
+                completed_ids = set()
+                InterviewCheckpointService.clear_posting(self.db, posting_id)
+            pending_ids = [application_id for application_id in application_ids if application_id not in completed_ids]
+            if len(pending_ids) < total_apps:
+                logger.info(f"체크포인트 기준 평가 완료 지원자 {total_apps - len(pending_ids)}명 건너뜀 (resume)")
+
+            # 입력(지원자 텍스트, 질문, 스킬)이 지난 평가 이후 바뀌지 않은 지원자는 건너뜀 (force면 전원 재평가)
+            unchanged_count = 0
+            if not force:
+                unchanged_ids = self._unchanged_application_ids(applications, posting, questions)
+                before = len(pending_ids)
+                pending_ids = [application_id for application_id in pending_ids if application_id not in unchanged_ids]
+                unchanged_count = before - len(pending_ids)
+                if unchanged_count:
+                    logger.info(f"입력 변경 없는 지원자 {unchanged_count}명 재평가 건너뜀 (force=False)")
+            skipped_count = total_apps - len(pending_ids)
+
+            # 긴 면접 동안 공용 세션이 커넥션을 붙잡지 않도록 트랜잭션 종료
+            self.db.commit()
+            logger.info(f"면접 평가 시작: 총 지원자 {total_apps}명, 진행 대상 {len(pending_ids)}명 (동시 실행 {limit}명)")
+
+            progress = {"total": total_apps, "processed": skipped_count, "succeeded": skipped_count, "failed": 0}
+
+            def _report_progress():
+                if not progress_callback:
+                    return
                 try:
-                    job_seeker = (
-                        self.db.query(JobSeeker)
-                        .filter(JobSeeker.id == application.job_seeker_id)
-                        .first()
-                    )
-                    if not job_seeker:
-                        logger.warning(f"Job Seeker를 찾을 수 없음 - Application ID: {application.id}, Job Seeker ID: {application.job_seeker_id}")
-                        continue
-                    
-                    logger.info(f"지원자 {job_seeker.id} 처리 시작")
-                    logger.debug(f"Job Seeker 정보: ID={job_seeker.id}, Name={getattr(job_seeker, 'name', 'N/A')}")
-                    
-                    # 5-1. AI Q&A 텍스트 생성 및 DB 저장
+                    progress_callback(dict(progress))
+                except Exception as e:
+                    logger.warning(f"평가 진행률 기록 실패: {e}")
+
+            _report_progress()
+            evaluation_events.publish(posting_id, 'evaluation_started', {
+                **progress,
+                "pending": len(pending_ids),
+                "questions": len(questions),
+            })
+
+            def _record_result(application_id, ok: bool, error: Optional[str] = None):
+                progress["processed"] += 1
+                progress["succeeded" if ok else "failed"] += 1
+                _report_progress()
+                event_data = {"application_id": str(application_id), "progress": dict(progress)}
+                if not ok:
+                    event_data["error"] = error
+                evaluation_events.publish(posting_id, 'applicant_evaluated' if ok else 'applicant_failed', event_data)
+
+            stop = {"signal": None, "checked_at": 0.0}
+
+            def _stop_signal() -> Optional[str]:
+                """중지 요청 확인 (한 번 요청되면 유지, 확인 주기 제한)"""
+                if stop["signal"] or not stop_requested:
+                    return stop["signal"]
+                now = time.monotonic()
+                if now - stop["checked_at"] >= settings.eval_control_poll_interval:
+                    stop["checked_at"] = now
                     try:
-                        logger.debug(f"AI Q&A 조회 시작 - Job Seeker ID: {job_seeker.id} (type={type(job_seeker.id)})")
-                        
-                        ai_qnas = (
-                            self.db.query(AILearningQuestion, AILearningAnswer)
-                            .join(AILearningAnswer, AILearningAnswer.question_id == AILearningQuestion.id)
-                            .filter(AILearningAnswer.job_seeker_id == job_seeker.id)
-                            .order_by(AILearningQuestion.display_order, AILearningAnswer.response_date)
-                            .all()
-                        )
-                        logger.debug(f"AI Q&A 조회 결과: {len(ai_qnas)}개")
-                        
-                        qa_lines = []
-                        for question, answer in ai_qnas:
-                            q_text = (question.question_text or "").strip()
-                            a_text = (answer.answer_text or "").strip()
-                            if q_text and a_text:
-                                qa_lines.append(f"질문: {q_text}\n답변: {a_text}")
-                        
-                        aiqa_text = "\n\n".join(qa_lines) if qa_lines else ""
-                        logger.debug(f"생성된 aiqa_text 길이: {len(aiqa_text)}")
-                        
-                        existing_aiqa_text = getattr(job_seeker, "aiqa_text", None)
-                        logger.debug(f"기존 aiqa_text 길이: {len(existing_aiqa_text) if existing_aiqa_text else 0}")
-                        
-                        if aiqa_text != (existing_aiqa_text or ""):
-                            logger.debug(f"aiqa_text DB 저장 시작")
-                            job_seeker.aiqa_text = aiqa_text
-                            self.db.commit()
-                            self.db.refresh(job_seeker)
-                            logger.debug(f"aiqa_text DB 저장 완료 (길이: {len(job_seeker.aiqa_text or '')})")
-                        else:
-                            logger.debug(f"aiqa_text 저장 건너뜀 (변경 없음)")
-                            
+                        stop["signal"] = stop_requested()
                     except Exception as e:
-                        logger.warning(f"aiqa_text 생성 중 오류: {str(e)}")
-                        # 오류 시에도 기존 값 사용
-                        aiqa_text = getattr(job_seeker, "aiqa_text", None) or ""
-                    
-                    logger.info(f"지원자 {job_seeker.id} aiqa_text 처리 완료")
-                    
-                except Exception as e:
-                    logger.error(f"지원자 {application.id} aiqa_text 처리 실패: {str(e)}")
-                    continue
+                        logger.warning(f"평가 중지 요청 확인 실패: {e}")
+                    if stop["signal"]:
+                        logger.warning(f"평가 중지 요청 수신 ({stop['signal']}) - job_posting_id={posting_id}")
+                return stop["signal"]
 
-            # 6. 각 지원자별로 면접 진행
-            try:
-                logger.info("AIConversationService 초기화 시작")
-                AIConversationService = get_ai_conversation_service()
-                conversation_service = AIConversationService(self.db)
-                logger.info("AIConversationService 초기화 완료")
-            except Exception as e:
-                logger.error(f"AIConversationService 초기화 실패: {str(e)}")
-                raise Exception(f"AIConversationService 초기화 실패: {str(e)}")
-            
-            evaluated_count = 0
-            total_apps = len(applications)
-            logger.info(f"면접 평가 시작: 총 지원자 {total_apps}명")
+            company_id = posting.company_id
 
-            for idx, application in enumerate(applications, start=1):
+            def _admit(idx: int, application_id) -> Optional[bool]:
+                """슬롯을 받은 지원자를 평가할지 판단 (None: 중지 요청으로 미처리, False: 예산 초과로 실패 기록, True: 진행)"""
+                if _stop_signal():
+                    # 중지 요청 후 차례가 온 지원자는 처리하지 않음 (미처리)
+                    return None
+                if not posting_deadline.has(settings.eval_min_turn_seconds + settings.eval_facilitator_reserve_seconds):
+                    logger.warning(f"({idx}/{len(pending_ids)}) 공고 평가 시간 예산 초과 - Application ID: {application_id}")
+                    _record_result(application_id, False, "공고 평가 시간 예산 초과")
+                    return False
+                logger.info(f"({idx}/{len(pending_ids)}) 지원자 평가 시작 - Application ID: {application_id}")
+                evaluation_events.publish(posting_id, 'applicant_started', {"application_id": str(application_id)})
+                return True
+
+            def _record_failure(application_id, e: Exception):
+                # 개별 지원자 평가 실패는 전체 프로세스를 중단하지 않음
+                import traceback
+                logger.error(f"지원자 {application_id} 평가 실패: {str(e)}")
+                logger.error(f"지원자 {application_id} 평가 실패 - 상세 에러: {traceback.format_exc()}")
+                _record_result(application_id, False, str(e))
+
+            async def _run(idx: int, application_id) -> Optional[bool]:
+                # 공고별 한도 안에서, 다른 공고와 공정하게 전역 슬롯을 나눠 받음
+                async with semaphore, evaluation_scheduler.slot(posting_id, company_id, len(pending_ids)):
+                    admitted = _admit(idx, application_id)
+                    if not admitted:
+                        return admitted
+                    try:
+                        await self._evaluate_application_isolated(application_id, questions, posting_id, deadline=posting_deadline)
+                    except Exception as e:
+                        _record_failure(application_id, e)
+                        return False
+                    logger.info(f"({idx}/{len(pending_ids)}) 지원자 평가 완료 - Application ID: {application_id}")
+                    _record_result(application_id, True)
+                    return True
+
+            # 파이프라인 모드: 면접(1단계)을 마친 지원자는 슬롯을 반납하고, Facilitator 평가(2단계)는 별도 워커 수만큼 병렬 진행
+            # (공고별 워커 수 + 프로세스 전역 Facilitator 한도를 함께 따름)
+            # -> 앞 지원자의 Facilitator 호출 동안 다음 지원자의 면접이 시작된다
+            facilitator_workers = max(1, settings.eval_pipeline_facilitator_workers)
+            facilitator_slots = asyncio.Semaphore(facilitator_workers)
+            # 2단계 진입 한도(워커 + 대기열). 가득 차면 1단계 슬롯을 쥔 채 기다려 새 면접 시작을 늦춤 (backpressure)
+            facilitator_admission = asyncio.Semaphore(facilitator_workers + max(0, settings.eval_pipeline_queue_size))
+
+            async def _run_pipelined(idx: int, application_id) -> Optional[bool]:
+                async with semaphore, evaluation_scheduler.slot(posting_id, company_id, len(pending_ids)):
+                    admitted = _admit(idx, application_id)
+                    if not admitted:
+                        return admitted
+                    try:
+                        interview_state = await self._interview_application_isolated(
+                            application_id, questions, posting_id, deadline=posting_deadline
+                        )
+                    except Exception as e:
+                        _record_failure(application_id, e)
+                        return False
+                    if facilitator_admission.locked():
+                        metrics.increment("pipeline.backpressure")
+                    await facilitator_admission.acquire()
                 try:
-                    logger.info(f"({idx}/{total_apps}) 지원자 평가 시작 - Application ID: {application.id}")
-                    # _evaluate_application is now async to allow awaiting safely
-                    await self._evaluate_application(
-                        application, questions, conversation_service, posting
-                    )
-                    evaluated_count += 1
-                    logger.info(f"({idx}/{total_apps}) 지원자 평가 완료 - Application ID: {application.id}")
+                    async with facilitator_slots, evaluation_scheduler.facilitator_slot():
+                        await self._finish_application_isolated(application_id, questions, posting_id, interview_state)
                 except Exception as e:
-                    # 개별 지원자 평가 실패는 전체 프로세스를 중단하지 않음
-                    logger.error(f"지원자 {application.id} 평가 실패: {str(e)}")
-                    import traceback
-                    logger.error(f"지원자 {application.id} 평가 실패 - 상세 에러: {traceback.format_exc()}")
-                    continue
+                    _record_failure(application_id, e)
+                    return False
+                finally:
+                    facilitator_admission.release()
+                logger.info(f"({idx}/{len(pending_ids)}) 지원자 평가 완료 - Application ID: {application_id}")
+                _record_result(application_id, True)
+                return True
+
+            if settings.eval_queue_mode == 'distributed':
+                # 대기열에 넣고 여러 프로세스/노드의 워커가 나눠 실행하는 것을 기다림
+                succeeded = await self._evaluate_via_work_queue(
+                    posting_id, pending_ids, questions, resume, _record_result, stop_requested=_stop_signal
+                )
+            else:
+                run = _run_pipelined if settings.eval_pipeline_enabled else _run
+                succeeded = await self._run_until_stopped(
+                    [run(idx, application_id) for idx, application_id in enumerate(pending_ids, start=1)],
+                    _stop_signal,
+                )
+            evaluated_count = skipped_count + succeeded
+
+            stopped = _stop_signal()
+            if stopped:
+                return self._stopped_result(posting, stopped, progress, evaluated_count)
             
             # 8. 모든 평가 완료 후 상태 업데이트
             posting.eval_status = 'finish'
             self.db.commit()
+            evaluation_events.publish(posting_id, 'evaluation_finished', {
+                **progress,
+                "evaluated_count": evaluated_count,
+                "unchanged_count": unchanged_count,
+            })
             
             return {
                 "status": 200,
                 "success": True,
-                "message": f"AI 평가 완료! (지원자 {len(applications)}명, 평가 완료 {evaluated_count}명)",
+                "message": f"AI 평가 완료! (지원자 {len(applications)}명, 평가 완료 {evaluated_count}명, 변경 없어 건너뜀 {unchanged_count}명)",
                 "data": {
                     "job_posting_id": str(posting.id),
                     "title": posting.title,
                     "eval_status": posting.eval_status,
                     "questions_generated": len(questions),
                     "total_applications": len(applications),
-                    "evaluated_count": evaluated_count
+                    "evaluated_count": evaluated_count,
+                    "unchanged_count": unchanged_count,
                 }
             }
             
@@ -215,13 +352,291 @@ class InterviewService:
             import traceback
             logger.error(f"AI 평가 시작 중 전체 오류 발생: {str(e)}")
             logger.error(f"AI 평가 시작 중 전체 오류 - 상세 traceback: {traceback.format_exc()}")
+            evaluation_events.publish(job_posting_id, 'evaluation_failed', {"error": str(e)})
             return {
                 "status": 500,
                 "success": False,
                 "message": f"AI 평가 시작 중 오류가 발생했습니다: {str(e)}"
             }
     
-    async def _evaluate_application(self, application: Application, questions: list, conversation_service: Any, job_posting: JobPosting):
+    @staticmethod
+    async def _run_until_stopped(coroutines: list, stop_signal: Callable[[], Optional[str]]) -> int:
+        """지원자 평가 코루틴들을 실행하고 성공 수 반환
+
+        취소(cancel) 요청이 오면 진행 중인 평가 태스크를 취소한다. 지원자별 DB 세션은 commit 전에
+        닫히므로 평가 결과는 저장되지 않는다(롤백).
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coroutines]
+        try:
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(pending, timeout=settings.eval_control_poll_interval)
+                if pending and stop_signal() == 'cancel':
+                    logger.warning(f"평가 취소 - 진행 중인 지원자 평가 {len(pending)}건 중단")
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    break
+        except asyncio.CancelledError:
+            # 상위 작업이 취소되면(서버 종료 등) 지원자 평가도 함께 취소
+            for task in tasks:
+                task.cancel()
+            raise
+        return sum(1 for task in tasks if not task.cancelled() and task.exception() is None and task.result())
+
+    def _stopped_result(self, posting: JobPosting, stopped: str, progress: Dict[str, int], evaluated_count: int) -> Dict[str, Any]:
+        """운영자 요청으로 중지된 평가의 상태 정리 및 응답"""
+        cancelled = stopped == 'cancel'
+        # 취소면 다시 시작할 수 있게 'ready'로, 일시정지면 재개 대기 중이므로 'ing' 유지
+        posting.eval_status = 'ready' if cancelled else 'ing'
+        self.db.commit()
+        remaining = progress["total"] - progress["processed"]
+        label = "취소" if cancelled else "일시정지"
+        logger.info(f"AI 평가 {label} - job_posting_id={posting.id}, 처리 {progress['processed']}/{progress['total']}명")
+        evaluation_events.publish(posting.id, 'evaluation_cancelled' if cancelled else 'evaluation_paused', {
+            **progress,
+            "remaining": remaining,
+        })
+        return {
+            "status": 200,
+            "success": True,
+            "stopped": stopped,
+            "message": f"AI 평가 {label} (지원자 {progress['total']}명 중 {progress['processed']}명 처리, 미처리 {remaining}명)",
+            "data": {
+                "job_posting_id": str(posting.id),
+                "title": posting.title,
+                "eval_status": posting.eval_status,
+                "total_applications": progress["total"],
+                "evaluated_count": evaluated_count,
+                "remaining_count": remaining,
+            }
+        }
+
+    def _materialize_aiqa_texts(self, applications: list) -> int:
+        """공고 지원자 전원의 AI Q&A를 한 번에 조회해 aiqa_text를 만들고, 바뀐 행만 일괄 저장
+
+        조회 2회 + 일괄 UPDATE 1회 + commit 1회로 지원자 수와 무관하게 처리한다. 반환값은 갱신된 지원자 수.
+        """
+        seeker_ids = {app.job_seeker_id for app in applications}
+        if not seeker_ids:
+            return 0
+
+        existing = dict(
+            self.db.query(JobSeeker.id, JobSeeker.aiqa_text)
+            .filter(JobSeeker.id.in_(seeker_ids))
+            .all()
+        )
+        missing = seeker_ids - set(existing)
+        if missing:
+            logger.warning(f"Job Seeker를 찾을 수 없음 - Job Seeker IDs: {[str(sid) for sid in missing]}")
+
+        qa_rows = (
+            self.db.query(AILearningAnswer.job_seeker_id, AILearningQuestion.question_text, AILearningAnswer.answer_text)
+            .join(AILearningQuestion, AILearningAnswer.question_id == AILearningQuestion.id)
+            .filter(AILearningAnswer.job_seeker_id.in_(existing.keys()))
+            .order_by(AILearningAnswer.job_seeker_id, AILearningQuestion.display_order, AILearningAnswer.response_date)
+            .all()
+        )
+        qa_lines: Dict[Any, List[str]] = {seeker_id: [] for seeker_id in existing}
+        for seeker_id, question_text, answer_text in qa_rows:
+            q_text = (question_text or "").strip()
+            a_text = (answer_text or "").strip()
+            if q_text and a_text:
+                qa_lines[seeker_id].append(f"질문: {q_text}\n답변: {a_text}")
+
+        changed = []
+        for seeker_id, lines in qa_lines.items():
+            aiqa_text = "\n\n".join(lines)
+            if aiqa_text != (existing[seeker_id] or ""):
+                changed.append({"id": seeker_id, "aiqa_text": aiqa_text})
+
+        if changed:
+            # 기본키 기준 ORM 일괄 UPDATE (executemany)
+            self.db.execute(update(JobSeeker), changed)
+        self.db.commit()
+        logger.info(f"aiqa_text 처리 완료 - 지원자 {len(existing)}명 중 {len(changed)}명 갱신")
+        return len(changed)
+
+    @staticmethod
+    def _input_fingerprint(job_seeker: JobSeeker, job_posting: JobPosting, questions: list) -> str:
+        """평가 입력 지문 - 이 값이 같으면 재평가해도 같은 입력으로 면접하게 된다"""
+        return stable_hash({
+            "full_text": job_seeker.full_text or "",
+            "behavior_text": job_seeker.behavior_text or "",
+            "big5_text": job_seeker.big5_text or "",
+            "aiqa_text": job_seeker.aiqa_text or "",
+            "interview_questions": list(questions or []),
+            "hard_skills": job_posting.hard_skills or [],
+            "soft_skills": job_posting.soft_skills or [],
+        })
+
+    def _unchanged_application_ids(self, applications: list, job_posting: JobPosting, questions: list) -> set:
+        """최신 AIEvaluation의 입력 지문이 현재 입력과 같은 지원서 id 목록"""
+        application_ids = [app.id for app in applications]
+        if not application_ids:
+            return set()
+
+        latest_fingerprints: Dict[Any, Any] = {}
+        eval_rows = (
+            self.db.query(AIEvaluation.application_id, AIEvaluation.input_fingerprint)
+            .filter(AIEvaluation.application_id.in_(application_ids))
+            .order_by(AIEvaluation.created_at.asc())
+            .all()
+        )
+        for row in eval_rows:
+            latest_fingerprints[row.application_id] = row.input_fingerprint  # 마지막(최신) 값이 남음
+        if not any(latest_fingerprints.values()):
+            return set()
+
+        seeker_ids = {app.job_seeker_id for app in applications}
+        seekers = {js.id: js for js in self.db.query(JobSeeker).filter(JobSeeker.id.in_(seeker_ids)).all()}
+
+        unchanged = set()
+        for app in applications:
+            stored = latest_fingerprints.get(app.id)
+            job_seeker = seekers.get(app.job_seeker_id)
+            if stored and job_seeker and stored == self._input_fingerprint(job_seeker, job_posting, questions):
+                unchanged.add(app.id)
+        return unchanged
+
+    async def _evaluate_via_work_queue(
+        self,
+        job_posting_id,
+        application_ids: list,
+        questions: list,
+        resume: bool,
+        on_result: Callable[[Any, bool, Optional[str]], None],
+        stop_requested: Optional[Callable[[], Optional[str]]] = None,
+    ) -> int:
+        """지원자들을 evaluation_work_items 대기열에 넣고 모두 끝날 때까지 기다림 (성공 수 반환)
+
+        실제 평가는 EvaluationQueueWorker(이 프로세스 또는 다른 노드)가 수행한다.
+        재시작(resume)이면 이전 실행에서 남은 항목을 그대로 이어받는다.
+        중지 요청이 오면 대기 항목을 보류(held)하고, 이미 워커가 실행 중인 항목이 끝나기를 기다린다.
+        """
+        if not application_ids:
+            return 0
+        queue = EvaluationWorkQueue(self.db)
+        queue.enqueue(job_posting_id, application_ids, questions, reset=not resume)
+        if settings.eval_queue_local_consumer:
+            from app.services.evaluation_queue_worker import evaluation_queue_worker
+            evaluation_queue_worker.notify()
+
+        done: Dict[Any, bool] = {}
+        held = set()
+        while len(done) + len(held) < len(application_ids):
+            if stop_requested and stop_requested():
+                # 실패 후 재대기열에 들어간 항목도 보류되도록 매 주기 실행
+                queue.hold(job_posting_id)
+            statuses = queue.statuses(job_posting_id, application_ids)
+            held = {application_id for application_id, item in statuses.items() if item["status"] == HELD_ITEM_STATUS}
+            for application_id in application_ids:
+                if application_id in done or application_id in held:
+                    continue
+                item = statuses.get(application_id)
+                if item is None:
+                    # 다른 실행이 공고 대기열을 초기화한 경우
+                    done[application_id] = False
+                    on_result(application_id, False, "평가 대기열 항목이 사라졌습니다")
+                elif item["status"] in TERMINAL_ITEM_STATUSES:
+                    ok = item["status"] == 'succeeded'
+                    done[application_id] = ok
+                    on_result(application_id, ok, None if ok else item.get("last_error"))
+            if len(done) + len(held) < len(application_ids):
+                await asyncio.sleep(settings.eval_queue_poll_interval)
+        return sum(1 for ok in done.values() if ok)
+
+    async def _evaluate_application_isolated(self, application_id, questions: list, job_posting_id, deadline: Optional[Deadline] = None):
+        """지원자 1명을 전용 DB 세션에서 평가 (동시 평가 시 세션 공유 방지)
+
+        deadline(공고 예산) 안에서 지원자별 예산 EVAL_APPLICANT_BUDGET_SECONDS를 적용한다.
+        """
+        applicant_deadline = (deadline or Deadline.unlimited()).child(settings.eval_applicant_budget_seconds)
+        db = SessionLocal()
+        try:
+            application, job_posting = self._load_application(db, application_id, job_posting_id)
+            AIConversationService = get_ai_conversation_service()
+            conversation_service = AIConversationService(db)
+            checkpoint = InterviewCheckpointService(db, application.id, job_posting_id, questions)
+            with metrics.span("evaluation.applicant", application_id=str(application_id)):
+                await InterviewService(db)._evaluate_application(
+                    application, questions, conversation_service, job_posting,
+                    checkpoint=checkpoint, deadline=applicant_deadline,
+                )
+        finally:
+            db.close()
+
+    async def _interview_application_isolated(self, application_id, questions: list, job_posting_id, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """파이프라인 1단계 - 전용 DB 세션에서 면접(KB 업로드 + 질문 왕복)까지만 진행하고 2단계로 넘길 상태 반환"""
+        applicant_deadline = (deadline or Deadline.unlimited()).child(settings.eval_applicant_budget_seconds)
+        db = SessionLocal()
+        try:
+            application, job_posting = self._load_application(db, application_id, job_posting_id)
+            job_seeker = db.query(JobSeeker).filter(JobSeeker.id == application.job_seeker_id).first()
+            if not job_seeker:
+                raise Exception(f"지원자 정보를 찾을 수 없습니다: {application.job_seeker_id}")
+            AIConversationService = get_ai_conversation_service()
+            conversation_service = AIConversationService(db)
+            checkpoint = InterviewCheckpointService(db, application.id, job_posting_id, questions)
+            # 면접 시작 시점의 입력 지문 (2단계에서 저장)
+            input_fingerprint = self._input_fingerprint(job_seeker, job_posting, questions)
+            with metrics.span("pipeline.interview_stage"):
+                state = await conversation_service.interview_stage(
+                    questions, job_seeker,
+                    {"hard_skills": job_posting.hard_skills or [], "soft_skills": job_posting.soft_skills or []},
+                    job_posting_id=str(job_posting.id),
+                    checkpoint=checkpoint,
+                    on_question_done=self._question_done_callback(job_posting.id, application.id, len(questions)),
+                    deadline=applicant_deadline,
+                )
+            state["input_fingerprint"] = input_fingerprint
+            return state
+        finally:
+            db.close()
+
+    async def _finish_application_isolated(self, application_id, questions: list, job_posting_id, interview_state: Dict[str, Any]):
+        """파이프라인 2단계 - 새 DB 세션에서 Facilitator 평가 + 결과 저장"""
+        db = SessionLocal()
+        try:
+            application, job_posting = self._load_application(db, application_id, job_posting_id)
+            AIConversationService = get_ai_conversation_service()
+            conversation_service = AIConversationService(db)
+            checkpoint = InterviewCheckpointService(db, application.id, job_posting_id, questions)
+            with metrics.span("pipeline.facilitator_stage"):
+                await InterviewService(db)._evaluate_application(
+                    application, questions, conversation_service, job_posting,
+                    checkpoint=checkpoint, interview_state=interview_state,
+                )
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load_application(db: Session, application_id, job_posting_id):
+        application = db.query(Application).filter(Application.id == application_id).first()
+        if not application:
+            raise Exception(f"지원서를 찾을 수 없습니다: {application_id}")
+        job_posting = db.query(JobPosting).filter(JobPosting.id == job_posting_id).first()
+        return application, job_posting
+
+    @staticmethod
+    def _question_done_callback(job_posting_id, application_id, total_questions: int) -> Callable[[int], None]:
+        return lambda question_number: evaluation_events.publish(job_posting_id, 'question_done', {
+            "application_id": str(application_id),
+            "question_number": question_number,
+            "total_questions": total_questions,
+        })
+
+    async def _evaluate_application(
+        self,
+        application: Application,
+        questions: list,
+        conversation_service: Any,
+        job_posting: JobPosting,
+        checkpoint: Optional[InterviewCheckpointService] = None,
+        deadline: Optional[Deadline] = None,
+        interview_state: Optional[Dict[str, Any]] = None,
+    ):
+        """면접 진행 + 결과 저장. interview_state가 있으면(파이프라인 2단계) 면접은 끝난 것으로 보고 Facilitator 평가부터 진행"""
         try:
             hard_skills = job_posting.hard_skills or []
             soft_skills = job_posting.soft_skills or []
@@ -238,16 +653,34 @@ class InterviewService:
             # 2. 면접 대화 진행
             if not job_posting:
                 raise Exception(f"Job posting 정보를 찾을 수 없습니다: {application.job_posting_id}")
+            # 면접 시작 시점의 입력 지문 (재실행 시 변경 여부 판단용)
+            input_fingerprint = (
+                interview_state.get("input_fingerprint") if interview_state is not None
+                else self._input_fingerprint(job_seeker, job_posting, questions)
+            )
             job_posting_skills = {
                 "hard_skills": job_posting.hard_skills or [],
                 "soft_skills": job_posting.soft_skills or []
             }
-            # 1) conduct_interview now synchronous and performs upload
-            interview_result = conversation_service.conduct_interview(questions, job_seeker, job_posting_skills, job_posting_id=str(job_posting.id))
+            if interview_state is not None:
+                interview_result = conversation_service.facilitator_stage(interview_state)
+            else:
+                # 1) conduct_interview now synchronous and performs upload
+                interview_result = conversation_service.conduct_interview(
+                    questions, job_seeker, job_posting_skills, job_posting_id=str(job_posting.id), checkpoint=checkpoint,
+                    on_question_done=self._question_done_callback(job_posting.id, application.id, len(questions)),
+                    deadline=deadline,
+                )
             # Defensive: if the service returned a coroutine/awaitable, await it
             if hasattr(interview_result, '__await__'):
-                interview_result = await interview_result
+                if interview_state is not None:
+                    # 파이프라인 2단계 - 소요 시간은 pipeline.facilitator_stage로 기록됨
+                    interview_result = await interview_result
+                else:
+                    with metrics.span("interview.total"):
+                        interview_result = await interview_result
             conversations = interview_result.get('conversations', [])
+            is_partial = bool(interview_result.get('partial'))
             # If conduct_interview didn't include facilitator evaluation, call evaluate_with_facilitator
             evaluation_result = interview_result.get('evaluation', {})
             if not evaluation_result:
@@ -279,8 +712,16 @@ class InterviewService:
                 except Exception as e:
                     logger.error(f"Facilitator 평가 중 오류: {e}")
                     evaluation_result = {}
+            # 부분 결과, 빈 평가 결과, Lambda 호출 오류 턴이 있는 결과는 온전하지 않음
+            # (체크포인트 save_question과 같은 기준) -> 다음 실행에서 다시 평가되도록 지문/완료 표시를 남기지 않음
+            is_clean = not is_partial and bool(evaluation_result) and not any(
+                isinstance(c, dict) and c.get('type') == 'error' for c in conversations
+            )
+            if not is_clean:
+                input_fingerprint = None
             
             # 4. AIEvaluation 테이블 업서트(있으면 업데이트, 없으면 생성)
+            db_write_started = time.perf_counter()
             existing_ai_evaluation = (
                 self.db.query(AIEvaluation)
                 .filter(AIEvaluation.application_id == application.id)
@@ -334,6 +775,8 @@ class InterviewService:
                 existing_ai_evaluation.final_opinion = final_opinion
                 existing_ai_evaluation.highlight = highlight_text
                 existing_ai_evaluation.highlight_reason = highlight_reason
+                existing_ai_evaluation.input_fingerprint = input_fingerprint
+                existing_ai_evaluation.is_partial = is_partial
                 # 재평가 시점으로 타임스탬프 갱신
                 existing_ai_evaluation.created_at = func.now()
             else:
@@ -357,52 +800,32 @@ class InterviewService:
                     final_opinion=final_opinion,
                     highlight=highlight_text,
                     highlight_reason=highlight_reason,
+                    input_fingerprint=input_fingerprint,
+                    is_partial=is_partial,
                 )
                 self.db.add(ai_evaluation)
 
-            # 4.5 ai_interview_messages 테이블에 대화 저장
+            # 4.5 ai_interview_messages 테이블에 대화 저장 (기존 메시지 삭제 후 일괄 INSERT)
             try:
-                # 기존 메시지 제거(중복 삽입 방지)
-                self.db.query(AIInterviewMessage).filter(AIInterviewMessage.application_id == application.id).delete()
-                # conversations는 conduct_interview에서 전달된 message list
-                for conv in (conversations or []):
-                    try:
-                        # 일부 소스(conduct_interview)에서는 'role' 키만 존재하므로 fallback 처리
-                        sender_raw = (conv.get('sender') or conv.get('role') or '').lower()
-                        if sender_raw in ('interviewer','interviewer_ai','facilitator','reviewer'):
-                            sender = 'interviewer_ai'
-                        elif sender_raw in ('applicant','candidate','candidate_ai','user','answer'):
-                            sender = 'candidate_ai'
-                        elif sender_raw in ('system','notice','error','question'):
-                            # 시스템/질문 메시지는 면접관 측으로 분류 (별도 enum 추가 전 임시 정책)
-                            sender = 'interviewer_ai'
-                        else:
-                            # 미지정 값 기본 지원자 측
-                            sender = 'candidate_ai'
-                        message_type = conv.get('message_type') or 'other'
-                        content = conv.get('content') or ''
-                        turn_number = conv.get('turn_number') or conv.get('question_number') or 0
-                        highlight_turns = conv.get('highlight_turns') or conv.get('highlight_turns')
-
-                        msg = AIInterviewMessage(
-                            application_id=application.id,
-                            sender=sender,
-                            message_type=message_type,
-                            content=content,
-                            turn_number=turn_number,
-                            highlight_turns=highlight_turns,
-                        )
-                        self.db.add(msg)
-                    except Exception as e:
-                        logger.warning(f"AIInterviewMessage 생성 중 개별 오류: {e}")
+                with metrics.span("evaluation.transcript_write"):
+                    saved = InterviewTranscriptWriter(self.db).replace(application.id, conversations)
+                logger.debug(f"면접 대화 {saved}건 저장 - Application ID: {application.id}")
             except Exception as e:
                 logger.warning(f"ai_interview_messages 저장 중 오류: {e}")
             
             # 5. 지원서 상태 업데이트
             application.application_status = 'ai_evaluated'
             application.evaluated_at = func.now()
+
+            # 평가 결과와 같은 트랜잭션에서 완료 체크포인트 기록 (재시작 시 건너뛰기용)
+            if checkpoint and is_clean:
+                checkpoint.mark_completed()
+
+            # 같은 트랜잭션에서 공고 순위표 갱신
+            LeaderboardService(self.db).refresh_application(application)
             
             self.db.commit()
+            metrics.observe("evaluation.db_write", time.perf_counter() - db_write_started)
             
             print(f"✅ 지원자 {job_seeker.full_name} 평가 완료")
             
@@ -410,8 +833,29 @@ class InterviewService:
             self.db.rollback()
             raise Exception(f"지원자 평가 중 오류: {str(e)}")
     
-    def get_recruitment_status(self, job_posting_id: str):
-        """채용현황 조회 (공고 정보, 지원 목록, 카운트)"""
+    def get_recruitment_status(
+        self,
+        job_posting_id: str,
+        sort: str = 'applied_at',
+        order: str = 'desc',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """채용현황 조회 (공고 정보, 지원 목록, 카운트)
+
+        지원 목록은 sort(applied_at/rank/total_score/hard_score/soft_score), order 기준 서버 정렬.
+        limit을 주면 keyset 페이지네이션 (다음 페이지는 응답의 page.next_cursor를 cursor로 전달), 없으면 전체.
+        응답은 공고 단위로 캐시되고 공고/지원서/평가가 바뀌면 무효화된다.
+        """
+        return response_cache.get_or_load(
+            report_cache.RECRUITMENT_STATUS,
+            f"{job_posting_id}:{sort}:{order}:{limit}:{cursor}",
+            lambda: self._build_recruitment_status(job_posting_id, sort, order, limit, cursor),
+            tags=report_cache.response_tags,
+            cacheable=report_cache.is_success,
+        )
+
+    def _build_recruitment_status(self, job_posting_id: str, sort: str, order: str, limit: Optional[int], cursor: Optional[str]):
         # 공고 존재 확인
         posting = (
             self.db.query(JobPosting)
@@ -421,68 +865,22 @@ class InterviewService:
         if not posting:
             return {"status": 404, "success": False, "message": "채용공고를 찾을 수 없습니다"}
 
-        # 지원 목록 조인 조회 - 중복 방지를 위해 서브쿼리로 최신 application만 선택
-        # 각 job_seeker별로 최신 application만 선택하는 서브쿼리
-        latest_applications = (
-            self.db.query(
-                Application.job_seeker_id,
-                func.max(Application.applied_at).label('latest_applied_at')
-            )
-            .filter(Application.job_posting_id == job_posting_id)
-            .group_by(Application.job_seeker_id)
-            .subquery()
-        )
-        
-        rows = (
-            self.db.query(
-                Application.id.label("application_id"),
-                JobSeeker.user_id.label("user_id"),
-                JobSeeker.full_name.label("candidate_name"),
-                Application.applied_at.label("applied_at"),
-                Application.application_status.label("stage"),
-                Application.evaluated_at.label("evaluated_at"),
-            )
-            .join(JobSeeker, JobSeeker.id == Application.job_seeker_id)
-            .join(latest_applications, 
-                  (Application.job_seeker_id == latest_applications.c.job_seeker_id) & 
-                  (Application.applied_at == latest_applications.c.latest_applied_at))
-            .filter(Application.job_posting_id == job_posting_id)
-            .order_by(Application.applied_at.desc())
-            .all()
-        )
+        # 지원 목록 - 순위표(applicant_rankings)에서 한 번의 쿼리로 조회 (비어 있으면 먼저 채움)
+        LeaderboardService(self.db).ensure_posting(posting.id)
+        status_query = RecruitmentStatusQuery(self.db)
+        try:
+            page = status_query.page(posting.id, sort=sort, order=order, limit=limit, cursor=cursor)
+        except ValueError as e:
+            return {"status": 400, "success": False, "message": str(e)}
 
         applications = []
-        for r in rows:
-            # 각 application에 대한 최신 AI evaluation 조회
-            latest_eval = (
-                self.db.query(AIEvaluation)
-                .filter(AIEvaluation.application_id == r.application_id)
-                .order_by(AIEvaluation.created_at.desc())
-                .first()
-            )
-            
+        for r in page["rows"]:
             overall_score_val = None
-            hard_score_val = None
-            soft_score_val = None
-            ai_summary_val = None
-            
-            if latest_eval:
-                if latest_eval.total_score is not None:
-                    try:
-                        overall_score_val = int(Decimal(latest_eval.total_score))
-                    except Exception:
-                        overall_score_val = float(latest_eval.total_score)
-                if latest_eval.hard_score is not None:
-                    try:
-                        hard_score_val = float(latest_eval.hard_score)
-                    except Exception:
-                        hard_score_val = None
-                if latest_eval.soft_score is not None:
-                    try:
-                        soft_score_val = float(latest_eval.soft_score)
-                    except Exception:
-                        soft_score_val = None
-                ai_summary_val = latest_eval.ai_summary
+            if r.total_score is not None:
+                try:
+                    overall_score_val = int(Decimal(r.total_score))
+                except Exception:
+                    overall_score_val = float(r.total_score)
 
             applications.append({
                 "applications_id": str(r.application_id),
@@ -491,17 +889,20 @@ class InterviewService:
                 "applied_at": r.applied_at.isoformat() if r.applied_at else None,
                 "stage": r.stage,
                 "overall_score": overall_score_val,
-                "hard_score": hard_score_val,
-                "soft_score": soft_score_val,
-                "ai_summary": ai_summary_val,
+                "hard_score": float(r.hard_score) if r.hard_score is not None else None,
+                "soft_score": float(r.soft_score) if r.soft_score is not None else None,
+                "ai_summary": r.ai_summary,
+                "is_partial": bool(r.is_partial),
+                "rank": r.rank,
                 "evaluated_at": r.evaluated_at.isoformat() if r.evaluated_at else None,
             })
 
-        # 카운트 집계
-        total = len(applications)
-        interviewed = sum(1 for a in applications if a.get("stage") in ("interviewed", "ai_evaluated"))
-        offered = sum(1 for a in applications if a.get("stage") == "offered")
-        rejected = sum(1 for a in applications if a.get("stage") == "rejected")
+        # 카운트 집계 (페이지와 무관하게 공고 전체 기준)
+        stage_counts = status_query.stage_counts(posting.id)
+        total = sum(stage_counts.values())
+        interviewed = sum(stage_counts.get(stage, 0) for stage in ("interviewed", "ai_evaluated"))
+        offered = stage_counts.get("offered", 0)
+        rejected = stage_counts.get("rejected", 0)
 
         # 공고별 AI 전체 리포트 조회
         report = (
@@ -548,6 +949,13 @@ class InterviewService:
                     "offered": offered,
                     "rejected": rejected,
                 },
+                "page": {
+                    "sort": sort,
+                    "order": order,
+                    "limit": limit,
+                    "next_cursor": page["next_cursor"],
+                    "has_more": page["has_more"],
+                },
             },
         }
 
@@ -556,54 +964,109 @@ class InterviewService:
 
         프론트 요청 경로: /company/interviews/report/{applications_id}
         요구사항: applications_id -> Application -> job_seeker_id -> JobSeeker.full_name
+        응답은 캐시되고 지원서/평가/지원자/공고가 바뀌면 무효화된다.
         """
-        # application 조회
-        application = (
-            self.db.query(Application)
-            .filter(Application.id == application_id)
-            .first()
+        return response_cache.get_or_load(
+            report_cache.INDIVIDUAL_REPORT,
+            str(application_id),
+            lambda: self._build_individual_report_by_application(application_id),
+            tags=report_cache.response_tags,
+            cacheable=report_cache.is_success,
         )
-        if not application:
+
+    def _build_individual_report_by_application(self, application_id: str):
+        """개별 리포트 조립 - 지원서/지원자/공고/최신 AI 평가/대화를 한 번의 쿼리로 조회"""
+        try:
+            application_uuid = uuid.UUID(str(application_id))
+        except ValueError:
             return {"status": 404, "success": False, "message": "지원서를 찾을 수 없습니다"}
 
-        # job_seeker 조회
-        job_seeker = (
-            self.db.query(JobSeeker)
-            .filter(JobSeeker.id == application.job_seeker_id)
+        # 지원서별 최신 AI 평가 1건 (LATERAL)
+        latest_eval = aliased(
+            AIEvaluation,
+            select(AIEvaluation)
+            .where(AIEvaluation.application_id == Application.id)
+            .order_by(AIEvaluation.created_at.desc())
+            .limit(1)
+            .lateral("latest_evaluation"),
+            name="latest_evaluation",
+        )
+        # 전체 대화를 Postgres에서 JSON 배열로 집계
+        messages_json = (
+            select(func.coalesce(
+                func.json_agg(aggregate_order_by(
+                    func.json_build_object(
+                        'id', AIInterviewMessage.id,
+                        'sender', AIInterviewMessage.sender,
+                        'message_type', AIInterviewMessage.message_type,
+                        'content', AIInterviewMessage.content,
+                        'turn_number', AIInterviewMessage.turn_number,
+                        'highlight_turns', AIInterviewMessage.highlight_turns,
+                    ),
+                    AIInterviewMessage.turn_number.asc(),
+                )),
+                text("'[]'::json"),
+            ))
+            .where(AIInterviewMessage.application_id == Application.id)
+            .scalar_subquery()
+        )
+        row = (
+            self.db.query(
+                Application.id.label("application_id"),
+                Application.job_posting_id,
+                Application.job_seeker_id,
+                JobSeeker.id.label("found_job_seeker_id"),
+                JobSeeker.full_name,
+                User.email.label("user_email"),
+                JobPosting.id.label("found_job_posting_id"),
+                JobPosting.hard_skills,
+                JobPosting.soft_skills,
+                latest_eval,
+                messages_json.label("messages"),
+            )
+            .outerjoin(JobSeeker, JobSeeker.id == Application.job_seeker_id)
+            .outerjoin(User, User.id == JobSeeker.user_id)
+            .outerjoin(JobPosting, JobPosting.id == Application.job_posting_id)
+            .outerjoin(latest_eval, true())
+            .filter(Application.id == application_uuid)
             .first()
         )
-        if not job_seeker:
+        if not row:
+            return {"status": 404, "success": False, "message": "지원서를 찾을 수 없습니다"}
+        if row.found_job_seeker_id is None:
             return {"status": 404, "success": False, "message": "지원자를 찾을 수 없습니다"}
 
-        full_name = job_seeker.full_name
+        full_name = row.full_name
         # full_name 없으면 이메일 로컬 파트 대체
-        if not full_name and getattr(job_seeker, "user", None) and getattr(job_seeker.user, "email", None):
+        if not full_name and row.user_email:
             try:
-                full_name = job_seeker.user.email.split("@", 1)[0]
+                full_name = row.user_email.split("@", 1)[0]
             except Exception:
                 full_name = None
 
-        # job_posting 조회 및 스킬 추출
-        job_posting = (
-            self.db.query(JobPosting)
-            .filter(JobPosting.id == application.job_posting_id)
-            .first()
-        )
-        if job_posting:
-            hard_skills = job_posting.hard_skills or []
-            soft_skills = job_posting.soft_skills or []
-        else:
-            hard_skills = []
-            soft_skills = []
-
-        # ai_evaluations 조회 (해당 application의 최신 평가 1건)
-        ai_eval_row = (
-            self.db.query(AIEvaluation)
-            .filter(AIEvaluation.application_id == application.id)
-            .order_by(AIEvaluation.created_at.desc())
-            .first()
+        return self._format_individual_report(
+            application_id=row.application_id,
+            job_posting_id=row.job_posting_id,
+            job_seeker_id=row.job_seeker_id,
+            full_name=full_name,
+            hard_skills=(row.hard_skills or []) if row.found_job_posting_id else [],
+            soft_skills=(row.soft_skills or []) if row.found_job_posting_id else [],
+            ai_eval_row=row.latest_evaluation,
+            messages=row.messages or [],
         )
 
+    @staticmethod
+    def _format_individual_report(
+        application_id,
+        job_posting_id,
+        job_seeker_id,
+        full_name: Optional[str],
+        hard_skills: list,
+        soft_skills: list,
+        ai_eval_row: Optional[AIEvaluation],
+        messages: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """개별 리포트 응답 구성 (messages는 id/sender/message_type/content/turn_number/highlight_turns dict 목록)"""
         ai_evaluation = None
         if ai_eval_row:
             # Decimal -> float 변환 및 직렬화 가능한 형태로 변환
@@ -637,6 +1100,7 @@ class InterviewService:
                 "soft_score": _to_float(ai_eval_row.soft_score),
                 "total_score": _to_float(ai_eval_row.total_score),
                 "ai_summary": ai_eval_row.ai_summary,
+                "is_partial": bool(ai_eval_row.is_partial),
                 "hard_detail_scores": ai_eval_row.hard_detail_scores,
                 "soft_detail_scores": ai_eval_row.soft_detail_scores,
                 "highlight": _to_str(ai_eval_row.highlight),
@@ -653,25 +1117,17 @@ class InterviewService:
                 "final_opinion": ai_eval_row.final_opinion,
                 "created_at": ai_eval_row.created_at.isoformat() if getattr(ai_eval_row, "created_at", None) else None,
             }
-        # ai_interview_messages 조회 (전체 대화)
-        messages = (
-            self.db.query(AIInterviewMessage)
-            .filter(AIInterviewMessage.application_id == application.id)
-            .order_by(AIInterviewMessage.turn_number.asc())
-            .all()
-        )
-
         conversations = []
         for m in messages:
             # 변환 없이 DB의 sender(interviewer_ai / candidate_ai) 그대로 전달
             conversations.append({
-                "id": str(m.id),
-                "sender": m.sender,
-                "message_type": m.message_type,
-                "content": m.content,
-                "turn_number": m.turn_number,
-                "highlight_turns": m.highlight_turns,
-                "created_at": m.created_at.isoformat() if getattr(m, "created_at", None) else None,
+                "id": str(m.get("id")),
+                "sender": m.get("sender"),
+                "message_type": m.get("message_type"),
+                "content": m.get("content"),
+                "turn_number": m.get("turn_number"),
+                "highlight_turns": m.get("highlight_turns"),
+                "created_at": m.get("created_at"),
             })
 
         # highlight 텍스트가 있으면 간단하게 채팅 형식으로 변환해서 interview_highlights에 포함
@@ -693,9 +1149,9 @@ class InterviewService:
             "status": 200,
             "success": True,
             "data": {
-                "applications_id": str(application.id),
-                "job_posting_id": str(application.job_posting_id),
-                "job_seeker_id": str(application.job_seeker_id),
+                "applications_id": str(application_id),
+                "job_posting_id": str(job_posting_id),
+                "job_seeker_id": str(job_seeker_id),
                 "full_name": full_name,
                 "hard_skills": hard_skills,
                 "soft_skills": soft_skills,
@@ -714,7 +1170,17 @@ class InterviewService:
 
         프론트 요청 경로: /company/interviews/profiles/{applications_id}
         요구사항: applications_id -> Application -> job_seeker_id -> JobSeeker.full_name
+        응답은 캐시되고 지원자 정보/문서/검사 결과가 바뀌면 무효화된다.
         """
+        return response_cache.get_or_load(
+            report_cache.APPLICANT_PROFILE,
+            str(application_id),
+            lambda: self._build_applicant_profile_by_application(application_id),
+            tags=report_cache.response_tags,
+            cacheable=report_cache.is_success,
+        )
+
+    def _build_applicant_profile_by_application(self, application_id: str):
         # application 조회
         application = (
             self.db.query(Application)
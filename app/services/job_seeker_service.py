@@ -6,6 +6,7 @@ from app.models.ai_learning_answer import AILearningAnswer
 from app.models.ai_learning_question import AILearningQuestion
 from app.models.job_seeker_document import JobSeekerDocument
 from app.services.s3_service import S3Service
+from app.services.leaderboard_service import LeaderboardService
 import uuid
 import logging
 import pandas as pd
@@ -56,6 +57,8 @@ class JobSeekerService:
         else:
             for key, value in info_data.items():
                 setattr(applicant, key, value)
+            if 'full_name' in info_data:
+                LeaderboardService(self.db).rename_job_seeker(applicant.id, applicant.full_name)
         
         self.db.commit()
         self.db.refresh(applicant)
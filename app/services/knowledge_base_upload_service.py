@@ -0,0 +1,72 @@
+from typing import Dict, Any, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+import uuid
+
+from app.core.config import settings
+from app.models.knowledge_base_upload import KnowledgeBaseUpload
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class KnowledgeBaseUploadService:
+    """(지원자, 공고)별 마지막 KB 업로드 내용 해시를 기록해 같은 내용의 재업로드를 생략"""
+
+    def __init__(self, db: Session, job_seeker_id, job_posting_id):
+        self.db = db
+        self.job_seeker_id = self._to_uuid(job_seeker_id)
+        self.job_posting_id = self._to_uuid(job_posting_id)
+
+    @staticmethod
+    def _to_uuid(value) -> Optional[uuid.UUID]:
+        try:
+            return uuid.UUID(str(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _usable(self) -> bool:
+        return bool(settings.kb_upload_dedup_enabled and self.job_seeker_id and self.job_posting_id)
+
+    def find_unchanged(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """마지막 업로드와 내용이 같으면 그때의 업로드 응답 반환 (다르거나 기록이 없으면 None)"""
+        if not self._usable():
+            return None
+        try:
+            row = (
+                self.db.query(KnowledgeBaseUpload)
+                .filter(KnowledgeBaseUpload.job_seeker_id == self.job_seeker_id)
+                .filter(KnowledgeBaseUpload.job_posting_id == self.job_posting_id)
+                .first()
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"KB 업로드 기록 조회 실패: {e}")
+            return None
+        if not row or row.content_hash != content_hash:
+            return None
+        return row.response if isinstance(row.response, dict) else {}
+
+    def record(self, content_hash: str, response: Dict[str, Any]):
+        """업로드 성공 후 내용 해시와 응답 저장"""
+        if not self._usable():
+            return
+        stmt = pg_insert(KnowledgeBaseUpload).values(
+            job_seeker_id=self.job_seeker_id,
+            job_posting_id=self.job_posting_id,
+            content_hash=content_hash,
+            response=response if isinstance(response, dict) else {},
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_knowledge_base_upload',
+            set_={"content_hash": stmt.excluded.content_hash, "response": stmt.excluded.response, "uploaded_at": func.now()},
+        )
+        try:
+            self.db.execute(stmt)
+            self.db.commit()
+        except Exception as e:
+            # 기록 실패 시 다음 평가에서 다시 업로드할 뿐이므로 진행에는 영향 없음
+            self.db.rollback()
+            logger.warning(f"KB 업로드 기록 저장 실패: {e}")
@@ -1,10 +1,13 @@
 import httpx  # urllib 대신 httpx 사용
 import boto3
+from botocore.config import Config
 from starlette.concurrency import run_in_threadpool
 import json
 import logging
 from typing import Dict, Any, Optional, List
 from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.core.resilience import resilient_request, resilient_call
 from app.schemas.personal_info import PersonalInfo
 from botocore.session import get_session
 from botocore.auth import SigV4Auth
@@ -12,6 +15,9 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# 재시도는 resilient_call이 담당하므로 botocore 자체 재시도는 끔 (재시도 횟수가 곱해지지 않도록)
+LAMBDA_CLIENT_CONFIG = Config(retries={"total_max_attempts": 1, "mode": "standard"})
+
 class LambdaBedrockService:
     """AWS Lambda를 통한 Bedrock LLM 서비스 (비동기 최적화)"""
 
@@ -79,17 +85,19 @@ class LambdaBedrockService:
             headers = self._get_sigv4_headers(target_url, data_bytes)
 
         print(f"[DEBUG] HTTP 요청 시작 - URL: {target_url}")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                target_url,
-                content=data_bytes,
-                headers=headers,
-                timeout=300.0
-            )
-            print(f"[DEBUG] HTTP 응답 - Status: {response.status_code}")
-            print(f"[DEBUG] HTTP 응답 - Body: {response.text}")
-            response.raise_for_status() # HTTP 4xx/5xx 에러 시 예외 발생
-            return response.json()
+        # 호출마다 클라이언트를 새로 만들지 않고 공유 커넥션 풀 재사용 (connect/TLS 비용 절감)
+        client = get_http_client()
+        # 대상 URL별 속도 제한 + 일시적 오류 재시도 + 차단기
+        response = await resilient_request(target_url, lambda: client.post(
+            target_url,
+            content=data_bytes,
+            headers=headers,
+            timeout=300.0
+        ))
+        print(f"[DEBUG] HTTP 응답 - Status: {response.status_code}")
+        print(f"[DEBUG] HTTP 응답 - Body: {response.text}")
+        response.raise_for_status() # HTTP 4xx/5xx 에러 시 예외 발생
+        return response.json()
 
     async def _invoke_via_sdk_async(self, payload: Dict[str, Any], function_name: str = None) -> Dict[str, Any]:
         """(비동기) AWS SDK (aioboto3)를 통해 Lambda 함수를 호출합니다."""
@@ -98,7 +106,7 @@ class LambdaBedrockService:
 
         def invoke_sync():
             # boto3 client는 동기이므로 threadpool에서 실행
-            client = boto3.client('lambda', region_name=self.region)
+            client = boto3.client('lambda', region_name=self.region, config=LAMBDA_CLIENT_CONFIG)
             response = client.invoke(
                 FunctionName=target_function,
                 InvocationType='RequestResponse',
@@ -112,7 +120,8 @@ class LambdaBedrockService:
                 # payload가 이미 dict인 경우도 있어서 안전하게 처리
                 return payload_bytes
 
-        return await run_in_threadpool(invoke_sync)
+        # 함수별 속도 제한(lambda:<함수명>) + 일시적 오류 재시도 + 차단기
+        return await resilient_call(f"lambda:{target_function}", lambda: run_in_threadpool(invoke_sync))
 
     async def extract_personal_info(self, extracted_text: str) -> PersonalInfo:
         """Lambda를 통해 개인정보 추출 (로직 단순화 및 비동기 최적화)"""
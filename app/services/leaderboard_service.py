@@ -0,0 +1,188 @@
+from typing import Optional
+from sqlalchemy import select, true, update, func, exists, cast, String
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.application import Application
+from app.models.job_seeker import JobSeeker
+from app.models.ai_evaluation import AIEvaluation
+from app.models.applicant_ranking import ApplicantRanking
+from app.services.report_cache import invalidate_job_seeker_postings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# applicant_rankings에 채우는 컬럼 (rank 제외)
+_ROW_COLUMNS = (
+    "application_id", "job_posting_id", "job_seeker_id", "user_id", "candidate_name", "stage",
+    "applied_at", "evaluated_at", "total_score", "hard_score", "soft_score", "ai_summary", "is_partial",
+)
+
+
+class LeaderboardService:
+    """공고별 지원자 순위표(applicant_rankings) 갱신
+
+    지원서/AI 평가를 바꾸는 트랜잭션 안에서 호출해 같은 commit으로 반영한다 (commit은 호출한 쪽).
+    공고 단위 advisory lock으로 같은 공고의 동시 갱신을 직렬화하고, 순위는 바뀐 행만 UPDATE한다.
+    순위표가 비어 있는 공고(도입 이전 데이터)는 처음 갱신/조회할 때 전체를 채운다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_application(self, application: Application):
+        """지원서 1건(추가, 상태 변경, AI 평가 저장)을 순위표에 반영"""
+        self.db.flush()
+        posting_id = application.job_posting_id
+        self._lock(posting_id)
+        if not self._has_rows(posting_id):
+            self._rebuild_locked(posting_id)
+            return
+        self._upsert(posting_id, job_seeker_id=application.job_seeker_id)
+        # 같은 지원자의 이전 지원서 행 정리 (순위표에는 지원자별 최신 지원서만)
+        latest_id = self.db.execute(
+            select(ApplicantRanking.application_id)
+            .where(ApplicantRanking.job_posting_id == posting_id)
+            .where(ApplicantRanking.job_seeker_id == application.job_seeker_id)
+            .order_by(ApplicantRanking.applied_at.desc(), ApplicantRanking.application_id.desc())
+            .limit(1)
+        ).scalar()
+        (
+            self.db.query(ApplicantRanking)
+            .filter(ApplicantRanking.job_posting_id == posting_id)
+            .filter(ApplicantRanking.job_seeker_id == application.job_seeker_id)
+            .filter(ApplicantRanking.application_id != latest_id)
+            .delete(synchronize_session=False)
+        )
+        self._rerank(posting_id)
+
+    def rename_job_seeker(self, job_seeker_id, full_name: Optional[str]):
+        """지원자 이름 변경 반영 (순위에는 영향 없음)"""
+        posting_ids = [
+            posting_id for (posting_id,) in
+            self.db.query(ApplicantRanking.job_posting_id).filter(ApplicantRanking.job_seeker_id == job_seeker_id).distinct()
+        ]
+        invalidate_job_seeker_postings(self.db, job_seeker_id, posting_ids)
+        (
+            self.db.query(ApplicantRanking)
+            .filter(ApplicantRanking.job_seeker_id == job_seeker_id)
+            .update({ApplicantRanking.candidate_name: full_name}, synchronize_session=False)
+        )
+
+    def ensure_posting(self, job_posting_id):
+        """순위표가 비어 있고 지원서가 있으면 전체를 채우고 commit (조회 전에 호출)"""
+        if self._has_rows(job_posting_id):
+            return
+        has_applications = self.db.query(
+            exists().where(Application.job_posting_id == job_posting_id)
+        ).scalar()
+        if not has_applications:
+            return
+        try:
+            self._lock(job_posting_id)
+            if not self._has_rows(job_posting_id):
+                self._rebuild_locked(job_posting_id)
+                logger.info(f"지원자 순위표 생성 - job_posting_id={job_posting_id}")
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def rebuild(self, job_posting_id):
+        """공고의 순위표를 applications/ai_evaluations 기준으로 다시 만듦"""
+        self._lock(job_posting_id)
+        self._rebuild_locked(job_posting_id)
+
+    def _rebuild_locked(self, job_posting_id):
+        self._upsert(job_posting_id)
+        source = self._source(job_posting_id).subquery()
+        (
+            self.db.query(ApplicantRanking)
+            .filter(ApplicantRanking.job_posting_id == job_posting_id)
+            .filter(ApplicantRanking.application_id.not_in(select(source.c.application_id)))
+            .delete(synchronize_session=False)
+        )
+        self._rerank(job_posting_id)
+
+    def _lock(self, job_posting_id):
+        # 트랜잭션 종료 시 자동 해제
+        self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(cast(str(job_posting_id), String)))))
+
+    def _has_rows(self, job_posting_id) -> bool:
+        return bool(self.db.query(
+            exists().where(ApplicantRanking.job_posting_id == job_posting_id)
+        ).scalar())
+
+    @staticmethod
+    def _source(job_posting_id, job_seeker_id=None):
+        """지원자별 최신 지원서 + 지원서별 최신 AI 평가 (DISTINCT ON + LATERAL)"""
+        latest_app = (
+            select(Application)
+            .where(Application.job_posting_id == job_posting_id)
+            .distinct(Application.job_seeker_id)
+            .order_by(Application.job_seeker_id, Application.applied_at.desc(), Application.id.desc())
+        )
+        if job_seeker_id is not None:
+            latest_app = latest_app.where(Application.job_seeker_id == job_seeker_id)
+        latest_app = latest_app.subquery("latest_application")
+        latest_eval = (
+            select(
+                AIEvaluation.total_score,
+                AIEvaluation.hard_score,
+                AIEvaluation.soft_score,
+                AIEvaluation.ai_summary,
+                AIEvaluation.is_partial,
+            )
+            .where(AIEvaluation.application_id == latest_app.c.id)
+            .order_by(AIEvaluation.created_at.desc())
+            .limit(1)
+            .lateral("latest_evaluation")
+        )
+        return (
+            select(
+                latest_app.c.id.label("application_id"),
+                latest_app.c.job_posting_id,
+                latest_app.c.job_seeker_id,
+                JobSeeker.user_id,
+                JobSeeker.full_name.label("candidate_name"),
+                cast(latest_app.c.application_status, String).label("stage"),
+                latest_app.c.applied_at,
+                latest_app.c.evaluated_at,
+                latest_eval.c.total_score,
+                latest_eval.c.hard_score,
+                latest_eval.c.soft_score,
+                latest_eval.c.ai_summary,
+                func.coalesce(latest_eval.c.is_partial, False).label("is_partial"),
+            )
+            .select_from(latest_app)
+            .join(JobSeeker, JobSeeker.id == latest_app.c.job_seeker_id)
+            .outerjoin(latest_eval, true())
+        )
+
+    def _upsert(self, job_posting_id, job_seeker_id=None):
+        stmt = pg_insert(ApplicantRanking).from_select(list(_ROW_COLUMNS), self._source(job_posting_id, job_seeker_id))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ApplicantRanking.application_id],
+            set_={
+                **{name: stmt.excluded[name] for name in _ROW_COLUMNS if name != "application_id"},
+                "updated_at": func.now(),
+            },
+        )
+        self.db.execute(stmt)
+
+    def _rerank(self, job_posting_id):
+        ranked = (
+            select(
+                ApplicantRanking.application_id,
+                func.rank().over(order_by=ApplicantRanking.total_score.desc().nulls_last()).label("new_rank"),
+            )
+            .where(ApplicantRanking.job_posting_id == job_posting_id)
+            .subquery("ranked")
+        )
+        self.db.execute(
+            update(ApplicantRanking)
+            .where(ApplicantRanking.application_id == ranked.c.application_id)
+            .where(ApplicantRanking.rank.is_distinct_from(ranked.c.new_rank))
+            .values(rank=ranked.c.new_rank)
+            .execution_options(synchronize_session=False)
+        )
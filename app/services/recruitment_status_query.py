@@ -0,0 +1,121 @@
+from typing import Dict, Any, Optional, List, Callable
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+import base64
+import json
+import uuid
+
+from sqlalchemy import case, func, literal, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.applicant_ranking import ApplicantRanking
+
+# 정렬 기준 (applied_at: 지원일, rank: 순위표 순위, 나머지: 최신 AI 평가 점수)
+SORT_FIELDS = ('applied_at', 'rank', 'total_score', 'hard_score', 'soft_score')
+SORT_ORDERS = ('asc', 'desc')
+# NULL(미평가) 정렬 키 대체값 - NULL 여부를 별도 키로 먼저 비교하므로 값 자체는 순서에 영향 없음
+_NULL_FILL = {
+    'applied_at': datetime(1970, 1, 1, tzinfo=timezone.utc),
+    'total_score': Decimal(0),
+    'hard_score': Decimal(0),
+    'soft_score': Decimal(0),
+}
+# 커서 값 복원
+_CURSOR_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    'applied_at': datetime.fromisoformat,
+    'rank': int,
+    'total_score': Decimal,
+    'hard_score': Decimal,
+    'soft_score': Decimal,
+}
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class RecruitmentStatusQuery:
+    """채용현황 지원자 목록 조회 (applicant_rankings 순위표에서 읽음, 갱신은 LeaderboardService)
+
+    정렬 키 (NULL 순위, 값, application_id)로 keyset 페이지네이션. 미평가(NULL)는 정렬 방향과 무관하게 항상 뒤로.
+    rank 정렬은 (job_posting_id, rank, application_id) 인덱스 범위 스캔.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def page(
+        self,
+        job_posting_id,
+        sort: str = 'applied_at',
+        order: str = 'desc',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """지원자 목록 한 페이지 (limit이 없으면 전체) -> {"rows", "next_cursor", "has_more"}"""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort}")
+        if order not in SORT_ORDERS:
+            raise ValueError(f"지원하지 않는 정렬 방향입니다: {order}")
+        descending = order == 'desc'
+
+        sort_column = getattr(ApplicantRanking, sort)
+        if sort == 'rank':
+            # 순위는 항상 값이 있으므로 NULL 키 없이 인덱스 순서 그대로
+            value_keys = [sort_column]
+        else:
+            # 내림차순이면 값 있는 행(1)이 먼저, 오름차순이면 값 있는 행(0)이 먼저 -> 어느 방향이든 NULL은 마지막
+            sort_null = case((sort_column.is_(None), 0 if descending else 1), else_=1 if descending else 0)
+            value_keys = [sort_null, func.coalesce(sort_column, literal(_NULL_FILL[sort]))]
+        sort_keys = [*value_keys, ApplicantRanking.application_id]
+
+        query = (
+            self.db.query(ApplicantRanking, *[key.label(f"sort_key_{i}") for i, key in enumerate(value_keys)])
+            .filter(ApplicantRanking.job_posting_id == job_posting_id)
+        )
+        if cursor:
+            after = tuple_(*[literal(value) for value in self.decode_cursor(cursor, sort, len(value_keys))])
+            query = query.filter(tuple_(*sort_keys) < after if descending else tuple_(*sort_keys) > after)
+        query = query.order_by(*[key.desc() if descending else key.asc() for key in sort_keys])
+        if limit:
+            query = query.limit(limit + 1)
+
+        rows = query.all()
+        has_more = bool(limit) and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+        next_cursor = self.encode_cursor(rows[-1], len(value_keys)) if has_more else None
+        return {"rows": [row[0] for row in rows], "next_cursor": next_cursor, "has_more": has_more}
+
+    def stage_counts(self, job_posting_id) -> Dict[str, int]:
+        """지원자별 최신 지원서의 단계별 수 (GROUP BY)"""
+        rows = (
+            self.db.query(ApplicantRanking.stage, func.count())
+            .filter(ApplicantRanking.job_posting_id == job_posting_id)
+            .group_by(ApplicantRanking.stage)
+            .all()
+        )
+        return {stage: count for stage, count in rows}
+
+    @staticmethod
+    def encode_cursor(row, key_count: int) -> str:
+        values = [row[i + 1] for i in range(key_count)]
+        values = [value.isoformat() if isinstance(value, datetime) else str(value) for value in values]
+        raw = json.dumps([*values, str(row[0].application_id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort: str, key_count: int) -> List[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+            parts = json.loads(raw)
+            if not isinstance(parts, list) or len(parts) != key_count + 1:
+                raise ValueError("cursor length")
+            *values, application_id = parts
+            if key_count == 2:
+                values = [int(values[0]), _CURSOR_PARSERS[sort](values[1])]
+            else:
+                values = [_CURSOR_PARSERS[sort](values[0])]
+            return [*values, uuid.UUID(application_id)]
+        except (ValueError, TypeError, InvalidOperation, UnicodeDecodeError) as e:
+            raise InvalidCursorError("잘못된 페이지 커서입니다") from e
@@ -0,0 +1,69 @@
+from typing import Dict, Any, Iterable, List
+
+from app.core.response_cache import response_cache, track_model
+from app.models.job_posting import JobPosting
+from app.models.application import Application
+from app.models.job_seeker import JobSeeker
+from app.models.ai_evaluation import AIEvaluation
+from app.models.ai_interview_message import AIInterviewMessage
+from app.models.ai_overall_report import AIOverallReport
+from app.models.interview_highlight import InterviewHighlight
+from app.models.big5_test_result import Big5TestResult
+from app.models.ai_learning_answer import AILearningAnswer
+from app.models.job_seeker_document import JobSeekerDocument
+
+# 캐시 네임스페이스 (기업 리포트 조회 응답)
+RECRUITMENT_STATUS = "recruitment_status"
+INDIVIDUAL_REPORT = "individual_report"
+APPLICANT_PROFILE = "applicant_profile"
+
+
+def posting_tag(job_posting_id) -> str:
+    return f"posting:{job_posting_id}"
+
+
+def application_tag(application_id) -> str:
+    return f"application:{application_id}"
+
+
+def job_seeker_tag(job_seeker_id) -> str:
+    return f"job_seeker:{job_seeker_id}"
+
+
+def is_success(result: Dict[str, Any]) -> bool:
+    """성공 응답만 캐시 (404 등은 곧 생길 수 있으므로 저장하지 않음)"""
+    return isinstance(result, dict) and bool(result.get("success"))
+
+
+def response_tags(result: Dict[str, Any]) -> List[str]:
+    """응답 data의 식별자로 태그 구성 (공고 / 지원서 / 지원자)"""
+    data = result.get("data") or {}
+    posting = data.get("job_posting") or {}
+    tags = []
+    if data.get("job_posting_id") or posting.get("id"):
+        tags.append(posting_tag(data.get("job_posting_id") or posting.get("id")))
+    if data.get("applications_id") or data.get("application_id"):
+        tags.append(application_tag(data.get("applications_id") or data.get("application_id")))
+    if data.get("job_seeker_id"):
+        tags.append(job_seeker_tag(data["job_seeker_id"]))
+    return tags
+
+
+def invalidate_job_seeker_postings(db, job_seeker_id, job_posting_ids: Iterable[Any]):
+    """지원자 정보 변경을 그 지원자가 지원한 공고의 채용현황에도 반영 (commit 후)"""
+    response_cache.invalidate_on_commit(
+        db, job_seeker_tag(job_seeker_id), *[posting_tag(posting_id) for posting_id in job_posting_ids]
+    )
+
+
+# ORM 쓰기 -> commit 후 태그 무효화
+track_model(JobPosting, lambda posting: [posting_tag(posting.id)])
+track_model(Application, lambda application: [posting_tag(application.job_posting_id), application_tag(application.id)])
+track_model(AIEvaluation, lambda evaluation: [application_tag(evaluation.application_id)])
+track_model(AIInterviewMessage, lambda message: [application_tag(message.application_id)])
+track_model(InterviewHighlight, lambda highlight: [application_tag(highlight.application_id)])
+track_model(AIOverallReport, lambda report: [posting_tag(report.job_posting_id)])
+track_model(JobSeeker, lambda job_seeker: [job_seeker_tag(job_seeker.id)])
+track_model(Big5TestResult, lambda result: [job_seeker_tag(result.job_seeker_id)])
+track_model(AILearningAnswer, lambda answer: [job_seeker_tag(answer.job_seeker_id)])
+track_model(JobSeekerDocument, lambda document: [job_seeker_tag(document.job_seeker_id)])
@@ -0,0 +1,136 @@
+from typing import Optional, List, Any
+from sqlalchemy import select, func, cast, Text, literal
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+import uuid
+
+from app.core.hashing import stable_hash
+from app.models.application import Application
+from app.models.job_seeker import JobSeeker
+from app.models.job_posting import JobPosting
+from app.models.ai_evaluation import AIEvaluation
+from app.models.ai_interview_message import AIInterviewMessage
+from app.models.job_seeker_document import JobSeekerDocument
+from app.models.big5_test_result import Big5TestResult
+from app.models.ai_learning_answer import AILearningAnswer
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 응답 형식이 바뀌면 올려서 이전 ETag를 무효화
+ETAG_FORMAT_VERSION = 1
+# 기업용 지원자 프로필에 나오는 job_seekers 컬럼 (값이 바뀌면 ETag도 바뀜)
+_PROFILE_SEEKER_COLUMNS = (
+    JobSeeker.full_name, JobSeeker.email, JobSeeker.phone, JobSeeker.education_level, JobSeeker.university,
+    JobSeeker.major, JobSeeker.graduation_year, JobSeeker.company_name, JobSeeker.bio, JobSeeker.behavior_text,
+)
+
+
+class ReportETagService:
+    """기업 리포트/프로필 응답의 ETag (행 버전으로 계산)
+
+    응답을 만드는 대신 한 번의 가벼운 쿼리로 응답에 쓰이는 행들의 버전
+    (최신 AI 평가 시각, 대화 수/id, 문서 업로드 시각 등)만 읽어 해시한다.
+    지원서가 없으면 None (본 조회에서 404 처리).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def individual_report(self, application_id) -> Optional[str]:
+        """/company/interviews/report/{application_id} ETag"""
+        evaluations = (
+            select(func.count(AIEvaluation.id), func.max(AIEvaluation.created_at))
+            .where(AIEvaluation.application_id == Application.id)
+        )
+        # 대화는 재평가 때 통째로 다시 저장되므로(새 id) id 목록 해시로 버전을 대신함
+        messages = (
+            select(
+                func.count(AIInterviewMessage.id),
+                func.md5(func.string_agg(cast(AIInterviewMessage.id, Text), aggregate_order_by(literal(','), AIInterviewMessage.id))),
+            )
+            .where(AIInterviewMessage.application_id == Application.id)
+        )
+        query = (
+            select(
+                Application.id,
+                Application.job_posting_id,
+                Application.job_seeker_id,
+                Application.evaluated_at,
+                JobSeeker.full_name,
+                func.coalesce(JobPosting.updated_at, JobPosting.created_at),
+                cast(JobPosting.hard_skills, Text),
+                cast(JobPosting.soft_skills, Text),
+                *self._aggregates(evaluations),
+                *self._aggregates(messages),
+            )
+            .outerjoin(JobSeeker, JobSeeker.id == Application.job_seeker_id)
+            .outerjoin(JobPosting, JobPosting.id == Application.job_posting_id)
+        )
+        return self._etag("report", query, application_id)
+
+    def applicant_profile(self, application_id) -> Optional[str]:
+        """/company/interviews/profiles/{application_id} ETag"""
+        documents = (
+            select(func.count(JobSeekerDocument.id), func.max(JobSeekerDocument.uploaded_at))
+            .where(JobSeekerDocument.job_seeker_id == Application.job_seeker_id)
+        )
+        big5 = (
+            select(func.count(Big5TestResult.id), func.max(Big5TestResult.test_date))
+            .where(Big5TestResult.job_seeker_id == Application.job_seeker_id)
+        )
+        answers = (
+            select(
+                func.count(AILearningAnswer.id),
+                func.md5(func.string_agg(
+                    func.concat_ws(':', AILearningAnswer.question_id, AILearningAnswer.answer_text),
+                    aggregate_order_by(literal('\n'), AILearningAnswer.id),
+                )),
+            )
+            .where(AILearningAnswer.job_seeker_id == Application.job_seeker_id)
+        )
+        query = (
+            select(
+                Application.id,
+                Application.job_posting_id,
+                Application.job_seeker_id,
+                func.md5(func.concat_ws('|', *[cast(column, Text) for column in _PROFILE_SEEKER_COLUMNS])),
+                *self._aggregates(documents),
+                *self._aggregates(big5),
+                *self._aggregates(answers),
+            )
+            .outerjoin(JobSeeker, JobSeeker.id == Application.job_seeker_id)
+        )
+        return self._etag("profile", query, application_id)
+
+    @staticmethod
+    def _aggregates(subquery) -> List[Any]:
+        """(count, 버전) 집계 서브쿼리를 컬럼 2개로 (LATERAL 없이 스칼라 서브쿼리)"""
+        columns = list(subquery.selected_columns)
+        return [subquery.with_only_columns(column).scalar_subquery() for column in columns]
+
+    def _etag(self, kind: str, query, application_id) -> Optional[str]:
+        try:
+            application_uuid = uuid.UUID(str(application_id))
+        except ValueError:
+            return None
+        try:
+            row = self.db.execute(query.where(Application.id == application_uuid)).first()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"ETag 계산 실패 ({kind}) - application_id={application_id}: {e}")
+            return None
+        if row is None:
+            return None
+        return '"' + stable_hash([kind, ETAG_FORMAT_VERSION, *row])[:32] + '"'
+
+    @staticmethod
+    def matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 헤더가 etag와 일치하는지 (목록, '*', W/ 접두사 허용)"""
+        if not if_none_match or not etag:
+            return False
+        candidates = [value.strip() for value in if_none_match.split(",")]
+        return any(
+            candidate == "*" or (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+            for candidate in candidates
+        )
@@ -0,0 +1,89 @@
+from typing import List, Dict, Any, Iterable
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+import uuid
+
+from app.models.ai_interview_message import AIInterviewMessage
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 원본 발화자 값 -> sender_enum
+# 시스템/질문 메시지는 면접관 측으로 분류 (별도 enum 추가 전 임시 정책), 미지정 값은 지원자 측
+SENDER_MAP = {
+    'interviewer': 'interviewer_ai',
+    'interviewer_ai': 'interviewer_ai',
+    'facilitator': 'interviewer_ai',
+    'reviewer': 'interviewer_ai',
+    'system': 'interviewer_ai',
+    'notice': 'interviewer_ai',
+    'error': 'interviewer_ai',
+    'question': 'interviewer_ai',
+    'applicant': 'candidate_ai',
+    'candidate': 'candidate_ai',
+    'candidate_ai': 'candidate_ai',
+    'user': 'candidate_ai',
+    'answer': 'candidate_ai',
+}
+DEFAULT_SENDER = 'candidate_ai'
+
+# conduct_interview 메시지 type -> message_type_enum (후속 질문은 질문, 안내/호출 오류는 system, 답변 판정은 other)
+MESSAGE_TYPE_MAP = {
+    'question': 'question',
+    'follow_up': 'question',
+    'answer': 'answer',
+    'system': 'system',
+    'notice': 'system',
+    'error': 'system',
+    'evaluation': 'other',
+    'other': 'other',
+}
+# message_type_enum에 없는 값은 'other'로 저장 (enum 위반으로 평가 트랜잭션 전체가 실패하지 않도록)
+MESSAGE_TYPES = frozenset(AIInterviewMessage.__table__.c.message_type.type.enums)
+DEFAULT_MESSAGE_TYPE = 'other'
+
+
+class InterviewTranscriptWriter:
+    """면접 대화(ai_interview_messages)를 지원자 단위로 일괄 저장
+
+    메시지마다 ORM 객체를 만들지 않고 정규화된 dict 목록을 한 번의 INSERT (executemany)로 기록한다.
+    PostgreSQL(psycopg2)에서는 SQLAlchemy가 이를 다중 VALUES INSERT로 묶어 실행한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def normalize(application_id, conversations: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """conduct_interview 메시지 목록을 ai_interview_messages 행 목록으로 변환"""
+        rows = []
+        for conv in conversations or []:
+            if not isinstance(conv, dict):
+                continue
+            # 일부 소스(conduct_interview)에서는 'role' 키만 존재하므로 fallback 처리
+            sender_raw = str(conv.get('sender') or conv.get('role') or '').lower()
+            # conduct_interview 메시지는 'type' 키를 사용
+            message_type_raw = str(conv.get('message_type') or conv.get('type') or '').lower()
+            message_type = MESSAGE_TYPE_MAP.get(message_type_raw, DEFAULT_MESSAGE_TYPE)
+            rows.append({
+                "id": uuid.uuid4(),
+                "application_id": application_id,
+                "sender": SENDER_MAP.get(sender_raw, DEFAULT_SENDER),
+                "message_type": message_type if message_type in MESSAGE_TYPES else DEFAULT_MESSAGE_TYPE,
+                "content": conv.get('content') or '',
+                "turn_number": conv.get('turn_number') or conv.get('question_number') or 0,
+                "highlight_turns": conv.get('highlight_turns'),
+            })
+        return rows
+
+    def replace(self, application_id, conversations: Iterable[Dict[str, Any]]) -> int:
+        """지원서의 기존 대화를 지우고 새 대화를 저장 (commit은 호출자가 한다). 저장한 메시지 수 반환"""
+        rows = self.normalize(application_id, conversations)
+        # 저장 실패 시 대화만 되돌리고 평가 결과 저장은 계속 진행
+        with self.db.begin_nested():
+            self.db.query(AIInterviewMessage).filter(
+                AIInterviewMessage.application_id == application_id
+            ).delete(synchronize_session=False)
+            if rows:
+                self.db.execute(insert(AIInterviewMessage), rows)
+        return len(rows)
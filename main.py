@@ -14,7 +14,9 @@ from app.models import (
     ai_evaluation, ai_interview_message, ai_learning_question, 
     ai_overall_report, big5_test_result, evaluation_criteria,
     job_seeker_ai_agent, ai_learning_answer, job_seeker_document,
-    interview_highlight
+    interview_highlight, evaluation_job, interview_checkpoint,
+    applicant_answer_cache, knowledge_base_upload, evaluation_work_item,
+    applicant_ranking
 )
 
 # 데이터베이스 테이블 생성
@@ -40,6 +42,45 @@ async def log_registered_routes():
     except Exception:
         logger.exception("Failed to list registered routes on startup")
 
+# AI 평가 백그라운드 워커 (evaluation_jobs 대기열 처리, 재시작 시 중단된 작업 이어서 실행)
+@app.on_event("startup")
+async def start_evaluation_worker():
+    from app.services.evaluation_worker import evaluation_worker
+    await evaluation_worker.start()
+
+@app.on_event("shutdown")
+async def stop_evaluation_worker():
+    from app.services.evaluation_worker import evaluation_worker
+    await evaluation_worker.stop()
+
+# 분산 평가 대기열 (EVAL_QUEUE_MODE=distributed): API 서버도 지원자 평가 워커로 참여
+@app.on_event("startup")
+async def start_evaluation_queue_worker():
+    if settings.eval_queue_mode == 'distributed' and settings.eval_queue_local_consumer:
+        from app.services.evaluation_queue_worker import evaluation_queue_worker
+        await evaluation_queue_worker.start()
+
+@app.on_event("shutdown")
+async def stop_evaluation_queue_worker():
+    from app.services.evaluation_queue_worker import evaluation_queue_worker
+    await evaluation_queue_worker.stop()
+
+# 평가 진행 이벤트 프로세스 간 전달 (EVAL_EVENTS_SHARED 또는 distributed 모드)
+@app.on_event("startup")
+async def start_evaluation_events_relay():
+    from app.services.evaluation_events import evaluation_events
+    await evaluation_events.start_relay()
+
+@app.on_event("shutdown")
+async def stop_evaluation_events_relay():
+    from app.services.evaluation_events import evaluation_events
+    await evaluation_events.stop_relay()
+
+@app.on_event("shutdown")
+async def close_shared_http_client():
+    from app.core.http_client import close_http_client
+    await close_http_client()
+
 # CORS 설정 (환경변수로 관리)
 from app.core.config import settings
 import logging
@@ -135,6 +176,43 @@ async def pool_status():
             "error": str(e)
         }
 
+@app.get("/rate-limiter-status")
+async def rate_limiter_status():
+    """Lambda/Bedrock 호출 대상별 속도 제한 현황 (동시 호출 한도, 대기열 길이, 초당 요청 수)"""
+    from app.core.rate_limiter import rate_limiter_status as _rate_limiter_status
+    return _rate_limiter_status()
+
+@app.get("/circuit-breaker-status")
+async def circuit_breaker_status():
+    """Lambda 호출 대상별 차단기 상태 (closed/open/half_open, 연속 실패 수)"""
+    from app.core.resilience import circuit_breaker_status as _circuit_breaker_status
+    return _circuit_breaker_status()
+
+@app.get("/evaluation-scheduler-status")
+async def evaluation_scheduler_status():
+    """공고 간 공정 분배 현황 (전체 슬롯, 공고/회사별 실행·대기 지원자 수와 가중치)"""
+    from app.services.evaluation_scheduler import evaluation_scheduler
+    return evaluation_scheduler.status()
+
+@app.get("/response-cache-status")
+async def response_cache_status():
+    """기업 리포트 응답 캐시 상태 (항목 수, 네임스페이스별 hit ratio)"""
+    from app.core.response_cache import response_cache
+    return response_cache.status()
+
+@app.get("/metrics")
+async def pipeline_metrics():
+    """면접 파이프라인 구간별 지연 분포(p50/p95/p99)와 카운터 (KB 업로드, 지원자AI/면접관AI 턴, Facilitator, DB 저장 등)"""
+    from app.core.metrics import metrics
+    return metrics.snapshot()
+
+@app.post("/metrics/reset")
+async def reset_pipeline_metrics():
+    """구간 지연 집계 초기화 (부하 테스트 전후 비교용)"""
+    from app.core.metrics import metrics
+    metrics.reset()
+    return {"status": "success"}
+
 @app.post("/dispose-pool")
 async def dispose_connection_pool():
     """데이터베이스 연결 풀 강제 정리"""
@@ -1,29 +1,58 @@
 """
-One-off script: ensure `ai_evaluations` table has `highlight` and `highlight_reason` columns.
+One-off script: ensure `ai_evaluations` table has `highlight`, `highlight_reason`, `input_fingerprint` and `is_partial` columns,
+`evaluation_jobs` has the lease columns, and that the recruitment status indexes exist
+(create_all does not add columns or indexes to existing tables).
 Usage:
   python scripts/add_ai_evaluation_columns.py
-The script reads DATABASE_URL from app.core.config.settings and adds columns if missing.
+The script reads DATABASE_URL from app.core.config.settings and adds columns/indexes if missing.
 """
 import sys
 from sqlalchemy import create_engine, text
 from app.core.config import settings
 
 
+# table -> column name -> SQL type
+COLUMNS = {
+    "ai_evaluations": {
+        "highlight": "text",
+        "highlight_reason": "text",
+        "input_fingerprint": "varchar(64)",
+        "is_partial": "boolean NOT NULL DEFAULT false",
+    },
+    "evaluation_jobs": {
+        "lease_owner": "varchar(100)",
+        "lease_expires_at": "timestamptz",
+        "heartbeat_at": "timestamptz",
+        "previous_eval_status": "varchar(20)",
+    },
+}
+
+# index name -> table(columns)
+INDEXES = {
+    "ix_ai_evaluations_application_created": "ai_evaluations (application_id, created_at)",
+    "ix_applications_posting_seeker_applied": "applications (job_posting_id, job_seeker_id, applied_at)",
+}
+
+
 def main():
     db_url = settings.database_url
     engine = create_engine(db_url)
     with engine.connect() as conn:
         # Check if columns already exist
-        for col in ("highlight", "highlight_reason"):
-            res = conn.execute(text(
-                "SELECT column_name FROM information_schema.columns WHERE table_name='ai_evaluations' AND column_name=:col"
-            ), {"col": col}).fetchone()
-            if res:
-                print(f"Column '{col}' already exists")
-            else:
-                print(f"Adding column '{col}'")
-                conn.execute(text(f"ALTER TABLE ai_evaluations ADD COLUMN {col} text"))
-                print(f"Added column '{col}'")
+        for table, columns in COLUMNS.items():
+            for col, col_type in columns.items():
+                res = conn.execute(text(
+                    "SELECT column_name FROM information_schema.columns WHERE table_name=:table AND column_name=:col"
+                ), {"table": table, "col": col}).fetchone()
+                if res:
+                    print(f"Column '{table}.{col}' already exists")
+                else:
+                    print(f"Adding column '{table}.{col}'")
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {col} {col_type}"))
+                    print(f"Added column '{table}.{col}'")
+        for name, target in INDEXES.items():
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+            print(f"Index '{name}' ensured")
         # Commit if using transactional DDL (Postgres executes DDL in transaction)
         try:
             conn.execute(text("COMMIT"))
@@ -0,0 +1,245 @@
+"""
+End-to-end evaluation load benchmark against a local database and the fake Lambda server.
+Usage:
+  python scripts/fake_llm_server.py --latency all=fixed:0.2 &
+  python scripts/bench_evaluation.py --applicants 50 [--questions 5] [--concurrency 10] [--fake-url http://127.0.0.1:9100]
+                                     [--force] [--runs 1] [--keep]
+Seeds a company, a job posting with --questions interview questions and N applicants, runs
+InterviewService.start_evaluation and reports wall-clock time, throughput, DB statement counts/time,
+pool usage and per-stage latencies (from app.core.metrics). Seeded rows are deleted afterwards unless --keep.
+Lambda URLs are pointed at --fake-url unless already set in the environment.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from collections import Counter
+
+ENDPOINT_ENV = {
+    "UPLOAD_URL": "/upload",
+    "APPLICANT_AI_URL": "/applicant",
+    "INTERVIEWER_AI_URL": "/interviewer",
+    "FACILITATOR_AI_URL": "/facilitator",
+    "LAMBDA_QUESTIONS_FUNCTION_URL": "/questions",
+    "LAMBDA_EVALUATION_FUNCTION_URL": "/evaluation",
+}
+
+
+def configure_env(fake_url: str):
+    # app 모듈 import 전에 설정해야 settings에 반영됨
+    for name, path in ENDPOINT_ENV.items():
+        os.environ.setdefault(name, fake_url.rstrip("/") + path)
+    os.environ.setdefault("KNOWLEDGE_BASE_ID", "fake-kb")
+
+
+class DBLoad:
+    """SQL 실행 횟수/시간 집계 (engine 이벤트)"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.engine = engine
+        self.event = event
+        self.statements = 0
+        self.seconds = 0.0
+        self.kinds = Counter()
+        self._started = {}
+
+    def __enter__(self):
+        self.event.listen(self.engine, "before_cursor_execute", self._before)
+        self.event.listen(self.engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc):
+        self.event.remove(self.engine, "before_cursor_execute", self._before)
+        self.event.remove(self.engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._started[id(cursor)] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = self._started.pop(id(cursor), None)
+        if started is not None:
+            self.seconds += time.perf_counter() - started
+        self.statements += 1
+        self.kinds[statement.lstrip().split(" ", 1)[0].upper()] += 1
+
+
+def seed(db, applicants: int, questions: int):
+    from app.models import User, Company, JobPosting, JobSeeker, Application, AILearningQuestion, AILearningAnswer
+
+    tag = uuid.uuid4().hex[:8]
+    company_user = User(email=f"bench-company-{tag}@example.com", password="bench", user_type="company")
+    db.add(company_user)
+    db.flush()
+    company = Company(user_id=company_user.id, company_name=f"Bench {tag}")
+    db.add(company)
+    db.flush()
+    posting = JobPosting(
+        company_id=company.id,
+        title=f"Bench posting {tag}",
+        main_tasks="벤치마크용 공고",
+        hard_skills=["Python", "SQL", "AWS"],
+        soft_skills=["커뮤니케이션", "문제해결"],
+        interview_questions=[f"벤치마크 질문 {i}" for i in range(1, questions + 1)] if questions else None,
+    )
+    db.add(posting)
+    db.flush()
+    ai_question = AILearningQuestion(question_text=f"벤치마크 Q&A {tag}", display_order=1)
+    db.add(ai_question)
+    db.flush()
+
+    user_ids = [company_user.id]
+    for i in range(applicants):
+        user = User(email=f"bench-seeker-{tag}-{i}@example.com", password="bench", user_type="jobseeker")
+        db.add(user)
+        db.flush()
+        user_ids.append(user.id)
+        seeker = JobSeeker(
+            user_id=user.id,
+            full_name=f"bench-{i}",
+            full_text="경력 요약 " * 50,
+            behavior_text="행동검사 결과 " * 20,
+            big5_text="Big5 결과 " * 20,
+        )
+        db.add(seeker)
+        db.flush()
+        db.add(AILearningAnswer(job_seeker_id=seeker.id, question_id=ai_question.id, answer_text=f"답변 {i}"))
+        db.add(Application(job_posting_id=posting.id, job_seeker_id=seeker.id))
+    db.commit()
+    return {"posting_id": posting.id, "company_id": company.id, "user_ids": user_ids, "ai_question_id": ai_question.id}
+
+
+def cleanup(db, seeded):
+    """벤치마크로 만든 행 삭제 (자식 테이블부터)"""
+    from sqlalchemy import text
+
+    params = {"posting_id": seeded["posting_id"]}
+    application_ids = "SELECT id FROM applications WHERE job_posting_id = :posting_id"
+    seeker_ids = "SELECT job_seeker_id FROM applications WHERE job_posting_id = :posting_id"
+    statements = [
+        f"DELETE FROM ai_interview_messages WHERE application_id IN ({application_ids})",
+        f"DELETE FROM ai_evaluations WHERE application_id IN ({application_ids})",
+        "DELETE FROM interview_checkpoints WHERE job_posting_id = :posting_id",
+        "DELETE FROM evaluation_work_items WHERE job_posting_id = :posting_id",
+        "DELETE FROM evaluation_jobs WHERE job_posting_id = :posting_id",
+        "DELETE FROM knowledge_base_uploads WHERE job_posting_id = :posting_id",
+        "DELETE FROM applicant_answer_cache WHERE job_posting_id = :posting_id",
+        "DELETE FROM applicant_rankings WHERE job_posting_id = :posting_id",
+        "DELETE FROM ai_overall_reports WHERE job_posting_id = :posting_id",
+        f"DELETE FROM ai_learning_answers WHERE job_seeker_id IN ({seeker_ids})",
+        f"CREATE TEMP TABLE bench_seekers ON COMMIT DROP AS {seeker_ids}",
+        "DELETE FROM applications WHERE job_posting_id = :posting_id",
+        "DELETE FROM job_seekers WHERE id IN (SELECT job_seeker_id FROM bench_seekers)",
+        "DELETE FROM job_postings WHERE id = :posting_id",
+    ]
+    for statement in statements:
+        try:
+            with db.begin_nested():
+                db.execute(text(statement), params)
+        except Exception as e:
+            # 환경에 따라 없는 테이블은 건너뜀
+            print(f"  cleanup skipped: {statement.split(' WHERE')[0]} ({e.__class__.__name__})")
+    db.execute(text("DELETE FROM ai_learning_questions WHERE id = :id"), {"id": seeded["ai_question_id"]})
+    db.execute(text("DELETE FROM companies WHERE id = :id"), {"id": seeded["company_id"]})
+    db.execute(text("DELETE FROM users WHERE id = ANY(:ids)"), {"ids": list(seeded["user_ids"])})
+    db.commit()
+
+
+def fetch_fake_stats(fake_url: str):
+    import httpx
+    try:
+        return httpx.get(fake_url.rstrip("/") + "/stats", timeout=5).json().get("endpoints")
+    except Exception:
+        return None
+
+
+async def run_once(posting_id, force: bool, concurrency):
+    from app.database.database import SessionLocal
+    from app.services.interview_service import InterviewService
+    from app.core.http_client import close_http_client
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        result = await InterviewService(db).start_evaluation(str(posting_id), force=force, max_concurrency=concurrency)
+        return time.perf_counter() - started, result
+    finally:
+        db.close()
+        await close_http_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=5, help="0 = let the questions Lambda generate them")
+    parser.add_argument("--concurrency", type=int, default=None, help="max applicants evaluated at once (default EVAL_MAX_CONCURRENCY)")
+    parser.add_argument("--fake-url", default="http://127.0.0.1:9100")
+    parser.add_argument("--runs", type=int, default=1, help="repeat start_evaluation on the same posting")
+    parser.add_argument("--force", action="store_true", help="re-evaluate unchanged applicants on repeated runs")
+    parser.add_argument("--keep", action="store_true", help="keep seeded rows")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    configure_env(args.fake_url)
+    import app.models  # noqa: F401 (register all mappers)
+    from app.database.database import Base, SessionLocal, engine, get_pool_status
+    from app.core.metrics import metrics
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    seeded = seed(db, args.applicants, args.questions)
+    db.close()
+    print(f"seeded posting {seeded['posting_id']} with {args.applicants} applicants")
+
+    reports = []
+    try:
+        for run in range(1, args.runs + 1):
+            metrics.reset()
+            with DBLoad(engine) as load:
+                elapsed, result = asyncio.run(run_once(seeded["posting_id"], args.force, args.concurrency))
+            data = result.get("data") or {}
+            stages = metrics.snapshot()["stages"]
+            report = {
+                "run": run,
+                "success": result.get("success"),
+                "message": result.get("message"),
+                "applicants": args.applicants,
+                "evaluated": data.get("evaluated_count"),
+                "unchanged": data.get("unchanged_count"),
+                "wall_sec": round(elapsed, 2),
+                "applicants_per_min": round(args.applicants / elapsed * 60, 1) if elapsed else None,
+                "db_statements": load.statements,
+                "db_statements_per_applicant": round(load.statements / max(1, args.applicants), 1),
+                "db_time_sec": round(load.seconds, 3),
+                "db_statement_kinds": dict(load.kinds.most_common()),
+                "pool": get_pool_status(),
+                "stages_p50_p95_sec": {name: [s["p50_sec"], s["p95_sec"], s["count"]] for name, s in stages.items()},
+                "fake_server": fetch_fake_stats(args.fake_url),
+            }
+            reports.append(report)
+            if args.json:
+                continue
+            print(f"\n== run {run}: {report['message']}")
+            print(f"wall {report['wall_sec']}s, {report['applicants_per_min']} applicants/min")
+            print(f"db {report['db_statements']} statements ({report['db_statements_per_applicant']}/applicant), {report['db_time_sec']}s in SQL")
+            print(f"db statement kinds {report['db_statement_kinds']}")
+            print(f"{'stage':<32} {'p50':>8} {'p95':>8} {'count':>7}")
+            for name, (p50, p95, count) in report["stages_p50_p95_sec"].items():
+                print(f"{name:<32} {p50:>8} {p95:>8} {count:>7}")
+    finally:
+        if not args.keep:
+            db = SessionLocal()
+            try:
+                cleanup(db, seeded)
+            finally:
+                db.close()
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Benchmark: per-table queries vs single-statement assembly of the company individual report
+(/company/interviews/report/{application_id}).
+Usage:
+  python scripts/bench_individual_report.py [--messages 0 40 200] [--repeat 20] [--application-id <uuid>]
+Uses an existing application (the first one if --application-id is omitted). With --messages N the
+application's transcript is temporarily replaced by N generated messages; every run is rolled back,
+so nothing is persisted. The response cache is bypassed and both paths must return the same response.
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from sqlalchemy import event
+
+from app.database.database import SessionLocal, engine
+import app.models  # noqa: F401 (register all mappers)
+from app.models.application import Application
+from app.models.job_seeker import JobSeeker
+from app.models.job_posting import JobPosting
+from app.models.ai_evaluation import AIEvaluation
+from app.models.ai_interview_message import AIInterviewMessage
+from app.services.interview_service import InterviewService
+from app.services.transcript_writer import InterviewTranscriptWriter
+
+
+def make_conversations(n):
+    """질문/답변이 번갈아 나오는 가짜 면접 대화 n건"""
+    return [
+        {
+            "role": "interviewer" if i % 2 == 0 else "applicant",
+            "message_type": "question" if i % 2 == 0 else "answer",
+            "content": f"{'질문' if i % 2 == 0 else '답변'} {i} " + "내용 " * 40,
+            "turn_number": i + 1,
+        }
+        for i in range(n)
+    ]
+
+
+def build_per_table(db, application_id):
+    """기존 방식: 지원서/지원자/(지원자 user)/공고/최신 평가/대화를 각각 조회"""
+    application = db.query(Application).filter(Application.id == application_id).first()
+    if not application:
+        return {"status": 404, "success": False, "message": "지원서를 찾을 수 없습니다"}
+    job_seeker = db.query(JobSeeker).filter(JobSeeker.id == application.job_seeker_id).first()
+    if not job_seeker:
+        return {"status": 404, "success": False, "message": "지원자를 찾을 수 없습니다"}
+    full_name = job_seeker.full_name
+    if not full_name and getattr(job_seeker, "user", None) and getattr(job_seeker.user, "email", None):
+        full_name = job_seeker.user.email.split("@", 1)[0]
+    job_posting = db.query(JobPosting).filter(JobPosting.id == application.job_posting_id).first()
+    ai_eval_row = (
+        db.query(AIEvaluation)
+        .filter(AIEvaluation.application_id == application.id)
+        .order_by(AIEvaluation.created_at.desc())
+        .first()
+    )
+    messages = (
+        db.query(AIInterviewMessage)
+        .filter(AIInterviewMessage.application_id == application.id)
+        .order_by(AIInterviewMessage.turn_number.asc())
+        .all()
+    )
+    return InterviewService._format_individual_report(
+        application_id=application.id,
+        job_posting_id=application.job_posting_id,
+        job_seeker_id=application.job_seeker_id,
+        full_name=full_name,
+        hard_skills=(job_posting.hard_skills or []) if job_posting else [],
+        soft_skills=(job_posting.soft_skills or []) if job_posting else [],
+        ai_eval_row=ai_eval_row,
+        messages=[
+            {
+                "id": m.id,
+                "sender": m.sender,
+                "message_type": m.message_type,
+                "content": m.content,
+                "turn_number": m.turn_number,
+                "highlight_turns": m.highlight_turns,
+            }
+            for m in messages
+        ],
+    )
+
+
+def build_single_statement(db, application_id):
+    return InterviewService(db)._build_individual_report_by_application(str(application_id))
+
+
+def run(fn, db, application_id, repeat):
+    timings, statements, result = [], [], None
+    for _ in range(repeat):
+        counter = {"n": 0}
+
+        def _count(*_args, **_kwargs):
+            counter["n"] += 1
+
+        # 매 회 ORM identity map을 비워 실제 조회 비용을 측정
+        db.expunge_all()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            start = time.perf_counter()
+            result = fn(db, application_id)
+            timings.append(time.perf_counter() - start)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        statements.append(counter["n"])
+    return statistics.median(timings), max(statements), result
+
+
+def normalized(result):
+    """대화 순서는 turn_number가 같은 메시지끼리 정해지지 않으므로 비교 전에 정렬"""
+    data = dict(result.get("data") or {})
+    if "conversations" in data:
+        data["conversations"] = sorted(data["conversations"], key=lambda m: (m["turn_number"] or 0, m["id"]))
+    return {**result, "data": data}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, nargs="+", default=None, help="replace the transcript with N messages (default: keep the stored one)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--application-id")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        query = db.query(Application.id)
+        if args.application_id:
+            query = query.filter(Application.id == args.application_id)
+        row = query.first()
+    finally:
+        db.close()
+    if not row:
+        print("No application found - create one first or pass --application-id")
+        sys.exit(1)
+    application_id = row.id
+
+    print(f"{'messages':>10} {'path':>16} {'median(ms)':>11} {'statements':>11}")
+    for size in args.messages or [None]:
+        results = {}
+        db = SessionLocal()
+        try:
+            if size is not None:
+                InterviewTranscriptWriter(db).replace(application_id, make_conversations(size))
+                db.flush()
+            for name, fn in (("per-table", build_per_table), ("single-statement", build_single_statement)):
+                elapsed, statements, results[name] = run(fn, db, application_id, args.repeat)
+                label = "stored" if size is None else size
+                print(f"{label:>10} {name:>16} {elapsed * 1000:>11.2f} {statements:>11}")
+        finally:
+            db.rollback()
+            db.close()
+        if normalized(results["per-table"]) != normalized(results["single-statement"]):
+            print("  responses differ!")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
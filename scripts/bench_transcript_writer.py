@@ -0,0 +1,113 @@
+"""
+Benchmark: per-row ORM insert vs bulk InterviewTranscriptWriter for ai_interview_messages.
+Usage:
+  python scripts/bench_transcript_writer.py [--sizes 1000 10000] [--repeat 3] [--application-id <uuid>]
+Uses an existing application (the first one if --application-id is omitted). Every run is rolled back,
+so nothing is persisted.
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from sqlalchemy import event
+
+from app.database.database import SessionLocal, engine
+import app.models  # noqa: F401 (register all mappers)
+from app.models.application import Application
+from app.models.ai_interview_message import AIInterviewMessage
+from app.services.transcript_writer import InterviewTranscriptWriter
+
+
+def make_conversations(n):
+    """질문/답변이 번갈아 나오는 가짜 면접 대화 n건"""
+    conversations = []
+    for i in range(n):
+        is_question = i % 2 == 0
+        conversations.append({
+            "role": "interviewer" if is_question else "applicant",
+            "message_type": "question" if is_question else "answer",
+            "content": f"{'질문' if is_question else '답변'} {i} " + "내용 " * 40,
+            "turn_number": i + 1,
+            "question_number": i // 20 + 1,
+        })
+    return conversations
+
+
+def write_per_row(db, application_id, conversations):
+    """기존 방식: 메시지마다 ORM 객체 생성 후 flush"""
+    db.query(AIInterviewMessage).filter(AIInterviewMessage.application_id == application_id).delete()
+    for conv in conversations:
+        sender_raw = (conv.get('sender') or conv.get('role') or '').lower()
+        if sender_raw in ('interviewer', 'interviewer_ai', 'facilitator', 'reviewer', 'system', 'notice', 'error', 'question'):
+            sender = 'interviewer_ai'
+        else:
+            sender = 'candidate_ai'
+        db.add(AIInterviewMessage(
+            application_id=application_id,
+            sender=sender,
+            message_type=conv.get('message_type') or 'other',
+            content=conv.get('content') or '',
+            turn_number=conv.get('turn_number') or conv.get('question_number') or 0,
+            highlight_turns=conv.get('highlight_turns'),
+        ))
+    db.flush()
+
+
+def write_bulk(db, application_id, conversations):
+    InterviewTranscriptWriter(db).replace(application_id, conversations)
+    db.flush()
+
+
+def run(fn, application_id, conversations, repeat):
+    timings, statements = [], []
+    for _ in range(repeat):
+        counter = {"n": 0}
+
+        def _count(*_args, **_kwargs):
+            counter["n"] += 1
+
+        event.listen(engine, "before_cursor_execute", _count)
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            fn(db, application_id, conversations)
+            timings.append(time.perf_counter() - start)
+        finally:
+            db.rollback()
+            db.close()
+            event.remove(engine, "before_cursor_execute", _count)
+        statements.append(counter["n"])
+    return statistics.median(timings), max(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--application-id")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        query = db.query(Application.id)
+        if args.application_id:
+            query = query.filter(Application.id == args.application_id)
+        row = query.first()
+    finally:
+        db.close()
+    if not row:
+        print("No application found - create one first or pass --application-id")
+        sys.exit(1)
+    application_id = row.id
+
+    print(f"{'messages':>10} {'path':>8} {'median(s)':>10} {'statements':>11} {'msg/s':>10}")
+    for size in args.sizes:
+        conversations = make_conversations(size)
+        for name, fn in (("per-row", write_per_row), ("bulk", write_bulk)):
+            elapsed, statements = run(fn, application_id, conversations, args.repeat)
+            print(f"{size:>10} {name:>8} {elapsed:>10.3f} {statements:>11} {size / elapsed:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""
+Local stand-in for the AI Lambdas used by the evaluation pipeline (no AWS required).
+Usage:
+  python scripts/fake_llm_server.py [--port 9100] [--latency applicant=lognormal:1.5,0.4] [--error-rate 0.02]
+                                    [--throttle-rate 0.01] [--satisfied-ratio 0.6] [--max-concurrency 50]
+Point the backend at it:
+  UPLOAD_URL=http://127.0.0.1:9100/upload
+  APPLICANT_AI_URL=http://127.0.0.1:9100/applicant
+  INTERVIEWER_AI_URL=http://127.0.0.1:9100/interviewer
+  FACILITATOR_AI_URL=http://127.0.0.1:9100/facilitator
+  LAMBDA_QUESTIONS_FUNCTION_URL=http://127.0.0.1:9100/questions
+  LAMBDA_EVALUATION_FUNCTION_URL=http://127.0.0.1:9100/evaluation
+  LAMBDA_KB_INGEST_FUNCTION_URL=http://127.0.0.1:9100/kb-ingest
+  KNOWLEDGE_BASE_ID=fake-kb
+Latency specs (seconds): fixed:<s> | uniform:<lo>,<hi> | lognormal:<median>,<sigma>
+GET /stats returns per-endpoint counters, POST /stats/reset clears them, GET/POST /config reads/updates settings.
+"""
+import argparse
+import asyncio
+import math
+import random
+from collections import defaultdict
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+ENDPOINTS = ("upload", "applicant", "interviewer", "facilitator", "questions", "evaluation", "kb-ingest")
+
+# 기본 지연 (실제 Lambda보다 짧게 - 부하 테스트에서 원하는 값으로 덮어쓰기)
+DEFAULT_LATENCY = {
+    "upload": "lognormal:1.0,0.3",
+    "applicant": "lognormal:1.5,0.4",
+    "interviewer": "lognormal:1.0,0.4",
+    "facilitator": "lognormal:3.0,0.3",
+    "questions": "lognormal:2.0,0.3",
+    "evaluation": "lognormal:3.0,0.3",
+    "kb-ingest": "lognormal:1.0,0.3",
+}
+
+config = {
+    "latency": dict(DEFAULT_LATENCY),
+    "error_rate": 0.0,  # 503 응답 비율
+    "throttle_rate": 0.0,  # 429 응답 비율
+    "satisfied_ratio": 0.6,  # 면접관AI가 만족하는 비율 (나머지는 후속 질문)
+    "max_concurrency": 0,  # 0이면 무제한, 넘으면 429 (Bedrock throttle 흉내)
+}
+stats = defaultdict(lambda: defaultdict(int))
+in_flight = defaultdict(int)
+
+app = FastAPI(title="Fake LLM Lambdas")
+
+
+def sample_latency(spec: str) -> float:
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return random.uniform(values[0], values[1])
+    if kind == "lognormal":
+        median, sigma = values
+        return random.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"unknown latency spec: {spec}")
+
+
+async def simulate(endpoint: str):
+    """지연/오류/throttle 흉내. 오류 응답이면 JSONResponse, 정상이면 None"""
+    stats[endpoint]["requests"] += 1
+    limit = config["max_concurrency"]
+    if limit and sum(in_flight.values()) >= limit:
+        stats[endpoint]["throttled"] += 1
+        return JSONResponse({"message": "Too Many Requests"}, status_code=429)
+    roll = random.random()
+    if roll < config["throttle_rate"]:
+        stats[endpoint]["throttled"] += 1
+        return JSONResponse({"message": "Too Many Requests"}, status_code=429, headers={"Retry-After": "1"})
+    in_flight[endpoint] += 1
+    stats[endpoint]["max_in_flight"] = max(stats[endpoint]["max_in_flight"], in_flight[endpoint])
+    try:
+        await asyncio.sleep(sample_latency(config["latency"].get(endpoint, "fixed:0")))
+    finally:
+        in_flight[endpoint] -= 1
+    if roll < config["throttle_rate"] + config["error_rate"]:
+        stats[endpoint]["errors"] += 1
+        return JSONResponse({"message": "Service Unavailable"}, status_code=503)
+    stats[endpoint]["ok"] += 1
+    return None
+
+
+def fake_evaluation(skills: dict) -> dict:
+    hard = [random.randint(40, 95) for _ in skills.get("hard_skills", [])]
+    soft = [random.randint(40, 95) for _ in skills.get("soft_skills", [])]
+    hard_score = sum(hard) / len(hard) if hard else random.randint(40, 95)
+    soft_score = sum(soft) / len(soft) if soft else random.randint(40, 95)
+    return {
+        "hard_score": round(hard_score, 1),
+        "soft_score": round(soft_score, 1),
+        "total_score": round((hard_score + soft_score) / 2, 1),
+        "ai_summary": "가짜 평가 요약",
+        "hard_detail_scores": dict(zip(skills.get("hard_skills", []), hard)),
+        "soft_detail_scores": dict(zip(skills.get("soft_skills", []), soft)),
+        "strengths_content": "강점", "strengths_opinion": "의견", "strengths_evidence": "근거",
+        "concerns_content": "우려", "concerns_opinion": "의견", "concerns_evidence": "근거",
+        "followup_content": "후속", "followup_opinion": "의견", "followup_evidence": "근거",
+        "final_opinion": "최종 의견",
+        "highlight": "면접 하이라이트",
+        "highlight_reason": "하이라이트 근거",
+    }
+
+
+@app.post("/upload")
+async def upload(request: Request):
+    error = await simulate("upload")
+    if error:
+        return error
+    await request.json()
+    return {"success": True, "conversations": []}
+
+
+@app.post("/kb-ingest")
+async def kb_ingest(request: Request):
+    error = await simulate("kb-ingest")
+    if error:
+        return error
+    await request.json()
+    return {"success": True}
+
+
+@app.post("/applicant")
+async def applicant(request: Request):
+    error = await simulate("applicant")
+    if error:
+        return error
+    body = await request.json()
+    return {"answer": f"'{body.get('question', '')}'에 대한 지원자 답변입니다. " + "경험을 설명합니다. " * 10}
+
+
+@app.post("/interviewer")
+async def interviewer(request: Request):
+    error = await simulate("interviewer")
+    if error:
+        return error
+    await request.json()
+    if random.random() < config["satisfied_ratio"]:
+        stats["interviewer"]["satisfied"] += 1
+        return {"satisfied": True, "reason": "충분한 답변"}
+    stats["interviewer"]["follow_up"] += 1
+    return {"satisfied": False, "follow_up_question": "조금 더 구체적으로 설명해 주세요."}
+
+
+@app.post("/facilitator")
+async def facilitator(request: Request):
+    error = await simulate("facilitator")
+    if error:
+        return error
+    body = await request.json()
+    history = body.get("message_history") or {}
+    messages = [m for turns in history.values() for m in (turns or [])] if isinstance(history, dict) else []
+    return {"success": True, "evaluation": fake_evaluation(body.get("job_postings") or {}), "message_history": messages}
+
+
+@app.post("/questions")
+async def questions(request: Request):
+    error = await simulate("questions")
+    if error:
+        return error
+    await request.json()
+    return {"success": True, "questions": [f"가짜 면접 질문 {i}" for i in range(1, 6)]}
+
+
+@app.post("/evaluation")
+async def evaluation(request: Request):
+    error = await simulate("evaluation")
+    if error:
+        return error
+    body = await request.json()
+    return {"success": True, "evaluation": fake_evaluation(body.get("job_posting_skills") or {}), "conversations": []}
+
+
+@app.get("/stats")
+async def get_stats():
+    return {"config": config, "endpoints": {name: dict(values) for name, values in stats.items()}}
+
+
+@app.post("/stats/reset")
+async def reset_stats():
+    stats.clear()
+    return {"status": "success"}
+
+
+@app.get("/config")
+async def get_config():
+    return config
+
+
+@app.post("/config")
+async def update_config(request: Request):
+    """부분 업데이트 (예: {"error_rate": 0.05, "latency": {"applicant": "fixed:0.2"}})"""
+    body = await request.json()
+    for key, value in body.items():
+        if key == "latency":
+            for endpoint, spec in value.items():
+                sample_latency(spec)
+                config["latency"][endpoint] = spec
+        elif key in config:
+            config[key] = type(config[key])(value)
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", action="append", default=[], metavar="ENDPOINT=SPEC",
+                        help="per-endpoint latency, e.g. applicant=lognormal:1.5,0.4 (ENDPOINT may be 'all')")
+    parser.add_argument("--error-rate", type=float, default=config["error_rate"])
+    parser.add_argument("--throttle-rate", type=float, default=config["throttle_rate"])
+    parser.add_argument("--satisfied-ratio", type=float, default=config["satisfied_ratio"])
+    parser.add_argument("--max-concurrency", type=int, default=config["max_concurrency"])
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    for item in args.latency:
+        endpoint, _, spec = item.partition("=")
+        sample_latency(spec)
+        for name in (ENDPOINTS if endpoint == "all" else (endpoint,)):
+            config["latency"][name] = spec
+    config["error_rate"] = args.error_rate
+    config["throttle_rate"] = args.throttle_rate
+    config["satisfied_ratio"] = args.satisfied_ratio
+    config["max_concurrency"] = args.max_concurrency
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Standalone evaluation worker: claims applicants from the `evaluation_work_items` queue and evaluates them.
+Usage:
+  EVAL_QUEUE_MODE=distributed python scripts/run_evaluation_worker.py [--concurrency 3]
+Run any number of these on any node that can reach the database. The API server enqueues work when
+EVAL_QUEUE_MODE=distributed; items held by a crashed worker are reclaimed after EVAL_QUEUE_LEASE_SECONDS.
+"""
+import argparse
+import asyncio
+import logging
+
+from app.database.database import Base, engine
+import app.models  # noqa: F401 (register all mappers)
+from app.core.http_client import close_http_client
+from app.services.evaluation_queue_worker import EvaluationQueueWorker
+
+
+async def run(concurrency):
+    worker = EvaluationQueueWorker(concurrency=concurrency)
+    try:
+        await worker.run_forever()
+    finally:
+        await close_http_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=None, help="applicants evaluated at once by this worker")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    Base.metadata.create_all(bind=engine)
+    try:
+        asyncio.run(run(args.concurrency))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()